@@ -0,0 +1,242 @@
+"""Atlas de sprites empaquetado + manifiesto, para arrancar con una sola carga de imagen.
+
+Paso de build (desde la raíz del repo, cada vez que cambian los sprites):
+
+    python CODIGO/AssetAtlas.py
+
+Genera `assets/atlas.png` con el tileset, todos los `player/player_*.png` y
+los `enemies/*.png`, y `assets/atlas.json` con el rect de cada sprite, las
+animaciones del jugador ya agrupadas (estado → frames en orden) y
+tamaño/mtime/hash de cada archivo de origen.
+
+En runtime `load_atlas()` carga la imagen una vez, hace un solo
+`convert_alpha` y entrega subsuperficies. Si falta el manifiesto o algún
+origen cambió (atlas desactualizado) devuelve None y cada módulo vuelve a
+cargar sus archivos sueltos como antes.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pygame
+
+from Config import CFG
+
+MANIFEST_VERSION = 1
+ATLAS_IMAGE = "atlas.png"
+ATLAS_MANIFEST = "atlas.json"
+ATLAS_WIDTH = 1024
+
+Rect = Tuple[int, int, int, int]
+
+
+def parse_sprite_name(stem: str, prefix: str = "player_") -> Tuple[str, int] | None:
+    """'player_run_3' → ('run', 3); 'player_idle' → ('idle', 0). None si no sirve."""
+    suffix = stem[len(prefix):]
+    if not stem.startswith(prefix) or not suffix:
+        return None
+    parts = suffix.split("_")
+    frame_index = 0
+    if parts[-1].isdigit():
+        frame_index = int(parts[-1])
+        state_name = "_".join(parts[:-1]) or "idle"
+    else:
+        state_name = "_".join(parts)
+    state_name = state_name.lower().strip()
+    if not state_name:
+        return None
+    return state_name, frame_index
+
+
+def _scan_sources(assets_dir: Path) -> Dict[str, os.stat_result]:
+    """Archivos (relativos a assets/) que entran al atlas, con su stat.
+    Con `os.scandir` y no pathlib/glob: se corre en cada arranque."""
+    found: Dict[str, os.stat_result] = {}
+    try:
+        found["tileset.png"] = os.stat(assets_dir / "tileset.png")
+    except OSError:
+        pass
+    try:
+        with os.scandir(assets_dir / "player") as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("player_") and name.endswith(".png") and entry.is_file():
+                    found[f"player/{name}"] = entry.stat()
+    except OSError:
+        pass
+    try:
+        with os.scandir(assets_dir / "enemies") as entries:
+            for entry in entries:
+                if entry.name.endswith(".png") and entry.is_file():
+                    found[f"enemies/{entry.name}"] = entry.stat()
+    except OSError:
+        pass
+    return found
+
+
+def collect_sources(assets_dir: Path) -> List[str]:
+    """Archivos (relativos a assets/) que entran al atlas, en orden estable."""
+    return sorted(_scan_sources(assets_dir), key=lambda rel: (rel != "tileset.png", rel))
+
+
+def _fingerprint(path: Path) -> list:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns, hashlib.sha1(path.read_bytes()).hexdigest()]
+
+
+def _source_changed(assets_dir: Path, rel: str, st: os.stat_result, recorded: list) -> bool:
+    """Tamaño distinto → cambió; mismo mtime → igual; si no (p.ej. tras un
+    `git clone`, que no conserva mtimes) decide el hash del contenido."""
+    if st.st_size != recorded[0]:
+        return True
+    if st.st_mtime_ns == recorded[1]:
+        return False
+    return hashlib.sha1((assets_dir / rel).read_bytes()).hexdigest() != recorded[2]
+
+
+def _pack(sizes: Dict[str, Tuple[int, int]], width: int) -> Tuple[Dict[str, Rect], Tuple[int, int]]:
+    """Empaquetado por estantes: de más alto a más bajo, de izquierda a derecha."""
+    width = max([width] + [w for w, _ in sizes.values()])
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+    rects: Dict[str, Rect] = {}
+    x = y = shelf_h = 0
+    for name in order:
+        w, h = sizes[name]
+        if x + w > width:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        rects[name] = (x, y, w, h)
+        x += w
+        shelf_h = max(shelf_h, h)
+    used_w = max([x + w for x, _, w, _ in rects.values()], default=1)
+    return rects, (used_w, max(1, y + shelf_h))
+
+
+def build_atlas(assets_dir: Path | None = None) -> dict:
+    """Empaqueta los sprites en `atlas.png` y escribe `atlas.json`; devuelve el manifiesto."""
+    assets_dir = Path(assets_dir or CFG.ASSETS_DIR)
+    images: Dict[str, pygame.Surface] = {}
+    for rel in collect_sources(assets_dir):
+        try:
+            images[rel] = pygame.image.load(str(assets_dir / rel))
+        except pygame.error as exc:
+            print(f"[AssetAtlas] Se ignora '{rel}': {exc}", file=sys.stderr)
+
+    rects, size = _pack({rel: img.get_size() for rel, img in images.items()}, ATLAS_WIDTH)
+    sheet = pygame.Surface(size, pygame.SRCALPHA)
+    for rel, (x, y, _, _) in rects.items():
+        # MAX sobre la hoja transparente copia los píxeles tal cual (alfa incluido)
+        sheet.blit(images[rel], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    grouped: Dict[str, Dict[int, str]] = {}
+    for rel in images:
+        if rel.startswith("player/"):
+            parsed = parse_sprite_name(Path(rel).stem)
+            if parsed is not None:
+                state, frame_index = parsed
+                grouped.setdefault(state, {})[frame_index] = rel
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "image": ATLAS_IMAGE,
+        "size": list(size),
+        # Incluye los que fallaron al cargar: si no, el atlas quedaría siempre "viejo"
+        "sources": {rel: _fingerprint(assets_dir / rel) for rel in collect_sources(assets_dir)},
+        "sprites": {rel: list(rect) for rel, rect in rects.items()},
+        "animations": {
+            "player": {state: [frames[idx] for idx in sorted(frames)] for state, frames in grouped.items()},
+        },
+    }
+    pygame.image.save(sheet, str(assets_dir / ATLAS_IMAGE))
+    with open(assets_dir / ATLAS_MANIFEST, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=1, sort_keys=True)
+    return manifest
+
+
+class AssetAtlas:
+    """Atlas ya cargado: una superficie y subsuperficies por sprite."""
+
+    def __init__(self, surface: pygame.Surface, manifest: dict) -> None:
+        self.surface = surface
+        self.manifest = manifest
+        self._sprites: Dict[str, pygame.Surface] = {}
+
+    def has(self, name: str) -> bool:
+        return name in self.manifest["sprites"]
+
+    def sprite(self, name: str) -> pygame.Surface | None:
+        sub = self._sprites.get(name)
+        if sub is None:
+            rect = self.manifest["sprites"].get(name)
+            if rect is None:
+                return None
+            sub = self._sprites[name] = self.surface.subsurface(pygame.Rect(rect))
+        return sub
+
+    def animations(self, owner: str) -> Dict[str, List[pygame.Surface]]:
+        """Estado → frames en orden (sin los que no estén en el atlas)."""
+        result: Dict[str, List[pygame.Surface]] = {}
+        for state, names in self.manifest["animations"].get(owner, {}).items():
+            frames = [self.sprite(name) for name in names if self.has(name)]
+            if frames:
+                result[state] = frames
+        return result
+
+
+def is_stale(manifest: dict, assets_dir: Path) -> bool:
+    """True si algún origen se agregó, borró o cambió desde el build."""
+    sources = manifest.get("sources", {})
+    current = _scan_sources(assets_dir)
+    if current.keys() != sources.keys():
+        return True
+    try:
+        return any(_source_changed(assets_dir, rel, st, sources[rel]) for rel, st in current.items())
+    except OSError:
+        return True
+
+
+_loaded: Dict[Path, AssetAtlas | None] = {}
+
+
+def load_atlas(assets_dir: Path | None = None) -> AssetAtlas | None:
+    """Atlas de `assets_dir` (cacheado por proceso); None si no hay o está viejo."""
+    assets_dir = Path(assets_dir or CFG.ASSETS_DIR)
+    if assets_dir in _loaded:
+        return _loaded[assets_dir]
+    atlas = None
+    manifest_path = assets_dir / ATLAS_MANIFEST
+    if CFG.USE_ASSET_ATLAS and manifest_path.is_file():
+        try:
+            with open(manifest_path, encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            if manifest.get("version") != MANIFEST_VERSION or is_stale(manifest, assets_dir):
+                print("[AssetAtlas] El atlas está desactualizado → se cargan los archivos sueltos.",
+                      "Para regenerarlo: python CODIGO/AssetAtlas.py")
+            else:
+                image = pygame.image.load(str(assets_dir / manifest["image"])).convert_alpha()
+                atlas = AssetAtlas(image, manifest)
+        except (OSError, ValueError, KeyError, pygame.error) as exc:
+            print(f"[AssetAtlas] No se pudo cargar el atlas ({exc}) → se cargan los archivos sueltos.")
+    _loaded[assets_dir] = atlas
+    return atlas
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Empaqueta los sprites en assets/atlas.png + atlas.json.")
+    parser.add_argument("--assets", default=str(CFG.ASSETS_DIR), help="directorio de assets")
+    args = parser.parse_args(argv)
+    manifest = build_atlas(Path(args.assets))
+    width, height = manifest["size"]
+    states = manifest["animations"]["player"]
+    print(f"{len(manifest['sprites'])} sprites → {ATLAS_IMAGE} {width}×{height}, "
+          f"{len(states)} animaciones del jugador")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
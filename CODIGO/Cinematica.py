@@ -1,5 +1,9 @@
+import time
+
 import pygame
 
+from Resources import RESOURCES
+
 
 class Cinematica:
     """Muestra una pantalla final con efecto de máquina de escribir."""
@@ -22,30 +26,46 @@ class Cinematica:
         "A world built on data can fall in seconds."
     )
 
-    def __init__(self, screen: pygame.Surface, cfg, *, text: str | None = None) -> None:
+    def __init__(self, screen: pygame.Surface, cfg, *, text: str | None = None,
+                 font: pygame.font.Font | None = None) -> None:
         self.screen = screen
         self.cfg = cfg
         self.text = text or self.TEXT
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("Consolas", 22)
+        self.font = font or RESOURCES.default_font(22)
         self.text_color = (255, 0, 0)
         self.bg_color = (0, 0, 0)
         self.chars_per_second = 45
         self.post_text_delay = 2.0
+        # Ritmo del loop cuando el texto ya terminó y sólo se espera una tecla
+        self.idle_fps = 15
+        # Superficies de las líneas ya completas y caracteres ya presentados
+        self._line_surfaces: list[pygame.Surface | None] = []
+        self._shown = 0
+        self.first_present_at: float | None = None   # perf_counter de la primera imagen
+        self.closed = False   # se cerró la ventana durante la intro
 
     def play(self) -> None:
         visible_characters = 0
         accumulator = 0.0
         finished = False
         finished_timer = 0.0
+        self._line_surfaces = []
+        self._shown = 0
+        self._present_all(0)
 
         while True:
-            dt = self.clock.tick(self.cfg.FPS) / 1000.0
+            # Esperando una tecla no hace falta girar a FPS completos
+            dt = self.clock.tick(self.idle_fps if finished else self.cfg.FPS) / 1000.0
+            exposed = False
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.closed = True
                     return
                 if event.type == pygame.KEYDOWN and finished:
                     return
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    exposed = True
 
             if not finished:
                 accumulator += self.chars_per_second * dt
@@ -59,14 +79,55 @@ class Cinematica:
                 if finished_timer >= self.post_text_delay or any(pressed):
                     return
 
-            self._render_text(self.text[:visible_characters])
+            # Sólo se presenta cuando aparece un carácter nuevo
+            if exposed:
+                self._present_all(visible_characters)
+            elif visible_characters != self._shown:
+                self._present_new(visible_characters)
+
+    def _line_y(self, index: int) -> int:
+        return 80 + index * (self.font.get_linesize() + 6)
 
-    def _render_text(self, text: str) -> None:
+    def _line_surface(self, index: int, line: str) -> pygame.Surface:
+        """Las líneas completas se rasterizan una sola vez."""
+        while len(self._line_surfaces) <= index:
+            self._line_surfaces.append(None)
+        if self._line_surfaces[index] is None:
+            self._line_surfaces[index] = self.font.render(line, True, self.text_color)
+        return self._line_surfaces[index]
+
+    def _present_all(self, visible: int) -> None:
+        """Redibujo completo (primer frame o ventana expuesta)."""
         self.screen.fill(self.bg_color)
-        y = 80
-        line_height = self.font.get_linesize() + 6
-        for line in text.splitlines():
-            rendered = self.font.render(line, True, self.text_color)
-            self.screen.blit(rendered, (40, y))
-            y += line_height
+        lines = self.text[:visible].split("\n")
+        for index, line in enumerate(lines[:-1]):
+            self.screen.blit(self._line_surface(index, line), (40, self._line_y(index)))
+        if lines[-1]:
+            self.screen.blit(self.font.render(lines[-1], True, self.text_color),
+                             (40, self._line_y(len(lines) - 1)))
+        self._shown = visible
         pygame.display.flip()
+        if self.first_present_at is None:
+            self.first_present_at = time.perf_counter()
+
+    def _present_new(self, visible: int) -> None:
+        """Completa las líneas que terminaron y reescribe sólo la que se está tipeando."""
+        lines = self.text[:visible].split("\n")
+        first = self.text[:self._shown].count("\n")
+        width = self.screen.get_width()
+        row_h = self.font.get_linesize() + 6
+        dirty = []
+        for index in range(first, len(lines)):
+            row = pygame.Rect(0, self._line_y(index), width, row_h)
+            self.screen.fill(self.bg_color, row)
+            if index < len(lines) - 1:
+                surf = self._line_surface(index, lines[index])
+            elif lines[index]:
+                surf = self.font.render(lines[index], True, self.text_color)
+            else:
+                surf = None
+            if surf is not None:
+                self.screen.blit(surf, (40, row.y))
+            dirty.append(row)
+        self._shown = visible
+        pygame.display.update(dirty)
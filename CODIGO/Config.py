@@ -22,6 +22,7 @@ class Config:
     BASE_DIR: Path = Path(__file__).resolve().parent.parent  # sube un nivel desde CODIGO/
     ASSETS_DIR: Path = BASE_DIR / "assets"
     TILESET_PATH: Path = ASSETS_DIR / "tileset.png"
+    SAVE_PATH: Path = BASE_DIR / "saves" / "run.sav"  # F5 guarda / F9 carga
 
 
     COLOR_BG: Tuple[int,int,int] = (8, 12, 28)
@@ -30,6 +31,47 @@ class Config:
     COLOR_PLAYER: Tuple[int,int,int] = (240, 220, 120)
 
     DEBUG_DRAW_DOOR_TRIGGERS: bool = False
+    # Imprime el tiempo de cada frame de transición entre salas y un resumen al salir
+    DEBUG_PERF: bool = False
+
+    # Ventana del tamaño del mundo con pygame.SCALED (escala SDL/GPU en vez de la CPU)
+    SCALED_DISPLAY: bool = False
+    # Sólo re-escala y presenta los rectángulos que cambiaron (display.update)
+    DIRTY_RECTS: bool = False
+
+    # Prepara la sala vecina (tiles, superficie, encuentro) al acercarse a una puerta
+    PREFETCH_NEIGHBORS: bool = True
+    PREFETCH_DISTANCE: int = 96  # px desde el trigger de la puerta
+    # Salas que quedan materializadas (LRU); el resto se compacta y se reconstruye al volver
+    RESIDENT_ROOMS: int = 12
+
+    # Carga los sprites desde assets/atlas.png + atlas.json (ver AssetAtlas.py)
+    # si existen y están al día; si no, archivo por archivo
+    USE_ASSET_ATLAS: bool = True
+
+    # Superficies derivadas (escaladas/teñidas/recortadas) que guarda Resources (LRU)
+    RESOURCE_DERIVED_CAP: int = 256
+
+    # Partículas (chispas/estallidos): tope duro y cuántas nuevas por frame
+    PARTICLE_CAP: int = 512
+    PARTICLE_EMIT_BUDGET: int = 64
+
+    # Niebla de guerra: sólo se ve lo que está en línea de visión del jugador
+    # (hasta FOG_RADIUS tiles); lo demás queda oscurecido con alfa FOG_ALPHA
+    FOG_OF_WAR: bool = False
+    FOG_RADIUS: int = 10
+    FOG_ALPHA: int = 215
+
+    # Pre-genera en segundo plano la próxima dungeon (tecla N)
+    PREGEN_NEXT_DUNGEON: bool = True
+
+    # Mundo grande: grilla de 256×256 con miles de salas (ver large_world_params)
+    LARGE_WORLD: bool = False
+
+    # Arenas: probabilidad de que una sala normal sea ARENA_SCALE veces más
+    # grande que lo que entra en pantalla (la cámara la recorre con el jugador)
+    ARENA_ROOM_CHANCE: float = 0.0
+    ARENA_SCALE: int = 3
 
     FLOOR: int = 0
     WALL: int = 1  # pared genérica (fallback)
@@ -49,6 +91,8 @@ class Config:
 
     def dungeon_params(self) -> dict:
         """Parámetros por defecto para generar una dungeon."""
+        if self.LARGE_WORLD:
+            return self.large_world_params()
         return {
             "grid_w": 10,
             "grid_h": 10,
@@ -58,6 +102,18 @@ class Config:
             "branch_max": 4,
         }
 
+    def large_world_params(self) -> dict:
+        """Parámetros del modo mundo grande (camino principal de miles de salas)."""
+        return {
+            "grid_w": 256,
+            "grid_h": 256,
+            "main_len": 4000,
+            "branch_chance": 0.45,
+            "branch_min": 2,
+            "branch_max": 4,
+            "escape_fallback": True,
+        }
+
     def asset_path(self, *relative: str | Path) -> Path:
         """Construye rutas absolutas a partir del directorio de assets."""
         return self.ASSETS_DIR.joinpath(*map(Path, relative))
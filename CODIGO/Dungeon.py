@@ -1,21 +1,44 @@
 import random
-import math
-from collections import deque
-from typing import Dict, Tuple, Set
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, Tuple, Set
 from Config import CFG
 from Room import Room
+from DungeonLayout import DungeonLayout, RoomIndex, RoomSpec, DIRS
+from Rng import derive_rng
+
+class RoomRecord:
+    """Lo mínimo para reconstruir una sala desalojada: su estado dinámico y sus RNGs."""
+    __slots__ = ("state", "rng", "ai_rng")
+
+    def __init__(self, room: Room) -> None:
+        self.state = room.get_state()
+        self.rng = room.rng
+        self.ai_rng = room.ai_rng
+
+    def restore(self, room: Room) -> None:
+        room.rng = self.rng
+        room.ai_rng = self.ai_rng
+        room.apply_state(self.state)
+
+    def memory_usage(self) -> int:
+        size = sys.getsizeof(self.state) + sys.getsizeof(self.state["enemies"])
+        size += sum(sys.getsizeof(enemy) for enemy in self.state["enemies"])
+        return size + sys.getsizeof(self.rng) + sys.getsizeof(self.ai_rng)
 
-Vec = Tuple[int, int]
-DIRS: Dict[str, Vec] = {"N": (0, -1), "S": (0, 1), "E": (1, 0), "W": (-1, 0)}
-DIRS_INV: Dict[Vec, str] = {(0, -1): "N", (0, 1): "S", (1, 0): "E", (-1, 0): "W"}
 
 class Dungeon:
     """
-    Generador procedural:
-    - Grilla fija (por defecto 7x7) como límites “mundiales”.
-    - Genera un camino principal conectado desde el centro.
-    - Puede añadir ramas cortas con probabilidad.
-    - Marca rooms explorados y define puertas según adyacencia.
+    Dungeon jugable sobre un `DungeonLayout`:
+    - El layout (posiciones, tamaños, puertas, tipo) se genera completo al crearla.
+    - Cada `Room` (tiles, corredores, spawns) se materializa recién al entrar
+      por primera vez; el resultado es idéntico para la misma seed.
+    - Marca rooms explorados y avisa cada `move` a `move_listeners`.
+    - Sólo las `resident_limit` salas usadas más recientemente quedan
+      materializadas; el resto se compacta a un `RoomRecord` (o se descarta si
+      no cambió) y se reconstruye al volver.
+    - Con `arena_chance` > 0 algunas salas normales salen como arenas más
+      grandes que la pantalla (mismo seed → mismas arenas).
     """
     def __init__(self,
                  grid_w: int = 7,
@@ -24,64 +47,154 @@ class Dungeon:
                  branch_chance: float = 0.45,
                  branch_min: int = 2,
                  branch_max: int = 4,
-                 seed: int | None = None) -> None:
-        if seed is not None:
-            random.seed(seed)
+                 escape_fallback: bool = False,
+                 seed: int | None = None,
+                 layout: DungeonLayout | None = None,
+                 resident_limit: int | None = None,
+                 arena_chance: float | None = None) -> None:
+        """Si se pasa `layout` (p.ej. pre-generado en otro hilo con esa misma
+        `seed`), se usa tal cual y se ignoran los parámetros de grilla."""
         if seed is None:
             seed = random.randrange(0, 10**9)
         self.seed = seed
-        random.seed(self.seed)    
 
-        self.grid_w, self.grid_h = grid_w, grid_h
-        self.i, self.j = grid_w // 2, grid_h // 2  # posición actual (empieza centro)
-        self.start = (self.i, self.j)
-        self.rooms: Dict[Tuple[int, int], Room] = {}
+        # Grafo completo (barato) + salas materializadas bajo demanda.
+        # El layout usa Random(seed) para que las seeds existentes den el mismo mapa.
+        if layout is None:
+            layout = DungeonLayout(
+                grid_w=grid_w,
+                grid_h=grid_h,
+                main_len=main_len,
+                branch_chance=branch_chance,
+                branch_min=branch_min,
+                branch_max=branch_max,
+                rng=random.Random(seed),
+                escape_fallback=escape_fallback,
+            )
+        self.layout = layout
+        # Metadatos por sala (profundidad, dificultad, tipo, vecinos) en O(1)
+        self.index = RoomIndex(layout)
+        # Armas: un flujo por run (spawns e IA se derivan por sala al materializar)
+        self.weapon_rng = derive_rng(seed, "weapons")
+        self.arena_chance = CFG.ARENA_ROOM_CHANCE if arena_chance is None else arena_chance
+
+        self.grid_w, self.grid_h = layout.grid_w, layout.grid_h
+        self.i, self.j = layout.start  # posición actual (empieza centro)
         self.explored: Set[Tuple[int, int]] = set()
-        self.main_path: list[Tuple[int, int]] = []  # <<< NUEVO: orden del camino principal
-        self.depth_map: Dict[Tuple[int, int], int] = {}
-
-
-        # 1) Camino principal
-        self._generate_main_path(length=main_len)
-
-        # 2) Ramas opcionales
-        self._generate_branches(branch_chance, branch_min, branch_max)
-
-        # 3) Definir puertas según vecinos + tallar corredores
-        self._link_neighbors_and_carve()
-
-        # 4) Calcular profundidad (distancia en pasos desde el inicio)
-        self._build_depth_map()
-
-        # <<< NUEVO: ubicar la tienda cerca del inicio del camino principal
-        self._place_shop_room()
-
+        # Salas materializadas, de la usada hace más tiempo a la más reciente
+        self.rooms: "OrderedDict[Tuple[int, int], Room]" = OrderedDict()
+        self.resident_limit = max(1, resident_limit if resident_limit is not None else CFG.RESIDENT_ROOMS)
+        self._compacted: Dict[Tuple[int, int], RoomRecord] = {}
+        self.evictions = 0
+        self.rebuilds = 0
+        # Callbacks (anterior, nueva) llamados por `move`; p.ej. el minimapa
+        self.move_listeners: list[Callable[[Tuple[int, int], Tuple[int, int]], None]] = []
+        # Opcional: callback (pos, room) que restaura estado guardado al materializar
+        self.room_loader: Callable[[Tuple[int, int], Room], None] | None = None
+        self.start = layout.start
+        self.main_path: list[Tuple[int, int]] = layout.main_path
+        self.depth_map: Dict[Tuple[int, int], int] = layout.depth_map
+        if layout.shop_pos is not None:
+            self.shop_pos = layout.shop_pos
 
         # marcar inicial como explorado
         self.explored.add((self.i, self.j))
-        
 
     # ------------------ API usada por Game ------------------ #
     @property
     def current_room(self) -> Room:
-        return self.rooms[(self.i, self.j)]
+        return self.room_at((self.i, self.j))
+
+    def has_room(self, pos: Tuple[int, int]) -> bool:
+        return pos in self.layout.rooms
+
+    def room_type(self, pos: Tuple[int, int]) -> str | None:
+        """Tipo de la sala en `pos` sin materializarla (None si no existe)."""
+        return self.index.type_at(pos)
+
+    def room_difficulty(self, pos: Tuple[int, int]) -> int:
+        """Dificultad de encuentro precalculada para la sala en `pos`."""
+        return self.index.difficulty_at(pos)
+
+    def room_at(self, pos: Tuple[int, int]) -> Room:
+        """Devuelve la sala en `pos`, construyéndola si no está residente."""
+        room = self.rooms.get(pos)
+        if room is not None:
+            self.rooms.move_to_end(pos)
+            return room
+
+        room = self._materialize(pos, self.layout.rooms[pos])
+        record = self._compacted.pop(pos, None)
+        if record is not None:
+            record.restore(room)
+            self.rebuilds += 1
+        elif self.room_loader is not None:
+            self.room_loader(pos, room)
+        self.rooms[pos] = room
+        self._evict_over_limit()
+        return room
+
+    # ------------------ Residencia ------------------ #
+    def _evict_over_limit(self) -> None:
+        current = (self.i, self.j)
+        while len(self.rooms) > self.resident_limit:
+            pos = next((p for p in self.rooms if p != current), None)
+            if pos is None:
+                return
+            room = self.rooms.pop(pos)
+            # Una sala sin cambios se regenera idéntica desde la seed: no hace falta registro
+            if not room.is_pristine():
+                self._compacted[pos] = RoomRecord(room)
+            self.evictions += 1
+
+    def room_states(self) -> Iterator[Tuple[Tuple[int, int], dict]]:
+        """(pos, estado) de cada sala con estado propio, residente o compactada."""
+        for pos, room in self.rooms.items():
+            yield pos, room.get_state()
+        for pos, record in self._compacted.items():
+            yield pos, record.state
+
+    def residency_stats(self) -> dict:
+        """Memoria aproximada por sala (bytes) y contadores de desalojo."""
+        resident = {pos: room.memory_usage() for pos, room in self.rooms.items()}
+        compacted = {pos: record.memory_usage() for pos, record in self._compacted.items()}
+        return {
+            "limit": self.resident_limit,
+            "resident": len(resident),
+            "compacted": len(compacted),
+            "evictions": self.evictions,
+            "rebuilds": self.rebuilds,
+            "resident_bytes": sum(resident.values()),
+            "compacted_bytes": sum(compacted.values()),
+            "per_room": {**compacted, **resident},
+        }
 
     def can_move(self, direction: str) -> bool:
         di, dj = DIRS[direction]
         ni, nj = self.i + di, self.j + dj
-        return (ni, nj) in self.rooms
+        return (ni, nj) in self.layout.rooms
+
+    def neighbor(self, direction: str) -> Tuple[int, int] | None:
+        """Posición de la sala vecina en esa dirección (None si no hay)."""
+        di, dj = DIRS[direction]
+        pos = (self.i + di, self.j + dj)
+        return pos if pos in self.layout.rooms else None
 
     def move(self, direction: str) -> None:
         di, dj = DIRS[direction]
         ni, nj = self.i + di, self.j + dj
-        if (ni, nj) in self.rooms:
+        if (ni, nj) in self.layout.rooms:
+            prev = (self.i, self.j)
             self.i, self.j = ni, nj
             self.explored.add((self.i, self.j))
+            for listener in self.move_listeners:
+                listener(prev, (ni, nj))
     def room_depth(self, pos: Tuple[int, int] | None = None) -> int:
         """Devuelve la profundidad (pasos desde el inicio) para la sala dada."""
         if pos is None:
             pos = (self.i, self.j)
-        return self.depth_map.get(pos, 0)
+        idx = self.index.slot.get(pos)
+        return self.index.depth[idx] if idx is not None else 0
 
     def entry_position(self, came_from: str, pw: int, ph: int) -> tuple[float, float]:
         # reutiliza tu lógica actual (Dungeon no necesita cambiarla)
@@ -99,186 +212,36 @@ class Dungeon:
             return float(rx * ts + 2 + margin), float(cy_px - ph//2)
         return float((rx + rw) * ts - pw - 2 - margin), float(cy_px - ph//2)
 
-    # ------------------ Procedural interno ------------------ #
-    def _in_bounds(self, x: int, y: int) -> bool:
-        return 0 <= x < self.grid_w and 0 <= y < self.grid_h
-
-    def _neighbors(self, x: int, y: int) -> list[Vec]:
-        return [(x+dx, y+dy) for dx,dy in DIRS.values() if self._in_bounds(x+dx, y+dy)]
-
-    def _place_room(self, x: int, y: int) -> None:
-        if (x, y) not in self.rooms:
-            r = Room()
-            # Tamaños aleatorios dentro del rango, ajustados al múltiplo de sprite
-            def aligned_choices(min_size: int, max_size: int) -> list[int]:
-                alignment = CFG.SPRITE_SIZE
-                tile = CFG.TILE_SIZE
-                factor = alignment // math.gcd(alignment, tile)
-                choices = [value for value in range(min_size, max_size + 1) if value % factor == 0]
-                return choices if choices else list(range(min_size, max_size + 1))
-
-            width_choices = aligned_choices(CFG.ROOM_W_MIN, CFG.ROOM_W_MAX)
-            height_choices = aligned_choices(CFG.ROOM_H_MIN, CFG.ROOM_H_MAX)
-
-            rw = random.choice(width_choices)
-            rh = random.choice(height_choices)
-
-            r.build_centered(rw, rh)
-
-            # Puertas se setean luego cuando enlaces vecinos (si ya lo haces)
-            self.rooms[(x, y)] = r
-
-    def _generate_main_path(self, length: int) -> None:
-        x, y = self.i, self.j
-        self._place_room(x, y)
-
-        # <<< NUEVO: registra el inicio
-        self.main_path.clear()
-        self.main_path.append((x, y))
-
-        last_dir: Vec | None = None
-
-        for _ in range(max(1, length)):
-            # Evitar retroceder inmediatamente para caminos más “limpios”
-            choices = [d for d in DIRS.values() if last_dir is None or (d[0], d[1]) != (-last_dir[0], -last_dir[1])]
-            random.shuffle(choices)
-            moved = False
-            for dx, dy in choices:
-                nx, ny = x + dx, y + dy
-                if not self._in_bounds(nx, ny):
-                    continue
-                # Evita “amontonarse”: no pises si ya hay 2+ vecinos ocupados (reduce cruces)
-                occ_neighbors = sum((n in self.rooms) for n in self._neighbors(nx, ny))
-                if occ_neighbors >= 3:
-                    continue
-                # Acepta
-                x, y = nx, ny
-                self._place_room(x, y)
-                last_dir = (dx, dy)
-                moved = True
-
-                # <<< NUEVO: registra el paso aceptado
-                self.main_path.append((x, y))
-                break
-
-            if not moved:
-                # si no pudimos movernos por restricciones, relaja y prueba cualquier vecino válido
-                for dx, dy in DIRS.values():
-                    nx, ny = x + dx, y + dy
-                    if self._in_bounds(nx, ny):
-                        x, y = nx, ny
-                        self._place_room(x, y)
-                        last_dir = (dx, dy)
-
-                        # <<< NUEVO: registra este fallback
-                        self.main_path.append((x, y))
-                        break
-
-    def _generate_branches(self, chance: float, min_len: int, max_len: int) -> None:
-        # para cada room del camino, hay probabilidad de crear una ramita corta
-        anchors = list(self.rooms.keys())
-        random.shuffle(anchors)
-        for ax, ay in anchors:
-            if random.random() > chance:
-                continue
-            length = random.randint(min_len, max_len)
-            x, y = ax, ay
-            last_dir: Vec | None = None
-            for _ in range(length):
-                # preferir direcciones que se alejen del ancla para “ramificarse”
-                dirs = list(DIRS.values())
-                random.shuffle(dirs)
-                moved = False
-                for dx, dy in dirs:
-                    if last_dir and (dx, dy) == (-last_dir[0], -last_dir[1]):
-                        continue
-                    nx, ny = x + dx, y + dy
-                    if not self._in_bounds(nx, ny):
-                        continue
-                    if (nx, ny) in self.rooms:
-                        # si ya existe, corta la rama aquí para evitar bucles grandes
-                        moved = False
-                        break
-                    # control suave de densidad
-                    occ_neighbors = sum((n in self.rooms) for n in self._neighbors(nx, ny))
-                    if occ_neighbors >= 3:
-                        continue
-                    self._place_room(nx, ny)
-                    x, y = nx, ny
-                    last_dir = (dx, dy)
-                    moved = True
-                    break
-                if not moved:
-                    break  # rama termina si no encuentra expansión segura
-
-    def _link_neighbors_and_carve(self) -> None:
-        # Define puertas según adyacencia real y talla corredores cortos
-        for (x, y), room in self.rooms.items():
-            # Puertas según vecinos existentes
-            room.doors["N"] = (x, y-1) in self.rooms
-            room.doors["S"] = (x, y+1) in self.rooms
-            room.doors["W"] = (x-1, y) in self.rooms
-            room.doors["E"] = (x+1, y) in self.rooms
-            # Corredores visuales
-            room.carve_corridors(width_tiles=2, length_tiles=3)
-            
-    def _build_depth_map(self) -> None:
-        """BFS desde la sala inicial para asignar una profundidad a cada habitación."""
-        self.depth_map = {}
-        start = self.start
-        if start not in self.rooms:
-            return
-
-        queue = deque([(start, 0)])
-        visited: Set[Tuple[int, int]] = {start}
-
-        while queue:
-            (x, y), depth = queue.popleft()
-            self.depth_map[(x, y)] = depth
-            for dx, dy in DIRS.values():
-                nx, ny = x + dx, y + dy
-                if (nx, ny) in self.rooms and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), depth + 1))        
-    def _place_shop_room(self) -> None:
-        """
-        Marca como 'shop' la sala ubicada aproximadamente a mitad del camino principal.
-        Guarda también la posición en self.shop_pos para fácil acceso desde Game/Minimap.
-        """
-        if not self.main_path:
-            return
-
-        # Selecciona un punto del camino principal que no sea el inicio.
-        # Usa el orden del camino para mantener una ubicación consistente
-        # pero evita repetidos (puede haber retrocesos en la generación).
-        unique_path: list[tuple[int, int]] = []
-        seen: set[tuple[int, int]] = set()
-        for step in self.main_path:
-            if step == self.start:
-                continue
-            if step in seen:
-                continue
-            seen.add(step)
-            unique_path.append(step)
-
-        # Si el camino sólo tiene el inicio (poco probable), cae a cualquier otra sala.
-        if not unique_path:
-            candidates = [pos for pos in self.rooms.keys() if pos != self.start]
-            if not candidates:
-                return
-            sx, sy = random.choice(candidates)
-        else:
-            quarter_idx = max(0, len(unique_path) // 4)
-            sx, sy = unique_path[quarter_idx]
-
-        room = self.rooms.get((sx, sy))
-        if not room:
-            return
-
-        # Marca de tipo (no rompe si Room no define 'type')
-        setattr(room, "type", "shop")     # <<< etiqueta directa en Room
-        self.shop_pos = (sx, sy)          # <<< guarda la coordenada para otras clases
-    # Dungeon.py (añade estos métodos)
+    # ------------------ Materialización ------------------ #
+    def _materialize(self, pos: Tuple[int, int], spec: RoomSpec) -> Room:
+        """Construye tiles y corredores de una sala a partir de su spec."""
+        rw, rh = spec.size
+        map_w, map_h = self._arena_map_size(pos, spec)
+        room = Room(map_w, map_h)
+        if map_w is not None:
+            rw, rh = rw * CFG.ARENA_SCALE, rh * CFG.ARENA_SCALE
+        room.rng = derive_rng(self.seed, "spawns", *pos)
+        room.ai_rng = derive_rng(self.seed, "ai", *pos)
+        room.build_centered(rw, rh)
+        room.doors.update(spec.doors)
+        room.carve_corridors(width_tiles=2, length_tiles=3)
+        room.type = spec.type
+        return room
+
+    def _arena_map_size(self, pos: Tuple[int, int], spec: RoomSpec) -> Tuple[int | None, int | None]:
+        """Mapa (en tiles) de la sala si es arena; (None, None) = pantalla normal.
+        Sale de un flujo propio de la seed, así no cambia el resto de la run."""
+        if self.arena_chance <= 0.0 or spec.type != "normal" or pos == self.start:
+            return None, None
+        if derive_rng(self.seed, "arena", *pos).random() >= self.arena_chance:
+            return None, None
+        # Mismo margen que tiene la sala más grande en pantalla (corredores + paredes)
+        scale = CFG.ARENA_SCALE
+        rw, rh = spec.size
+        margin_w = CFG.MAP_W - CFG.ROOM_W_MAX
+        margin_h = CFG.MAP_H - CFG.ROOM_H_MAX
+        return (max(CFG.MAP_W, rw * scale + margin_w),
+                max(CFG.MAP_H, rh * scale + margin_h))
 
     def move_and_enter(self, direction: str, player, cfg, ShopkeeperCls=None) -> bool:
         """
@@ -296,7 +259,7 @@ class Dungeon:
         # mover
         self.move(direction)
 
-        # hook de entrada
+        # hook de entrada (la sala se materializa aquí la primera vez)
         new_room = self.current_room
         if hasattr(new_room, "on_enter"):
             new_room.on_enter(player, cfg, ShopkeeperCls=ShopkeeperCls)
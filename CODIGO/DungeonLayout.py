@@ -0,0 +1,387 @@
+"""Grafo liviano de la dungeon: posiciones, tamaños, puertas y tipo de cada sala.
+
+No depende de pygame ni construye grillas de tiles; `Dungeon` materializa
+cada `Room` a partir de su `RoomSpec` recién cuando se necesita.
+"""
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from Config import CFG
+
+Vec = Tuple[int, int]
+DIRS: Dict[str, Vec] = {"N": (0, -1), "S": (0, 1), "E": (1, 0), "W": (-1, 0)}
+DIRS_INV: Dict[Vec, str] = {(0, -1): "N", (0, 1): "S", (1, 0): "E", (-1, 0): "W"}
+ROOM_TYPES: Tuple[str, ...] = ("normal", "shop")
+DOOR_BITS: Tuple[str, ...] = ("N", "S", "E", "W")
+
+
+@dataclass
+class RoomSpec:
+    """Lo mínimo para reconstruir una sala: tamaño en tiles, puertas y tipo."""
+    size: Tuple[int, int]
+    doors: Dict[str, bool] = field(
+        default_factory=lambda: {"N": False, "S": False, "E": False, "W": False}
+    )
+    type: str = "normal"
+
+
+def _aligned_choices(min_size: int, max_size: int) -> list[int]:
+    """Tamaños válidos dentro del rango, ajustados al múltiplo de sprite."""
+    alignment = CFG.SPRITE_SIZE
+    tile = CFG.TILE_SIZE
+    factor = alignment // math.gcd(alignment, tile)
+    choices = [value for value in range(min_size, max_size + 1) if value % factor == 0]
+    return choices if choices else list(range(min_size, max_size + 1))
+
+
+class DungeonLayout:
+    """
+    Generador procedural del grafo de salas:
+    - Genera un camino principal conectado desde el centro.
+    - Puede añadir ramas cortas con probabilidad.
+    - Define puertas según adyacencia, profundidad y sala de tienda.
+
+    `rng` es cualquier objeto con la API de `random` (por defecto el módulo global).
+    La ocupación se lleva en una grilla empaquetada (conteo de vecinos O(1) y
+    profundidad incremental), así escala a mundos grandes (256×256).
+    """
+
+    def __init__(self,
+                 grid_w: int = 7,
+                 grid_h: int = 7,
+                 main_len: int = 8,
+                 branch_chance: float = 0.45,
+                 branch_min: int = 2,
+                 branch_max: int = 4,
+                 rng=None,
+                 escape_fallback: bool = False) -> None:
+        self._rng = rng if rng is not None else random
+        self.grid_w, self.grid_h = grid_w, grid_h
+        self.start: Vec = (grid_w // 2, grid_h // 2)
+        self.rooms: Dict[Vec, RoomSpec] = {}
+        self.main_path: list[Vec] = []
+        self.depth_map: Dict[Vec, int] = {}
+        self.shop_pos: Vec | None = None
+        # Pasos del camino principal que cayeron en el fallback “cualquier vecino”
+        self.fallback_steps = 0
+        # Si el camino se encierra, salir hacia el vecino menos poblado en vez
+        # del primero válido (evita que los caminos largos queden rebotando)
+        self._escape_fallback = escape_fallback
+
+        # Grilla empaquetada con un borde de 1 celda (nunca ocupado), así los
+        # vecinos de cualquier celda válida son siempre idx±1 e idx±stride.
+        self._stride = grid_w + 2
+        cells = self._stride * (grid_h + 2)
+        self._occ = bytearray(cells)        # 1 si hay sala
+        self._ncount = bytearray(cells)     # vecinos ocupados (0..4)
+        self._depth = array("i", [-1]) * cells  # profundidad BFS, mantenida al colocar
+
+        self._width_choices = _aligned_choices(CFG.ROOM_W_MIN, CFG.ROOM_W_MAX)
+        self._height_choices = _aligned_choices(CFG.ROOM_H_MIN, CFG.ROOM_H_MAX)
+
+        # 1) Camino principal
+        self._generate_main_path(length=main_len)
+        # 2) Ramas opcionales
+        self._generate_branches(branch_chance, branch_min, branch_max)
+        # 3) Puertas según vecinos
+        self._link_neighbors()
+        # 4) Profundidad (distancia en pasos desde el inicio)
+        self._build_depth_map()
+        # 5) Tienda cerca del inicio del camino principal
+        self._place_shop_room()
+
+    @classmethod
+    def from_parts(cls,
+                   grid_w: int,
+                   grid_h: int,
+                   start: Vec,
+                   rooms: Dict[Vec, RoomSpec],
+                   main_path: list[Vec],
+                   depth_map: Dict[Vec, int]) -> "DungeonLayout":
+        """Arma un layout ya generado (p.ej. leído de un guardado) sin re-generar."""
+        layout = cls.__new__(cls)
+        layout._rng = random
+        layout.grid_w, layout.grid_h = grid_w, grid_h
+        layout.start = start
+        layout.rooms = rooms
+        layout.main_path = main_path
+        layout.depth_map = depth_map
+        layout.fallback_steps = 0
+        layout.shop_pos = next((pos for pos, spec in rooms.items() if spec.type == "shop"), None)
+        return layout
+
+    # ------------------ Procedural interno ------------------ #
+    def _place_room(self, x: int, y: int) -> None:
+        idx = (y + 1) * self._stride + (x + 1)
+        if self._occ[idx]:
+            return
+        rw = self._rng.choice(self._width_choices)
+        rh = self._rng.choice(self._height_choices)
+        self.rooms[(x, y)] = RoomSpec(size=(rw, rh))
+
+        occ, ncount, depth = self._occ, self._ncount, self._depth
+        stride = self._stride
+        occ[idx] = 1
+        best = -1
+        linked = 0
+        for n in (idx - stride, idx + stride, idx + 1, idx - 1):
+            ncount[n] += 1
+            if occ[n]:
+                linked += 1
+                if best < 0 or depth[n] < best:
+                    best = depth[n]
+        depth[idx] = best + 1 if best >= 0 else 0
+        if linked < 2:
+            return  # hoja: no puede acortar el camino de nadie
+        # Cierra un ciclo: relaja hacia afuera sólo lo que mejora
+        pending = deque((idx,))
+        while pending:
+            cur = pending.popleft()
+            d = depth[cur] + 1
+            for n in (cur - stride, cur + stride, cur + 1, cur - 1):
+                if occ[n] and depth[n] > d:
+                    depth[n] = d
+                    pending.append(n)
+
+    def _generate_main_path(self, length: int) -> None:
+        x, y = self.start
+        self._place_room(x, y)
+
+        self.main_path.clear()
+        self.main_path.append((x, y))
+
+        last_dir: Vec | None = None
+        stride, ncount = self._stride, self._ncount
+        gw, gh = self.grid_w, self.grid_h
+        dirs = list(DIRS.values())
+
+        for _ in range(max(1, length)):
+            # Evitar retroceder inmediatamente para caminos más “limpios”
+            choices = [d for d in dirs if last_dir is None or (d[0], d[1]) != (-last_dir[0], -last_dir[1])]
+            self._rng.shuffle(choices)
+            moved = False
+            for dx, dy in choices:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < gw and 0 <= ny < gh):
+                    continue
+                # Evita “amontonarse”: no pises si ya hay 3+ vecinos ocupados (reduce cruces)
+                if ncount[(ny + 1) * stride + (nx + 1)] >= 3:
+                    continue
+                x, y = nx, ny
+                self._place_room(x, y)
+                last_dir = (dx, dy)
+                moved = True
+                self.main_path.append((x, y))
+                break
+
+            if not moved and self._escape_fallback:
+                occ = self._occ
+                candidates = (choices + [(-last_dir[0], -last_dir[1])]) if last_dir else choices
+                best_key = None
+                for dx, dy in candidates:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < gw and 0 <= ny < gh:
+                        idx = (ny + 1) * stride + (nx + 1)
+                        key = (occ[idx], ncount[idx])
+                        if best_key is None or key < best_key:
+                            best_key, best = key, (dx, dy)
+                if best_key is not None:
+                    dx, dy = best
+                    x, y = x + dx, y + dy
+                    self._place_room(x, y)
+                    last_dir = (dx, dy)
+                    self.main_path.append((x, y))
+                    self.fallback_steps += 1
+            elif not moved:
+                # si no pudimos movernos por restricciones, relaja y prueba cualquier vecino válido
+                for dx, dy in dirs:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < gw and 0 <= ny < gh:
+                        x, y = nx, ny
+                        self._place_room(x, y)
+                        last_dir = (dx, dy)
+                        self.main_path.append((x, y))
+                        self.fallback_steps += 1
+                        break
+
+    def _generate_branches(self, chance: float, min_len: int, max_len: int) -> None:
+        # para cada room del camino, hay probabilidad de crear una ramita corta
+        anchors = list(self.rooms.keys())
+        self._rng.shuffle(anchors)
+        stride, occ, ncount = self._stride, self._occ, self._ncount
+        gw, gh = self.grid_w, self.grid_h
+        all_dirs = list(DIRS.values())
+        for ax, ay in anchors:
+            if self._rng.random() > chance:
+                continue
+            length = self._rng.randint(min_len, max_len)
+            x, y = ax, ay
+            last_dir: Vec | None = None
+            for _ in range(length):
+                # preferir direcciones que se alejen del ancla para “ramificarse”
+                dirs = all_dirs[:]
+                self._rng.shuffle(dirs)
+                moved = False
+                for dx, dy in dirs:
+                    if last_dir and (dx, dy) == (-last_dir[0], -last_dir[1]):
+                        continue
+                    nx, ny = x + dx, y + dy
+                    if not (0 <= nx < gw and 0 <= ny < gh):
+                        continue
+                    idx = (ny + 1) * stride + (nx + 1)
+                    if occ[idx]:
+                        # si ya existe, corta la rama aquí para evitar bucles grandes
+                        moved = False
+                        break
+                    # control suave de densidad
+                    if ncount[idx] >= 3:
+                        continue
+                    self._place_room(nx, ny)
+                    x, y = nx, ny
+                    last_dir = (dx, dy)
+                    moved = True
+                    break
+                if not moved:
+                    break  # rama termina si no encuentra expansión segura
+
+    def _link_neighbors(self) -> None:
+        """Define puertas según adyacencia real."""
+        occ, stride = self._occ, self._stride
+        for (x, y), spec in self.rooms.items():
+            idx = (y + 1) * stride + (x + 1)
+            doors = spec.doors
+            doors["N"] = occ[idx - stride] == 1
+            doors["S"] = occ[idx + stride] == 1
+            doors["W"] = occ[idx - 1] == 1
+            doors["E"] = occ[idx + 1] == 1
+
+    def _build_depth_map(self) -> None:
+        """Vuelca las profundidades (distancia BFS desde el inicio) que se mantuvieron al colocar salas."""
+        depth, stride = self._depth, self._stride
+        self.depth_map = {
+            (x, y): depth[(y + 1) * stride + (x + 1)] for (x, y) in self.rooms
+        }
+
+    def _place_shop_room(self) -> None:
+        """
+        Marca como 'shop' la sala ubicada aproximadamente a un cuarto del camino principal.
+        Guarda también la posición en self.shop_pos.
+        """
+        if not self.main_path:
+            return
+
+        # Usa el orden del camino para mantener una ubicación consistente
+        # pero evita repetidos (puede haber retrocesos en la generación).
+        unique_path: list[Vec] = []
+        seen: set[Vec] = set()
+        for step in self.main_path:
+            if step == self.start:
+                continue
+            if step in seen:
+                continue
+            seen.add(step)
+            unique_path.append(step)
+
+        # Si el camino sólo tiene el inicio (poco probable), cae a cualquier otra sala.
+        if not unique_path:
+            candidates = [pos for pos in self.rooms.keys() if pos != self.start]
+            if not candidates:
+                return
+            sx, sy = self._rng.choice(candidates)
+        else:
+            quarter_idx = max(0, len(unique_path) // 4)
+            sx, sy = unique_path[quarter_idx]
+
+        spec = self.rooms.get((sx, sy))
+        if not spec:
+            return
+        spec.type = "shop"
+        self.shop_pos = (sx, sy)
+
+
+class RoomIndex:
+    """
+    Metadatos por sala calculados una vez sobre un layout, en arrays compactos
+    indexados por número de sala (el orden de `layout.rooms`):
+    profundidad, factor de ramificación, pertenencia al camino principal,
+    dificultad, código de tipo y máscara de vecinos (bits en orden `DOOR_BITS`).
+    """
+
+    def __init__(self, layout: DungeonLayout) -> None:
+        self.positions: list[Vec] = list(layout.rooms)
+        self.slot: Dict[Vec, int] = {pos: idx for idx, pos in enumerate(self.positions)}
+        n = len(self.positions)
+        self.depth = array("H", bytes(2 * n))
+        self.branch = array("B", bytes(n))
+        self.main_path = array("B", bytes(n))
+        self.difficulty = array("H", bytes(2 * n))
+        self.type_code = array("B", bytes(n))
+        self.neighbors = array("B", bytes(n))
+
+        on_main = set(layout.main_path)
+        depth_map = layout.depth_map
+        for idx, pos in enumerate(self.positions):
+            spec = layout.rooms[pos]
+            mask = 0
+            for bit, d in enumerate(DOOR_BITS):
+                if spec.doors.get(d):
+                    mask |= 1 << bit
+            depth = depth_map.get(pos, 0)
+            branch = max(0, bin(mask).count("1") - 2)
+            main = 1 if pos in on_main else 0
+            self.depth[idx] = depth
+            self.branch[idx] = branch
+            self.main_path[idx] = main
+            self.difficulty[idx] = 1 + depth + branch + (depth // 3) + main
+            self.type_code[idx] = ROOM_TYPES.index(spec.type)
+            self.neighbors[idx] = mask
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, pos: Vec) -> bool:
+        return pos in self.slot
+
+    def difficulty_at(self, pos: Vec) -> int:
+        return self.difficulty[self.slot[pos]]
+
+    def depth_at(self, pos: Vec) -> int:
+        return self.depth[self.slot[pos]]
+
+    def type_at(self, pos: Vec) -> str | None:
+        idx = self.slot.get(pos)
+        return ROOM_TYPES[self.type_code[idx]] if idx is not None else None
+
+    def neighbors_of(self, pos: Vec) -> list[Vec]:
+        mask = self.neighbors[self.slot[pos]]
+        x, y = pos
+        return [(x + DIRS[d][0], y + DIRS[d][1]) for bit, d in enumerate(DOOR_BITS) if mask & (1 << bit)]
+
+    def select(self,
+               *,
+               type: str | None = None,
+               main_path: bool | None = None,
+               min_depth: int = 0,
+               max_depth: int | None = None,
+               min_difficulty: int = 0) -> list[Vec]:
+        """Posiciones que cumplen todos los filtros dados (para análisis / eventos)."""
+        code = ROOM_TYPES.index(type) if type is not None else None
+        out: list[Vec] = []
+        for idx, pos in enumerate(self.positions):
+            depth = self.depth[idx]
+            if depth < min_depth or (max_depth is not None and depth > max_depth):
+                continue
+            if code is not None and self.type_code[idx] != code:
+                continue
+            if main_path is not None and bool(self.main_path[idx]) != main_path:
+                continue
+            if self.difficulty[idx] < min_difficulty:
+                continue
+            out.append(pos)
+        return out
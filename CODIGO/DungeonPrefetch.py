@@ -0,0 +1,51 @@
+"""Pre-generación en segundo plano del layout de la próxima dungeon."""
+from __future__ import annotations
+
+import queue
+import random
+import threading
+
+from DungeonLayout import DungeonLayout
+
+
+class DungeonPrefetcher:
+    """
+    Mantiene listo en un hilo el layout de la próxima run con seed aleatoria,
+    para que `Game.start_new_run(seed=None)` sólo tenga que tomarlo.
+
+    La generación usa un `random.Random(seed)` propio, así que no interfiere
+    con el RNG global del hilo principal y produce el mismo layout que
+    `Dungeon(seed=seed)`.
+    """
+
+    def __init__(self, params: dict) -> None:
+        self.params = dict(params)
+        self._ready: queue.Queue[tuple[int, DungeonLayout]] = queue.Queue(maxsize=1)
+        self._seed_rng = random.Random()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="dungeon-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            seed = self._seed_rng.randrange(0, 10**9)
+            layout = DungeonLayout(**self.params, rng=random.Random(seed))
+            # Espera a que consuman el anterior (revisando cada tanto si hay que parar)
+            while not self._stop.is_set():
+                try:
+                    self._ready.put((seed, layout), timeout=0.25)
+                    break
+                except queue.Full:
+                    continue
+
+    def take(self) -> tuple[int, DungeonLayout] | None:
+        """Devuelve (seed, layout) si ya hay uno listo; None si todavía no."""
+        try:
+            return self._ready.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self._stop.set()
@@ -0,0 +1,229 @@
+"""Generación masiva de layouts y estadísticas por seed (sin pygame).
+
+Uso típico, desde la raíz del repo:
+
+    python CODIGO/DungeonStats.py --seeds 0:1000000 --out stats.jsonl
+    python CODIGO/DungeonStats.py --seeds 0:50000 --set main_len=8,12,16 --format csv
+    python CODIGO/DungeonStats.py --seeds 0:200000 --only-degenerate
+
+Cada fila describe un layout: cantidad de salas, largo del camino principal,
+ramas, profundidad de la tienda, histograma de profundidades y los pasos que
+cayeron en el fallback de `_generate_main_path` (layouts degenerados).
+También lleva los valores de `--set` con que se generó: en JSONL como el
+objeto `overrides`, en CSV como una columna por clave.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Iterable, Iterator, List, Tuple
+
+from Config import CFG
+from DungeonLayout import DIRS, DungeonLayout
+
+Vec = Tuple[int, int]
+
+CSV_FIELDS = [
+    "seed", "params", "rooms", "main_path_len", "main_path_unique",
+    "fallback_steps", "branch_count", "branch_rooms", "shop_depth",
+    "max_depth", "depth_hist", "degenerate",
+]
+
+
+def layout_stats(layout: DungeonLayout) -> dict:
+    """Resume un layout ya generado en un dict plano."""
+    rooms = layout.rooms
+    main_set = set(layout.main_path)
+
+    # Ramas = componentes conexas de salas fuera del camino principal
+    off_main = [pos for pos in rooms if pos not in main_set]
+    pending = set(off_main)
+    branch_count = 0
+    for pos in off_main:
+        if pos not in pending:
+            continue
+        branch_count += 1
+        pending.discard(pos)
+        stack = [pos]
+        while stack:
+            x, y = stack.pop()
+            for dx, dy in DIRS.values():
+                n = (x + dx, y + dy)
+                if n in pending:
+                    pending.discard(n)
+                    stack.append(n)
+
+    max_depth = max(layout.depth_map.values(), default=0)
+    hist = [0] * (max_depth + 1)
+    for depth in layout.depth_map.values():
+        hist[depth] += 1
+
+    shop = layout.shop_pos
+    return {
+        "rooms": len(rooms),
+        # El primer elemento es la sala inicial: el largo cuenta pasos, no salas
+        "main_path_len": len(layout.main_path) - 1,
+        "main_path_unique": len(main_set) - 1,
+        "fallback_steps": layout.fallback_steps,
+        "branch_count": branch_count,
+        "branch_rooms": len(off_main),
+        "shop_depth": layout.depth_map.get(shop, -1) if shop is not None else -1,
+        "max_depth": max_depth,
+        "depth_hist": hist,
+    }
+
+
+def is_degenerate(stats: dict) -> bool:
+    """Layouts que usaron el fallback o cuyo camino principal se pisa a sí mismo."""
+    return (stats["fallback_steps"] > 0
+            or stats["main_path_unique"] < stats["main_path_len"]
+            or stats["shop_depth"] < 0)
+
+
+def _run_chunk(job: Tuple[int, dict, dict, int, int]) -> List[dict]:
+    """Trabajo de un proceso: genera [start, stop) con un set de parámetros."""
+    params_id, params, overrides, start, stop = job
+    rows: List[dict] = []
+    for seed in range(start, stop):
+        # Mismo RNG que usa Dungeon(seed=...) para generar el layout
+        layout = DungeonLayout(**params, rng=random.Random(seed))
+        stats = layout_stats(layout)
+        stats["seed"] = seed
+        stats["params"] = params_id
+        stats["overrides"] = overrides
+        stats["degenerate"] = is_degenerate(stats)
+        rows.append(stats)
+    return rows
+
+
+def _parse_value(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _parse_seeds(text: str) -> range:
+    """'A:B' → range(A, B); 'N' → range(0, N)."""
+    if ":" in text:
+        a, b = text.split(":", 1)
+        return range(int(a or 0), int(b))
+    return range(int(text))
+
+
+def _param_sets(overrides: Iterable[str], large: bool = False) -> List[Tuple[dict, dict]]:
+    """Producto cartesiano de los `--set clave=v1,v2` sobre `CFG.dungeon_params()`:
+    (parámetros completos, sólo los valores sobreescritos) por combinación."""
+    base = CFG.large_world_params() if large else CFG.dungeon_params()
+    keys: List[str] = []
+    values: List[list] = []
+    for item in overrides:
+        key, _, raw = item.partition("=")
+        key = key.strip()
+        if key not in base:
+            raise SystemExit(f"Parámetro desconocido: {key!r} (válidos: {', '.join(base)})")
+        keys.append(key)
+        values.append([_parse_value(v) for v in raw.split(",") if v])
+    sets = []
+    for combo in itertools.product(*values):
+        changed = dict(zip(keys, combo))
+        sets.append(({**base, **changed}, changed))
+    return sets
+
+
+def _jobs(param_sets: List[Tuple[dict, dict]], seeds: range,
+          chunk: int) -> Iterator[Tuple[int, dict, dict, int, int]]:
+    for params_id, (params, overrides) in enumerate(param_sets):
+        for start in range(seeds.start, seeds.stop, chunk):
+            yield params_id, params, overrides, start, min(start + chunk, seeds.stop)
+
+
+class _Writer:
+    """Escribe filas en JSONL o CSV a medida que llegan."""
+
+    def __init__(self, stream, fmt: str, override_keys: Iterable[str] = ()) -> None:
+        self.stream = stream
+        self.fmt = fmt
+        self._csv = None
+        if fmt == "csv":
+            # Una columna por clave de --set, después de las fijas
+            self._csv = csv.DictWriter(stream, fieldnames=CSV_FIELDS + list(override_keys))
+            self._csv.writeheader()
+
+    def write(self, row: dict) -> None:
+        if self._csv is not None:
+            flat = {key: value for key, value in row.items() if key != "overrides"}
+            flat.update(row["overrides"])
+            flat.update(depth_hist=";".join(map(str, row["depth_hist"])),
+                        degenerate=int(row["degenerate"]))
+            self._csv.writerow(flat)
+        else:
+            self.stream.write(json.dumps(row, separators=(",", ":")))
+            self.stream.write("\n")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Estadísticas masivas de layouts de dungeon.")
+    parser.add_argument("--seeds", default="0:10000", help="rango 'A:B' o cantidad N (default 0:10000)")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="CLAVE=V1,V2",
+                        help="override de Config.dungeon_params(); repetible, se combinan todas")
+    parser.add_argument("--large", action="store_true",
+                        help="parte de Config.large_world_params() en vez de dungeon_params()")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                        help="formato de salida (por defecto según la extensión de --out)")
+    parser.add_argument("--out", default="-", help="archivo de salida ('-' = stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=2000, help="seeds por tarea del pool")
+    parser.add_argument("--only-degenerate", action="store_true",
+                        help="escribe sólo los layouts degenerados")
+    args = parser.parse_args(argv)
+
+    seeds = _parse_seeds(args.seeds)
+    param_sets = _param_sets(args.overrides, args.large)
+    fmt = args.format or ("csv" if args.out.endswith(".csv") else "jsonl")
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+    override_keys = list(param_sets[0][1]) if param_sets else []
+    writer = _Writer(out, fmt, override_keys)
+    total = degenerate = 0
+    t0 = time.perf_counter()
+    jobs = _jobs(param_sets, seeds, max(1, args.chunk))
+    pool = multiprocessing.Pool(args.workers) if args.workers > 1 else None
+    try:
+        # imap mantiene el orden de las seeds en la salida
+        results = pool.imap(_run_chunk, jobs) if pool is not None else map(_run_chunk, jobs)
+        for rows in results:
+            for row in rows:
+                total += 1
+                if row["degenerate"]:
+                    degenerate += 1
+                elif args.only_degenerate:
+                    continue
+                writer.write(row)
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        # Ante un error o Ctrl-C no quedan procesos del pool vivos
+        if pool is not None:
+            pool.terminate()
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - t0
+    print(f"{total} layouts ({len(param_sets)} set(s) de parámetros) en {elapsed:.1f}s "
+          f"— {degenerate} degenerados", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,11 +3,15 @@ import math, random, pygame
 from Entity import Entity
 from Config import CFG
 from Projectile import Projectile
+from EnemySprites import FRAME_TIME, sprite_set
 
 IDLE, WANDER, CHASE = 0, 1, 2
 
 class Enemy(Entity):
     """Base con FSM + LoS. Subclases cambian stats/comportamientos."""
+    color = (255, 255, 255)   # color base de los sprites por defecto (ver EnemySprites)
+    HIT_FLASH = 0.12          # s que dura el destello al recibir daño
+
     def __init__(self, x: float, y: float, hp: int = 3, gold_reward: int = 5) -> None:
         super().__init__(x, y, w=12, h=12, speed=40.0)
         self.hp = hp
@@ -31,11 +35,22 @@ class Enemy(Entity):
         # timers internos
         self._los_timer = 0.0
 
+        # Flujo aleatorio de IA (la sala asigna el suyo al spawnear)
+        self.rng = random
+
+        # Dibujo: variantes pre-horneadas del tipo, destello y reloj de animación
+        self._sprites = None
+        self.hit_timer = 0.0
+        self._anim_time = 0.0
+
     def _center(self):
         return (self.x + self.w/2, self.y + self.h/2)
 
     # ---------- loop ----------
     def update(self, dt: float, player, room) -> None:
+        self._anim_time += dt
+        if self.hit_timer > 0.0:
+            self.hit_timer = max(0.0, self.hit_timer - dt)
         ex, ey = self._center()
         px, py = (player.x + player.w/2, player.y + player.h/2)
 
@@ -71,21 +86,21 @@ class Enemy(Entity):
 
     # ---------- estados ----------
     def _update_idle(self, dt: float) -> None:
-        if random.random() < 0.005:
+        if self.rng.random() < 0.005:
             self._pick_wander()
             self.state = WANDER
 
     def _pick_wander(self) -> None:
-        ang = random.uniform(0, math.tau)
+        ang = self.rng.uniform(0, math.tau)
         self.wander_dir = (math.cos(ang), math.sin(ang))
-        self.wander_time = random.uniform(0.6, 1.2)
+        self.wander_time = self.rng.uniform(0.6, 1.2)
 
     def _update_wander(self, dt: float, room) -> None:
         vx, vy = self.wander_dir
         self.move(vx, vy, dt * (self.wander_speed / max(1e-6, self.speed)), room)
         self.wander_time -= dt
-        if self.wander_time <= 0.0 or random.random() < 0.01:
-            if random.random() < 0.5:
+        if self.wander_time <= 0.0 or self.rng.random() < 0.01:
+            if self.rng.random() < 0.5:
                 self.state = IDLE
             else:
                 self._pick_wander()
@@ -96,18 +111,44 @@ class Enemy(Entity):
             dx, dy = dx/mag, dy/mag
         self.move(dx, dy, dt * (self.chase_speed / max(1e-6, self.speed)), room)
 
-    def draw(self, surf: pygame.Surface) -> None:
-        # NO llames a super().draw con color si Entity.draw no acepta color
-        color = (255, 255, 255) if self.state == IDLE else \
-                (255, 255, 255)  if self.state == WANDER else \
-                (255, 255, 255)
-        pygame.draw.rect(surf, color, self.rect())
+    # ---------- persistencia ----------
+    def get_state(self) -> tuple:
+        """Estado mínimo para reconstruir al enemigo (ver `enemy_from_state`)."""
+        return (
+            type(self).__name__,
+            self.x, self.y, self.hp, self.state,
+            self.wander_dir[0], self.wander_dir[1], self.wander_time,
+            self._los_timer, getattr(self, "_fire_timer", 0.0),
+        )
+
+    def take_hit(self, damage: int = 1) -> None:
+        self.hp -= damage
+        self.hit_timer = self.HIT_FLASH
+
+    def render_item(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """(superficie, destino) para la cola de dibujo: sólo elige un sprite ya horneado."""
+        sprites = self._sprites
+        if sprites is None:
+            sprites = self._sprites = sprite_set(type(self), (self.w, self.h), self.color)
+        if self.hit_timer > 0.0:
+            frames = sprites["hit"]
+        elif self.state == CHASE:
+            frames = sprites["chase"]
+        else:
+            frames = sprites["idle"]
+        frame = frames[int(self._anim_time / FRAME_TIME) % len(frames)]
+        return frame, (int(self.x), int(self.y))
+
+    def draw(self, surf: pygame.Surface) -> pygame.Rect:
+        return surf.blit(*self.render_item())
 
 
 # ===== Tipos de enemigo =====
 
 class FastChaserEnemy(Enemy):
     """Rápido, poca vida."""
+    color = (0, 255, 0)
+
     def __init__(self, x, y):
         super().__init__(x, y, hp=2, gold_reward=7)
         self.chase_speed  = 100.0
@@ -115,13 +156,11 @@ class FastChaserEnemy(Enemy):
         self.detect_radius = 100.0
         self.lose_radius   = 150.0
 
-    def draw(self, surf):
-        color = (0, 255, 0) if self.state == CHASE else (0, 255, 0)
-        pygame.draw.rect(surf, color, self.rect())
-
 
 class TankEnemy(Enemy):
     """Lento, mucha vida."""
+    color = (255, 0, 0)
+
     def __init__(self, x, y):
         super().__init__(x, y, hp=9, gold_reward=12)
         self.chase_speed  = 30.0
@@ -129,13 +168,11 @@ class TankEnemy(Enemy):
         self.detect_radius = 240.0
         self.lose_radius   = 260.0
 
-    def draw(self, surf):
-        color = (255, 0, 0) if self.state == CHASE else (255, 0, 0)
-        pygame.draw.rect(surf, color, self.rect())
-
 
 class ShooterEnemy(Enemy):
     """Dispara si te ve (LoS) y estás en rango."""
+    color = (0, 0, 255)
+
     def __init__(self, x, y):
         super().__init__(x, y, hp=3, gold_reward=9)
         self.chase_speed  = 5
@@ -208,13 +245,10 @@ class ShooterEnemy(Enemy):
                 out_bullets.append(bullet)
         self._fire_timer = self.fire_cooldown
 
-    def draw(self, surf):
-        color = (0, 0, 255) if self.state == CHASE else (0, 0, 255)
-        pygame.draw.rect(surf, color, self.rect())
-
 
 class BasicEnemy(Enemy):
     """Enemigo común que dispara lentamente mientras avanza."""
+    color = (255, 255, 0)
 
     def __init__(self, x, y):
         super().__init__(x, y, hp=3, gold_reward=5)
@@ -261,13 +295,10 @@ class BasicEnemy(Enemy):
                 out_bullets.append(bullet)
         self._fire_timer = self.fire_cooldown
 
-    def draw(self, surf):
-        color = (255, 255, 0) if self.state == CHASE else (255, 255, 0)
-        pygame.draw.rect(surf, color, self.rect())
-
 
 class TankEnemy(Enemy):
     """Lento, mucha vida y dispara ráfagas estilo escopeta."""
+    color = (255, 0, 0)
 
     def __init__(self, x, y):
         super().__init__(x, y, hp=9, gold_reward=12)
@@ -344,6 +375,25 @@ class TankEnemy(Enemy):
 
         self._fire_timer = self.fire_cooldown
 
-    def draw(self, surf):
-        color = (255, 0, 0) if self.state == CHASE else (255, 0, 0)
-        pygame.draw.rect(surf, color, self.rect())
+
+# ===== Persistencia =====
+
+# Orden estable: el índice se usa como código en los archivos de guardado.
+ENEMY_TYPES: tuple[type[Enemy], ...] = (
+    Enemy, FastChaserEnemy, TankEnemy, ShooterEnemy, BasicEnemy,
+)
+_ENEMY_BY_NAME = {cls.__name__: cls for cls in ENEMY_TYPES}
+
+
+def enemy_from_state(state: tuple) -> Enemy:
+    """Reconstruye un enemigo a partir de `Enemy.get_state()`."""
+    name, x, y, hp, fsm_state, wdx, wdy, wander_time, los_timer, fire_timer = state
+    enemy = _ENEMY_BY_NAME[name](x, y)
+    enemy.hp = hp
+    enemy.state = fsm_state
+    enemy.wander_dir = (wdx, wdy)
+    enemy.wander_time = wander_time
+    enemy._los_timer = los_timer
+    if hasattr(enemy, "_fire_timer"):
+        enemy._fire_timer = fire_timer
+    return enemy
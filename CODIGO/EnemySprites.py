@@ -0,0 +1,101 @@
+"""Sprites de enemigos pre-horneados: frames por tipo y sus variantes teñidas.
+
+Al cargar (`bake_all`) cada tipo arma sus frames —de
+`assets/enemies/<tipo>_<n>.png` si existen (o del atlas), si no un bloque
+del color del tipo— y de cada frame una variante por estado:
+
+- `idle`: tal cual.
+- `chase`: aclarada (el enemigo te vio).
+- `hit`: destello blanco al recibir daño.
+
+Las variantes teñidas son derivadas de `RESOURCES` (clave tipo, tamaño y
+frame); acá sólo se guarda qué superficies forman el set de cada tipo, para
+no volver a listar la carpeta. En runtime dibujar un enemigo sólo elige una
+de estas superficies; nunca se tiñe nada por frame.
+"""
+from __future__ import annotations
+
+import os
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from AssetAtlas import load_atlas, parse_sprite_name
+from Config import CFG
+from Resources import RESOURCES
+
+VARIANTS = ("idle", "chase", "hit")
+CHASE_TINT = (70, 70, 70)   # se suma al RGB
+FRAME_TIME = 0.15           # s por frame cuando el tipo tiene animación
+
+SpriteSet = Dict[str, List[pygame.Surface]]
+_SETS: Dict[Tuple[str, Tuple[int, int]], SpriteSet] = {}
+
+
+def kind_of(cls) -> str:
+    """'FastChaserEnemy' → 'fastchaser'; la base 'Enemy' queda 'enemy'."""
+    name = cls.__name__
+    if name.endswith("Enemy") and name != "Enemy":
+        name = name[:-len("Enemy")]
+    return name.lower()
+
+
+def _load_frames(kind: str, size: Tuple[int, int]) -> List[pygame.Surface]:
+    """Frames de `assets/enemies/<kind>_<n>.png` en orden, escalados a `size`."""
+    folder = CFG.ASSETS_DIR / "enemies"
+    try:
+        names = [entry.name for entry in os.scandir(folder)
+                 if entry.name.endswith(".png") and entry.is_file()]
+    except OSError:
+        return []
+    indexed = []
+    for name in names:
+        parsed = parse_sprite_name(name[:-len(".png")], prefix=f"{kind}_")
+        if parsed is not None and parsed[0] == "idle":
+            indexed.append((parsed[1], name))
+    atlas = load_atlas()
+    frames = []
+    for _, name in sorted(indexed):
+        img = atlas.sprite(f"enemies/{name}") if atlas is not None else None
+        try:
+            if img is None:
+                frames.append(RESOURCES.scaled(folder / name, size))
+            else:
+                frames.append(RESOURCES.scaled(img, size, key=("atlas", f"enemies/{name}")))
+        except pygame.error as exc:
+            print(f"[EnemySprites] Se ignora '{name}': {exc}")
+    return frames
+
+
+def _tint(frame: pygame.Surface, variant: str, key: tuple) -> pygame.Surface:
+    if variant == "idle":
+        return frame
+    if variant == "chase":
+        return RESOURCES.tinted(frame, CHASE_TINT, pygame.BLEND_RGB_ADD, key=key)
+    # MAX con blanco: RGB a blanco, el alfa (la silueta) queda igual
+    return RESOURCES.tinted(frame, (255, 255, 255), pygame.BLEND_RGB_MAX, key=key)
+
+
+def sprite_set(cls, size: Tuple[int, int], color) -> SpriteSet:
+    """Variante → frames para el tipo `cls` a `size` (se hornea la primera vez)."""
+    key = (kind_of(cls), tuple(size))
+    sprites = _SETS.get(key)
+    if sprites is None:
+        frames = _load_frames(key[0], key[1])
+        if not frames:
+            block = pygame.Surface(size)
+            block.fill(color)
+            frames = [block]
+        sprites = _SETS[key] = {
+            variant: [_tint(f, variant, ("enemy", *key, i)) for i, f in enumerate(frames)]
+            for variant in VARIANTS
+        }
+    return sprites
+
+
+def bake_all(types: Iterable[type]) -> int:
+    """Hornea todos los tipos al arrancar; devuelve cuántas superficies hay en cache."""
+    for cls in types:
+        probe = cls(0.0, 0.0)
+        sprite_set(cls, (probe.w, probe.h), probe.color)
+    return sum(len(frames) for sprites in _SETS.values() for frames in sprites.values())
@@ -0,0 +1,175 @@
+"""Niebla de guerra: sólo se ve lo que está en línea de visión del jugador.
+
+La visibilidad sale de un shadowcasting recursivo (8 octantes) desde el tile
+del jugador sobre la grilla de la sala, dentro de un radio. Se recalcula
+sólo cuando el jugador cambia de tile (o de sala): la clave del cache es
+(posición de la sala en la dungeon, tile), no la sala misma, para no
+retener salas que la dungeon ya desalojó. Con ella se arma una máscara de
+baja resolución (un píxel por tile) que se escala una vez a píxeles; cada
+frame sólo se blitea.
+"""
+from __future__ import annotations
+
+from typing import Callable, Hashable, List, Tuple
+
+import pygame
+
+from Config import CFG
+
+# (xx, xy, yx, yy) de cada octante
+_OCTANTS = (
+    (1, 0, 0, -1), (0, 1, -1, 0), (0, -1, -1, 0), (-1, 0, 0, -1),
+    (-1, 0, 0, 1), (0, -1, 1, 0), (0, 1, 1, 0), (1, 0, 0, 1),
+)
+
+
+def shadowcast(blocked: Callable[[int, int], bool], mark: Callable[[int, int], None],
+               cx: int, cy: int, radius: int) -> None:
+    """Llama `mark(x, y)` por cada tile visible desde (cx, cy); las paredes que
+    tapan la vista también se marcan (se ven)."""
+    mark(cx, cy)
+    for xx, xy, yx, yy in _OCTANTS:
+        _cast(blocked, mark, cx, cy, 1, 1.0, 0.0, radius, xx, xy, yx, yy)
+
+
+def _cast(blocked, mark, cx, cy, row, start, end, radius, xx, xy, yx, yy) -> None:
+    if start < end:
+        return
+    r2 = radius * radius
+    for j in range(row, radius + 1):
+        dx, dy = -j - 1, -j
+        in_shadow = False
+        new_start = start
+        while dx <= 0:
+            dx += 1
+            # Pendientes de los bordes izquierdo/derecho del tile
+            l_slope = (dx - 0.5) / (dy + 0.5)
+            r_slope = (dx + 0.5) / (dy - 0.5)
+            if start < r_slope:
+                continue
+            if end > l_slope:
+                break
+            x, y = cx + dx * xx + dy * xy, cy + dx * yx + dy * yy
+            if dx * dx + dy * dy <= r2:
+                mark(x, y)
+            if in_shadow:
+                if blocked(x, y):
+                    new_start = r_slope
+                    continue
+                in_shadow = False
+                start = new_start
+            elif blocked(x, y) and j < radius:
+                in_shadow = True
+                _cast(blocked, mark, cx, cy, j + 1, start, l_slope, radius, xx, xy, yx, yy)
+                new_start = r_slope
+        if in_shadow:
+            break
+
+
+class FogOfWar:
+    """
+    Visibilidad cacheada por (posición de la sala, tile del jugador) + su overlay.
+
+    El overlay cubre la ventana de (2·radio+1)² tiles alrededor del jugador;
+    fuera de ella todo es niebla uniforme (tiras de una superficie fija).
+    """
+
+    def __init__(self, radius: int = 10, alpha: int = 215) -> None:
+        self.radius = max(1, int(radius))
+        self.alpha = max(0, min(255, int(alpha)))
+        self.recomputes = 0
+        self._key = None
+        self._window = pygame.Rect(0, 0, 0, 0)   # en tiles
+        self._visible = bytearray()
+        self._overlay: pygame.Surface | None = None
+        self._dark: pygame.Surface | None = None
+
+    # ------------------------------------------------------------------ #
+    # Visibilidad
+    # ------------------------------------------------------------------ #
+    def update(self, room, center_px: Tuple[float, float], pos: Hashable) -> bool:
+        """Recalcula si el jugador cambió de tile o de sala (`pos`, su posición
+        en la dungeon); True si cambió. `room` sólo se usa al recalcular."""
+        ts = CFG.TILE_SIZE
+        tile = (int(center_px[0]) // ts, int(center_px[1]) // ts)
+        key = (pos, tile)
+        if key == self._key:
+            return False
+        self._key = key
+        r = self.radius
+        map_w = getattr(room, "map_w", CFG.MAP_W)
+        map_h = getattr(room, "map_h", CFG.MAP_H)
+        window = pygame.Rect(tile[0] - r, tile[1] - r, 2 * r + 1, 2 * r + 1).clip(0, 0, map_w, map_h)
+        visible = bytearray(window.width * window.height)
+        wx, wy, ww = window.x, window.y, window.width
+
+        def mark(x: int, y: int) -> None:
+            if window.collidepoint(x, y):
+                visible[(y - wy) * ww + (x - wx)] = 1
+
+        shadowcast(room.is_blocked, mark, tile[0], tile[1], r)
+        self._window = window
+        self._visible = visible
+        self._build_overlay()
+        self.recomputes += 1
+        return True
+
+    def reset(self) -> None:
+        """Olvida la visibilidad (otra dungeon: las posiciones se repiten)."""
+        self._key = None
+        self._window = pygame.Rect(0, 0, 0, 0)
+        self._visible = bytearray()
+        self._overlay = None
+
+    def sees(self, pos_px: Tuple[float, float]) -> bool:
+        """¿El punto (px del mundo) cae en un tile visible?"""
+        ts = CFG.TILE_SIZE
+        x, y = int(pos_px[0]) // ts, int(pos_px[1]) // ts
+        window = self._window
+        if not window.collidepoint(x, y):
+            return False
+        return self._visible[(y - window.y) * window.width + (x - window.x)] == 1
+
+    # ------------------------------------------------------------------ #
+    # Overlay
+    # ------------------------------------------------------------------ #
+    def _build_overlay(self) -> None:
+        """Máscara de un píxel por tile → escalada (una vez) a píxeles."""
+        window = self._window
+        if not window:
+            self._overlay = None
+            return
+        mask = pygame.Surface(window.size, pygame.SRCALPHA)
+        mask.fill((0, 0, 0, self.alpha))
+        visible = self._visible
+        ww = window.width
+        for idx in range(len(visible)):
+            if visible[idx]:
+                mask.set_at((idx % ww, idx // ww), (0, 0, 0, 0))
+        ts = CFG.TILE_SIZE
+        self._overlay = pygame.transform.smoothscale(mask, (window.width * ts, window.height * ts))
+
+    def render_items(self, view: pygame.Rect) -> List[tuple]:
+        """Overlay de la ventana + tiras de niebla uniforme para el resto de `view`."""
+        if self._overlay is None:
+            return []
+        ts = CFG.TILE_SIZE
+        w = self._window
+        lit = pygame.Rect(w.x * ts, w.y * ts, w.width * ts, w.height * ts)
+        items = [(self._overlay, lit.topleft)]
+        dark = self._dark
+        if dark is None or dark.get_width() < view.width or dark.get_height() < view.height:
+            dark = self._dark = pygame.Surface(view.size, pygame.SRCALPHA)
+            dark.fill((0, 0, 0, self.alpha))
+        # Arriba, abajo, izquierda y derecha de la ventana (recortadas a la vista)
+        strips = (
+            pygame.Rect(view.left, view.top, view.width, lit.top - view.top),
+            pygame.Rect(view.left, lit.bottom, view.width, view.bottom - lit.bottom),
+            pygame.Rect(view.left, lit.top, lit.left - view.left, lit.height),
+            pygame.Rect(lit.right, lit.top, view.right - lit.right, lit.height),
+        )
+        for strip in strips:
+            strip = strip.clip(view)
+            if strip.width > 0 and strip.height > 0:
+                items.append((dark, strip.topleft, pygame.Rect((0, 0), strip.size)))
+        return items
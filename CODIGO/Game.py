@@ -1,59 +1,150 @@
 # CODIGO/Game.py
+import statistics
+import struct
 import sys
+import time
 import pygame
 from Config import Config
 from Tileset import Tileset
 from Player import Player
 from Dungeon import Dungeon
+import EnemySprites
+from Enemy import ENEMY_TYPES
+from FogOfWar import FogOfWar
+from DungeonPrefetch import DungeonPrefetcher
 from Minimap import Minimap
+from Particles import ParticleSystem
 from Projectile import ProjectileGroup
 from Shop import Shop
 from Shopkeeper import Shopkeeper
 from Cinematica import Cinematica
+from Render import (
+    LAYER_BACKGROUND, LAYER_DOORS, LAYER_ENEMIES, LAYER_FOG, LAYER_OVERLAY, LAYER_PARTICLES,
+    LAYER_PLAYER, LAYER_PROJECTILES,
+    Camera, DirtyTracker, RenderQueue, ScaledOutput, merge_rects,
+)
+from Resources import RESOURCES
+from SaveGame import SaveFormatError, SaveReader, save_run
+from Startup import StartupLoader
+from Text import Label, atlas_for
 
 
 class Game:
-    def __init__(self, cfg: Config) -> None:
+    def __init__(self, cfg: Config, *, background_load: bool = False,
+                 started_at: float | None = None) -> None:
+        """
+        Con `background_load` sólo se abre la ventana: fuentes, sprites y la
+        primera dungeon se cargan en un hilo (ver `run`, que muestra la intro
+        mientras tanto). Si no, se carga todo antes de volver.
+        `started_at` (perf_counter) es desde cuándo se mide el arranque.
+        """
+        self._started_at = time.perf_counter() if started_at is None else started_at
         pygame.init()
         self.cfg = cfg
 
         # ---------- Ventana ----------
-        self.screen = pygame.display.set_mode(
-            (cfg.SCREEN_W * cfg.SCREEN_SCALE, cfg.SCREEN_H * cfg.SCREEN_SCALE)
-        )
+        # Con SCALED_DISPLAY la ventana es del tamaño del mundo y escala pygame/SDL;
+        # si no, escalamos nosotros a SCREEN_SCALE directo sobre la pantalla.
+        out_scale = cfg.SCREEN_SCALE
+        self.screen = None
+        if cfg.SCALED_DISPLAY:
+            try:
+                self.screen = pygame.display.set_mode((cfg.SCREEN_W, cfg.SCREEN_H), pygame.SCALED)
+                out_scale = 1
+            except pygame.error as exc:
+                print(f"[Game] pygame.SCALED no disponible ({exc}); se escala por CPU.")
+        if self.screen is None:
+            self.screen = pygame.display.set_mode(
+                (cfg.SCREEN_W * out_scale, cfg.SCREEN_H * out_scale)
+            )
         pygame.display.set_caption("Roguelike — Dungeon + Minimap")
         self.clock = pygame.time.Clock()
+        # Lienzo del mundo (crece hasta la sala más grande vista) y la parte
+        # que muestra la cámara; en salas normales son la misma superficie.
+        self.camera = Camera(cfg.SCREEN_W, cfg.SCREEN_H)
         self.world = pygame.Surface((cfg.SCREEN_W, cfg.SCREEN_H))
+        self.view = self.world.subsurface(self.camera.rect)
+        self.output = ScaledOutput(self.screen, (cfg.SCREEN_W, cfg.SCREEN_H), out_scale)
+        # El HUD está maquetado en píxeles de pantalla a SCREEN_SCALE
+        self._hud_scale = out_scale / cfg.SCREEN_SCALE
+
+        # Arranque: ms desde `started_at` hasta cada hito
+        self.startup_metrics: dict[str, float] = {"ventana": self._since_start()}
+        # La intro usa la fuente que trae pygame: no espera el escaneo de fuentes
+        # del sistema, que queda en la fase "fuentes" (en segundo plano)
+        self.intro_font = RESOURCES.default_font(22)
 
         # ---------- UI ----------
-        self.ui_font = pygame.font.SysFont(None, 18)
         self._coin_icon = pygame.Surface((16, 16), pygame.SRCALPHA)
         pygame.draw.circle(self._coin_icon, (255, 215, 0), (8, 8), 6)
         pygame.draw.circle(self._coin_icon, (160, 120, 0), (8, 8), 6, 1)
         pygame.draw.line(self._coin_icon, (160, 120, 0), (6, 8), (10, 8), 1)
         self.current_seed: int | None = None
-        
-        # --- Tienda ---
-        self.shop = Shop(font=self.ui_font)
-
-        # ---------- Recursos ----------
-        self.tileset = Tileset()
-        self.minimap = Minimap(cell=16, padding=8)
 
         # ---------- Estado runtime ----------
         self.projectiles = ProjectileGroup()          # balas del jugador
         self.enemy_projectiles = ProjectileGroup()    # balas de enemigos
+        self.particles = ParticleSystem(cfg.PARTICLE_CAP, cfg.PARTICLE_EMIT_BUDGET)
+        # Visibilidad cacheada por tile del jugador; None = sin niebla
+        self.fog: FogOfWar | None = FogOfWar(cfg.FOG_RADIUS, cfg.FOG_ALPHA) if cfg.FOG_OF_WAR else None
         self.door_cooldown = 0.0
         self.running = True
         self.debug_draw_doors = cfg.DEBUG_DRAW_DOOR_TRIGGERS
+        self._prepared_rooms: set[tuple[int, int]] = set()
+        self._transition_frame = False
+        self.transition_times: list[float] = []  # ms de cada frame con cambio de sala
+
+        # ---------- Render ----------
+        # Con DIRTY_RECTS sólo se re-escala y presenta lo que cambió
+        self.dirty: DirtyTracker | None = DirtyTracker() if cfg.DIRTY_RECTS else None
+        # Todo lo del mundo pasa por acá: un `blits` por capa
+        self.render_queue = RenderQueue()
+        self._last_world_key = None
+        self._hud_labels: dict[str, Label] = {}
+        # (superficie, rect, versión) de cada elemento del HUD en el último frame
+        self._last_hud: list[tuple[pygame.Surface, pygame.Rect, int]] = []
+        self.prefetcher: DungeonPrefetcher | None = None
+        if cfg.PREGEN_NEXT_DUNGEON:
+            self.prefetcher = DungeonPrefetcher(cfg.dungeon_params())
+
+        # ---------- Recursos + arranque de run (en fases) ----------
+        self.startup = StartupLoader([
+            ("fuentes", self._load_fonts),
+            ("sprites", self._load_sprites),
+            ("dungeon", self._load_first_run),
+        ])
+        if background_load:
+            self.startup.start()
+        else:
+            self.startup.run()
+            self._show_seed()
 
-        # ---------- Arranque de run ----------
-        self.start_new_run()  # crea dungeon, posiciona player, limpia estado
+    def _since_start(self) -> float:
+        return (time.perf_counter() - self._started_at) * 1000.0
+
+    # ------------------------------------------------------------------ #
+    # Fases de carga (pueden correr en el hilo de `StartupLoader`)
+    # ------------------------------------------------------------------ #
+    def _load_fonts(self) -> None:
+        # La primera fuente escanea las del sistema: es lo caro
+        self.ui_font = RESOURCES.font(None, 18)
+        self.shop = Shop(font=self.ui_font)
+        self.minimap = Minimap(cell=max(4, int(16 * self._hud_scale)),
+                               padding=max(2, int(8 * self._hud_scale)))
+
+    def _load_sprites(self) -> None:
+        self.tileset = Tileset()
+        EnemySprites.bake_all(ENEMY_TYPES)  # frames + variantes teñidas, una sola vez
+
+    def _load_first_run(self) -> None:
+        # El título de la ventana lo pone el hilo principal (`_show_seed`)
+        self.start_new_run(show_seed=False)  # crea dungeon, posiciona player, limpia estado
 
     # ------------------------------------------------------------------ #
     # Nueva partida / regenerar dungeon (misma o nueva seed)
     # ------------------------------------------------------------------ #
-    def start_new_run(self, seed: int | None = None, dungeon_params: dict | None = None) -> None:
+    def start_new_run(self, seed: int | None = None, dungeon_params: dict | None = None,
+                      *, show_seed: bool = True) -> None:
         """
         Crea una nueva dungeon con la seed dada (o aleatoria si None),
         reubica al jugador y resetea estado de runtime.
@@ -62,9 +153,17 @@ class Game:
         if dungeon_params:
             params = {**params, **dungeon_params}
 
-        self.dungeon = Dungeon(**params, seed=seed)
+        prefetched = None
+        if seed is None and not dungeon_params and self.prefetcher is not None:
+            prefetched = self.prefetcher.take()
+        if prefetched is not None:
+            seed, layout = prefetched
+            self.dungeon = Dungeon(seed=seed, layout=layout)
+        else:
+            self.dungeon = Dungeon(**params, seed=seed)
         self.current_seed = self.dungeon.seed
-        pygame.display.set_caption(f"Roguelike — Seed {self.current_seed}")
+        if show_seed:
+            self._show_seed()
 
         # marcar room inicial como explorado
         self.dungeon.explored = set()
@@ -77,6 +176,7 @@ class Game:
             self.player = Player(px - 6, py - 6)
         else:
             self.player.x, self.player.y = px - 6, py - 6
+        self.player.rng = self.dungeon.weapon_rng
         if hasattr(self.player, "reset_loadout"):
             self.player.reset_loadout()
         setattr(self.player, "gold", 0)
@@ -88,18 +188,65 @@ class Game:
         if hasattr(self.dungeon, "enter_initial_room"):
             self.dungeon.enter_initial_room(self.player, self.cfg, ShopkeeperCls=Shopkeeper)
 
+    # ------------------------------------------------------------------ #
+    # Guardar / cargar run (F5 / F9)
+    # ------------------------------------------------------------------ #
+    def save_run(self, path=None) -> bool:
+        path = path or self.cfg.SAVE_PATH
+        try:
+            save_run(path, self.dungeon, self.player)
+        except (OSError, struct.error) as exc:
+            # struct.error: algún valor no entra en el formato (el archivo no se tocó)
+            print(f"[Game] No se pudo guardar la partida: {exc}")
+            return False
+        return True
+
+    def load_run(self, path=None) -> bool:
+        """Reemplaza la run actual por la guardada. Las salas se leen al entrar."""
+        path = path or self.cfg.SAVE_PATH
+        # Todo lo que puede fallar se arma antes de tocar la run actual
+        try:
+            reader = SaveReader(path)
+            dungeon = reader.build_dungeon()
+        except (OSError, SaveFormatError) as exc:
+            print(f"[Game] No se pudo cargar la partida: {exc}")
+            return False
+
+        self.dungeon = dungeon
+        self.current_seed = self.dungeon.seed
+        self._show_seed()
+        self.player.rng = self.dungeon.weapon_rng
+        self.player.apply_state(reader.player_state)
+        self._reset_runtime_state()
+        self.dungeon.enter_initial_room(self.player, self.cfg, ShopkeeperCls=Shopkeeper)
+        self._update_room_lock(self.dungeon.current_room)
+        return True
+
+    def _show_seed(self) -> None:
+        pygame.display.set_caption(f"Roguelike — Seed {self.current_seed}")
+
     def _reset_runtime_state(self) -> None:
         self.projectiles.clear()
         self.enemy_projectiles.clear()
+        self.particles.clear()
         self.door_cooldown = 0.0
         self.locked = False
         self.cleared = False
+        self._prepared_rooms.clear()
+        if self.fog is not None:
+            self.fog.reset()
 
     # ------------------------------------------------------------------ #
     # Bucle principal
     # ------------------------------------------------------------------ #
     def run(self) -> None:
-        Cinematica(self.screen, self.cfg).play()
+        # La intro no espera nada: fuentes, sprites y dungeon siguen cargando detrás
+        intro = Cinematica(self.screen, self.cfg, font=self.intro_font)
+        intro.play()
+        self.startup_metrics["intro en pantalla"] = (intro.first_present_at - self._started_at) * 1000.0
+        # Ventana cerrada en la intro o en "Cargando…": se sale sin arrancar el juego
+        if intro.closed or not self._finish_startup():
+            self._quit()
         self._frame_counter = 0
         while self.running:
             dt = self.clock.tick(self.cfg.FPS) / 1000.0
@@ -107,13 +254,86 @@ class Game:
 
             events = self._handle_events()
             self._update_fps_counter()
-            self._update(dt, events)
-            self._render()
-
-        Cinematica(self.screen, self.cfg).play()
+            self._frame(dt, events)
+            if "primer frame" not in self.startup_metrics:
+                self.startup_metrics["primer frame"] = self._since_start()
+                if self.cfg.DEBUG_PERF:
+                    self._print_startup_report()
+
+        if self.cfg.DEBUG_PERF:
+            self._print_perf_report()
+        Cinematica(self.screen, self.cfg, font=self.intro_font).play()
+        self._quit()
+
+    def _quit(self) -> None:
+        if self.prefetcher is not None:
+            self.prefetcher.close()
         pygame.quit()
         sys.exit(0)
 
+    def _finish_startup(self) -> bool:
+        """Si la intro terminó antes que la carga, muestra "Cargando…" hasta que
+        esté. False si se cerró la ventana mientras tanto (la carga no se espera)."""
+        t0 = time.perf_counter()
+        if not self.startup.done:
+            # La fuente de la intro ya existe; `ui_font` sale de la fase "fuentes"
+            text = self.intro_font.render("Cargando…", True, (200, 200, 200))
+            rect = text.get_rect(center=self.screen.get_rect().center)
+            while not self.startup.done:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                        return False
+                self.screen.fill((0, 0, 0))
+                self.screen.blit(text, rect)
+                pygame.display.flip()
+                self.clock.tick(30)
+        self.startup.join()
+        self.startup_metrics["espera tras la intro"] = (time.perf_counter() - t0) * 1000.0
+        self._show_seed()
+        return True
+
+    def _print_startup_report(self) -> None:
+        metrics = self.startup_metrics
+        print("[Perf] arranque: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in metrics.items()))
+        for line in self.startup.report():
+            print(f"[Perf] arranque {line}")
+
+    def _frame(self, dt: float, events: list) -> None:
+        """Un frame de juego; si hubo cambio de sala registra cuánto tardó."""
+        t0 = time.perf_counter()
+        self._transition_frame = False
+        self._update(dt, events)
+        self._render()
+        if self._transition_frame:
+            ms = (time.perf_counter() - t0) * 1000.0
+            self.transition_times.append(ms)
+            if self.cfg.DEBUG_PERF:
+                print(f"[Perf] transición {ms:.2f} ms (peor {max(self.transition_times):.2f} ms)")
+
+    def _print_perf_report(self) -> None:
+        times = self.transition_times
+        if times:
+            print(
+                f"[Perf] {len(times)} transiciones — mediana {statistics.median(times):.2f} ms, "
+                f"peor {max(times):.2f} ms"
+            )
+        for line in self.render_queue.report():
+            print(f"[Perf] {line}")
+        print(f"[Perf] partículas descartadas por tope/presupuesto: {self.particles.dropped}")
+        for line in RESOURCES.report():
+            print(f"[Perf] recursos {line}")
+        if self.fog is not None:
+            print(f"[Perf] niebla: {self.fog.recomputes} recálculos de visibilidad")
+        if hasattr(self.dungeon, "residency_stats"):
+            stats = self.dungeon.residency_stats()
+            print(
+                f"[Perf] salas residentes {stats['resident']}/{stats['limit']} "
+                f"({stats['resident_bytes'] / 1024:.0f} KiB), compactadas {stats['compacted']} "
+                f"({stats['compacted_bytes'] / 1024:.0f} KiB), desalojos {stats['evictions']}, "
+                f"reconstrucciones {stats['rebuilds']}"
+            )
+
     def _handle_events(self) -> list:
         events = pygame.event.get()
         for e in events:
@@ -126,6 +346,10 @@ class Game:
                     self.start_new_run(seed=self.current_seed)
                 elif e.key == pygame.K_n:
                     self.start_new_run(seed=None)
+                elif e.key == pygame.K_F5:
+                    self.save_run()
+                elif e.key == pygame.K_F9:
+                    self.load_run()
         return events
 
     def _update_fps_counter(self) -> None:
@@ -138,6 +362,7 @@ class Game:
     def _update(self, dt: float, events: list) -> None:
         room = self.dungeon.current_room
         self._update_player(dt, room)
+        self._prefetch_neighbors(room)
         self._spawn_room_enemies(room)
         self._update_enemies(dt, room)
         self._update_projectiles(dt, room)
@@ -150,28 +375,54 @@ class Game:
     def _update_player(self, dt: float, room) -> None:
         self.player.update(dt, room)
         mx, my = pygame.mouse.get_pos()
-        mx //= self.cfg.SCREEN_SCALE
-        my //= self.cfg.SCREEN_SCALE
-        self.player.try_shoot((mx, my), self.projectiles)
+        scale = self.output.scale
+        self.player.try_shoot(self.camera.to_world((mx // scale, my // scale)), self.projectiles)
 
-    def _spawn_room_enemies(self, room) -> None:
-        if getattr(room, "no_spawn", False):
+    def _prefetch_neighbors(self, room) -> None:
+        """
+        Si el jugador se acerca a una puerta, prepara la sala del otro lado
+        (tiles, superficie estática, encuentro y máscara de paredes) para que
+        el frame de la transición sólo tenga que cambiar de sala.
+        Como mucho una sala por frame.
+        """
+        if not self.cfg.PREFETCH_NEIGHBORS or not hasattr(room, "_door_trigger_rects"):
+            return
+        if not hasattr(self.dungeon, "neighbor"):
             return
-        cx, cy = self.dungeon.grid_w // 2, self.dungeon.grid_h // 2
-        is_start = (self.dungeon.i, self.dungeon.j) == getattr(self.dungeon, "start", (cx, cy))
-        if is_start:
+        cx, cy = self.player.rect().center
+        reach = self.cfg.PREFETCH_DISTANCE
+        for direction, rect in room._door_trigger_rects().items():
+            pos = self.dungeon.neighbor(direction)
+            # Si fue desalojada desde que se preparó, hay que volver a prepararla
+            if pos is None or (pos in self._prepared_rooms and pos in self.dungeon.rooms):
+                continue
+            dx = max(rect.left - cx, 0, cx - rect.right)
+            dy = max(rect.top - cy, 0, cy - rect.bottom)
+            if dx * dx + dy * dy > reach * reach:
+                continue
+            self._prepare_room(pos)
             return
-        if hasattr(room, "ensure_spawn"):
+
+    def _prepare_room(self, pos: tuple[int, int]) -> None:
+        self._prepared_rooms.add(pos)
+        room = self.dungeon.room_at(pos)
+        if hasattr(room, "bake"):
+            room.bake(self.tileset)
+        if hasattr(room, "warm_caches"):
+            room.warm_caches()
+        # La tienda recién marca no_spawn en on_enter: no pre-rolear ahí.
+        # El resto sale igual que al entrar porque cada sala tiene su propio RNG.
+        if getattr(room, "type", "normal") != "shop":
+            self._spawn_room_enemies(room, pos)
+
+    def _spawn_room_enemies(self, room, pos: tuple[int, int] | None = None) -> None:
+        if room.no_spawn:
+            return
+        if pos is None:
             pos = (self.dungeon.i, self.dungeon.j)
-            depth = 0
-            if hasattr(self.dungeon, "room_depth"):
-                depth = self.dungeon.room_depth(pos)
-            branch_factor = max(0, sum(1 for open_ in getattr(room, "doors", {}).values() if open_) - 2)
-            on_main_path = 0
-            if hasattr(self.dungeon, "main_path"):
-                on_main_path = 1 if pos in self.dungeon.main_path else 0
-            difficulty = 1 + depth + branch_factor + (depth // 3) + on_main_path
-            room.ensure_spawn(difficulty=difficulty)
+        if pos == self.dungeon.start:
+            return
+        room.ensure_spawn(difficulty=self.dungeon.room_difficulty(pos))
 
     def _update_enemies(self, dt: float, room) -> None:
         if not hasattr(room, "enemies"):
@@ -182,8 +433,19 @@ class Game:
             enemy.maybe_shoot(dt, self.player, room, self.enemy_projectiles)
 
     def _update_projectiles(self, dt: float, room) -> None:
-        self.projectiles.update(dt, room)
-        self.enemy_projectiles.update(dt, room)
+        # Primero las partículas: repone el presupuesto de emisión del frame
+        self.particles.update(dt)
+        self.projectiles.update(dt, room, self._emit_spark)
+        self.enemy_projectiles.update(dt, room, self._emit_spark)
+
+    def _emit_spark(self, projectile) -> None:
+        """Chispas donde murió un proyectil (pared, enemigo o jugador)."""
+        self.particles.emit(projectile.x, projectile.y, 6, projectile.color)
+
+    def _emit_death_burst(self, enemy) -> None:
+        cx, cy = enemy.rect().center
+        self.particles.emit(cx, cy, 18, getattr(enemy, "color", (255, 255, 255)), size=3,
+                            speed=(60.0, 200.0), life=(0.25, 0.5))
 
     def _handle_collisions(self, room) -> bool:
         if not hasattr(room, "enemies"):
@@ -195,8 +457,9 @@ class Game:
             r_proj = projectile.rect()
             for enemy in room.enemies:
                 if r_proj.colliderect(enemy.rect()):
-                    enemy.hp -= 1
+                    enemy.take_hit(1)
                     projectile.alive = False
+                    self._emit_spark(projectile)
                     break
         player_rect = self.player.rect()
         for projectile in self.enemy_projectiles:
@@ -220,6 +483,7 @@ class Game:
                 projectile.alive = False
             else:
                 projectile.alive = False
+            self._emit_spark(projectile)
 
         survivors = []
         for enemy in room.enemies:
@@ -227,6 +491,7 @@ class Game:
                 survivors.append(enemy)
             else:
                 gold_earned += getattr(enemy, "gold_reward", 0)
+                self._emit_death_burst(enemy)
         if gold_earned:
             current_gold = getattr(self.player, "gold", 0)
             setattr(self.player, "gold", current_gold + gold_earned)
@@ -267,6 +532,7 @@ class Game:
 
         self.projectiles.clear()
         self.enemy_projectiles.clear()
+        self.particles.clear()
         self.door_cooldown = 0.25
 
     def _handle_room_transition(self, room) -> None:
@@ -296,6 +562,8 @@ class Game:
         self.door_cooldown = 0.25
         self.projectiles.clear()
         self.enemy_projectiles.clear()
+        self.particles.clear()
+        self._transition_frame = True
 
         new_room = self.dungeon.current_room
         self._spawn_room_enemies(new_room)
@@ -304,8 +572,7 @@ class Game:
     def _update_room_lock(self, room) -> None:
         if not hasattr(room, "enemies") or not hasattr(room, "cleared"):
             return
-        cx, cy = self.dungeon.grid_w // 2, self.dungeon.grid_h // 2
-        is_start = (self.dungeon.i, self.dungeon.j) == getattr(self.dungeon, "start", (cx, cy))
+        is_start = (self.dungeon.i, self.dungeon.j) == self.dungeon.start
         room.locked = (not is_start) and (len(room.enemies) > 0) and (not room.cleared)
 
     def _update_shop(self, events: list) -> None:
@@ -315,78 +582,200 @@ class Game:
                 events,
                 self.player,
                 self.shop,
-                self.world,
+                self.view,
                 self.ui_font,
-                self.cfg.SCREEN_SCALE,
+                self.output.scale,
             )
 
     def _render(self) -> None:
-        self._render_world()
-        self._render_ui()
+        world_dirty = self._render_world()
+        self._render_ui(world_dirty)
 
-    def _render_world(self) -> None:
-        self.world.fill(self.cfg.COLOR_BG)
+    def _render_world(self) -> list[pygame.Rect] | None:
+        """
+        Dibuja lo que ve la cámara, capa por capa con la `RenderQueue`.
+        En modo DIRTY_RECTS sólo borra
+        (restaurando el fondo horneado de la sala) lo que se dibujó el frame
+        anterior y devuelve los rects que cambiaron, en coordenadas de la
+        vista; None significa “todo”.
+        """
         room = self.dungeon.current_room
-        room.draw(self.world, self.tileset)
-
-        if hasattr(room, "enemies"):
-            for enemy in room.enemies:
-                enemy.draw(self.world)
-
-        self.player.draw(self.world)
-        self.projectiles.draw(self.world)
-        self.enemy_projectiles.draw(self.world)
+        self._follow_camera(room)
+        fog = self.fog
+        if fog is not None:
+            # no-op si no cambió de tile
+            fog.update(room, self.player.rect().center, (self.dungeon.i, self.dungeon.j))
+        view = self.camera.rect
+        queue = self.render_queue
+        tracker = self.dirty
+        if tracker is None or self._needs_full_redraw(room):
+            self.view.fill(self.cfg.COLOR_BG)
+            queue.extend(LAYER_BACKGROUND, room.background_items(self.tileset, view))
+            if tracker is not None:
+                tracker.invalidate()
+        else:
+            for rect in tracker.stale():
+                queue.extend(LAYER_BACKGROUND, room.background_items(self.tileset, rect))
+        queue.extend(LAYER_DOORS, room.lock_items())
+
+        # Sólo lo que cae en la vista (el margen cubre barras/efectos fuera del rect)
+        margin = self.cfg.TILE_SIZE
+        visible = self.camera.visible
+        if fog is None:
+            queue.extend(LAYER_ENEMIES, [enemy.render_item() for enemy in room.enemies
+                                         if visible(enemy.rect(), margin)])
+        else:
+            # Fuera de la línea de visión ni se dibujan
+            queue.extend(LAYER_ENEMIES, [enemy.render_item() for enemy in room.enemies
+                                         if visible(enemy.rect(), margin)
+                                         and fog.sees(enemy.rect().center)])
+        queue.extend(LAYER_PLAYER, self.player.render_items())
+        queue.extend(LAYER_PROJECTILES, self.projectiles.render_items(view))
+        queue.extend(LAYER_PROJECTILES, self.enemy_projectiles.render_items(view))
+        queue.extend(LAYER_PARTICLES, self.particles.render_items(view))
+        if fog is not None:
+            queue.extend(LAYER_FOG, fog.render_items(view))
+        if hasattr(room, "overlay_items"):
+            queue.extend(LAYER_OVERLAY, room.overlay_items(self.ui_font, self.player, self.shop))
+        # El fondo y las rejas no cuentan: se borran/restauran solos
+        touched = queue.flush(self.world, track_from=LAYER_ENEMIES)
 
         if self.debug_draw_doors and hasattr(room, "_door_trigger_rects"):
             self._draw_debug_door_triggers(room)
 
-        if hasattr(room, "draw_overlay"):
-            room.draw_overlay(self.world, self.ui_font, self.player, self.shop)
-        self.shop.draw(self.world)
+        # La tienda es UI: va en coordenadas de la vista
+        self.shop.draw(self.view, getattr(self.player, "gold", None))
+
+        if tracker is None:
+            return None
+        tracker.extend(touched)
+        dirty = tracker.flush()
+        if dirty is None or view.topleft == (0, 0):
+            return dirty
+        return [self.camera.to_view(rect) for rect in dirty]
+
+    def _follow_camera(self, room) -> None:
+        """Ajusta el lienzo al tamaño de la sala y centra la cámara en el jugador."""
+        size = room.size_px() if hasattr(room, "size_px") else self.world.get_size()
+        width, height = self.world.get_size()
+        if size[0] > width or size[1] > height:
+            # Sólo crece: volver a una sala chica no vuelve a reservar
+            self.world = pygame.Surface((max(size[0], width), max(size[1], height)))
+            self.view = self.world.subsurface(self.camera.rect)
+        if self.camera.follow(self.player.rect().center, size):
+            self.view = self.world.subsurface(self.camera.rect)
+
+    def _needs_full_redraw(self, room) -> bool:
+        """Cambio de sala, de rejas o de cámara, tienda, debug o niebla: cosas que no se siguen por rects.
+        (La niebla se mezcla con alfa sobre todo: restaurar sólo rects la oscurecería dos veces.)"""
+        key = (room, room.locked, self.camera.rect.topleft)
+        changed = key != self._last_world_key
+        self._last_world_key = key
+        return (changed or self.debug_draw_doors or self.shop.active or self.fog is not None
+                or getattr(room, "type", "normal") == "shop")
 
     def _draw_debug_door_triggers(self, room) -> None:
         for rect in room._door_trigger_rects().values():
             pygame.draw.rect(self.world, (0, 255, 0), rect, 1)
 
-    def _render_ui(self) -> None:
-        scaled = pygame.transform.scale(
-            self.world,
-            (self.cfg.SCREEN_W * self.cfg.SCREEN_SCALE,
-             self.cfg.SCREEN_H * self.cfg.SCREEN_SCALE)
-        )
-        self.screen.blit(scaled, (0, 0))
-
+    # ------------------------------------------------------------------ #
+    # HUD / presentación
+    # ------------------------------------------------------------------ #
+    def _hud_text(self, slot: str, text: str, color) -> pygame.Surface:
+        """Texto del HUD: sólo se vuelve a armar (desde el atlas de glifos) si cambió."""
+        label = self._hud_labels.get(slot)
+        if label is None or label.atlas.color != tuple(color):
+            label = self._hud_labels[slot] = Label(atlas_for(self.ui_font, color))
+        return label.set(text)
+
+    def _hud_items(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
         lives_remaining = getattr(self.player, "lives", 0)
         max_lives = getattr(self.player, "max_lives", self.cfg.PLAYER_START_LIVES)
-        lives_text = self.ui_font.render(
-            f"Vidas: {lives_remaining}/{max_lives}", True, (255, 120, 120)
+        lives_text = self._hud_text(
+            "lives", f"Vidas: {lives_remaining}/{max_lives}", (255, 120, 120)
         )
-        self.screen.blit(lives_text, (5, 260))
 
         hits_remaining_life_fn = getattr(self.player, "hits_remaining_this_life", None)
         if callable(hits_remaining_life_fn):
             hits_remaining = hits_remaining_life_fn()
         else:
             hits_remaining = max(0, getattr(self.player, "hp", 0))
-        hits_text = self.ui_font.render(
-            f"Golpes restantes vida: {hits_remaining}", True, (255, 180, 120)
+        hits_text = self._hud_text(
+            "hits", f"Golpes restantes vida: {hits_remaining}", (255, 180, 120)
         )
-        self.screen.blit(hits_text, (5, 290))
 
         gold_amount = getattr(self.player, "gold", 0)
-        gold_text = self.ui_font.render(f"Monedas: {gold_amount}", True, (255, 240, 180))
-        self.screen.blit(self._coin_icon, (305, 100))
-        self.screen.blit(gold_text, (320, 100))
-        seed_text = self.ui_font.render(f"Seed: {self.current_seed}", True, (230, 230, 230))
-        help_text = self.ui_font.render("R: rejugar seed  |  N: nueva seed", True, (200, 200, 200))
-        self.screen.blit(seed_text, (200, 100))
-        self.screen.blit(help_text, (0, 100))
+        gold_text = self._hud_text("gold", f"Monedas: {gold_amount}", (255, 240, 180))
+        seed_text = self._hud_text("seed", f"Seed: {self.current_seed}", (230, 230, 230))
+        help_text = self._hud_text("help", "R: rejugar seed  |  N: nueva seed", (200, 200, 200))
 
+        # Superficie persistente: sólo repinta las celdas que cambiaron
         minimap_surface = self.minimap.render(self.dungeon)
-        margin = 16
-        self.screen.blit(
-            minimap_surface,
-            (self.screen.get_width() - minimap_surface.get_width() - margin, 100)
-        )
-
-        pygame.display.flip()
+        k = self._hud_scale
+        margin = int(16 * k)
+        items = [
+            (lives_text, (5, 260)),
+            (hits_text, (5, 290)),
+            (self._coin_icon, (305, 100)),
+            (gold_text, (320, 100)),
+            (seed_text, (200, 100)),
+            (help_text, (0, 100)),
+        ]
+        if k != 1:
+            items = [(surf, (int(x * k), int(y * k))) for surf, (x, y) in items]
+        items.append((minimap_surface,
+                      (self.screen.get_width() - minimap_surface.get_width() - margin, int(100 * k))))
+        return items
+
+    def _hud_version(self, surf: pygame.Surface) -> int:
+        """Las superficies que se modifican en el lugar (minimapa) llevan versión."""
+        return self.minimap.version if surf is self.minimap.surface else 0
+
+    def _render_ui(self, world_dirty: list[pygame.Rect] | None = None) -> None:
+        items = self._hud_items()
+        if world_dirty is None:
+            self.output.present(self.view)
+            for surf, pos in items:
+                self.screen.blit(surf, pos)
+            pygame.display.flip()
+        else:
+            self._present_dirty(world_dirty, items)
+        self._last_hud = [(surf, surf.get_rect(topleft=pos), self._hud_version(surf))
+                          for surf, pos in items]
+
+    def _present_dirty(self, world_dirty: list[pygame.Rect], items) -> None:
+        """Re-escala y envía a pantalla sólo los rects del mundo y del HUD que cambiaron."""
+        scale = self.output.scale
+        screen_rects = [
+            pygame.Rect(r.x * scale, r.y * scale, r.width * scale, r.height * scale)
+            for r in world_dirty
+        ]
+        # HUD: rect viejo y nuevo de cada elemento que cambió de superficie, versión o lugar
+        last = self._last_hud
+        for idx, (surf, pos) in enumerate(items):
+            rect = surf.get_rect(topleft=pos)
+            if (idx < len(last) and last[idx][0] is surf and last[idx][1] == rect
+                    and last[idx][2] == self._hud_version(surf)):
+                continue
+            screen_rects.append(rect)
+            if idx < len(last):
+                screen_rects.append(last[idx][1])
+
+        world_bounds = self.view.get_rect()
+        presented: list[pygame.Rect] = []
+        for rect in merge_rects(screen_rects):
+            # Alinea a la grilla de escala para poder re-escalar el mundo debajo
+            left, top = rect.left // scale, rect.top // scale
+            right, bottom = -(-rect.right // scale), -(-rect.bottom // scale)
+            world_rect = pygame.Rect(left, top, right - left, bottom - top).clip(world_bounds)
+            if not world_rect:
+                continue
+            target = self.output.present_rect(self.view, world_rect)
+            self.screen.set_clip(target)
+            for surf, pos in items:
+                if target.colliderect(surf.get_rect(topleft=pos)):
+                    self.screen.blit(surf, pos)
+            self.screen.set_clip(None)
+            presented.append(target)
+        if presented:
+            pygame.display.update(presented)
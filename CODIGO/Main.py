@@ -1,7 +1,10 @@
-from Config import CFG
-from Game import Game
+import time
+
+STARTED_AT = time.perf_counter()  # antes de importar pygame y el juego
+
+from Config import CFG  # noqa: E402
+from Game import Game  # noqa: E402
 
 if __name__ == "__main__":
-    Game(CFG).run()
-    
-        
\ No newline at end of file
+    # Ventana + intro enseguida; el resto se carga en un hilo durante la intro
+    Game(CFG, background_load=True, started_at=STARTED_AT).run()
@@ -1,9 +1,20 @@
 import pygame
+from Resources import RESOURCES
+from Text import atlas_for
 
 class Minimap:
-    def __init__(self, cell: int = 20, padding: int = 10) -> None:
+    """
+    Superficie persistente: se arma completa al cambiar de dungeon y después
+    sólo se repintan las celdas que avisa `Dungeon.move` (sala que se deja y
+    sala nueva). `version` sube cada vez que la superficie cambia.
+    """
+
+    def __init__(self, cell: int = 20, padding: int = 10, view: int = 15) -> None:
         self.cell = cell
         self.padding = padding
+        # Máximo de celdas por lado; en grillas más grandes se muestra una
+        # ventana centrada en el jugador que se desplaza con él.
+        self.view = view
 
         # Colores
         self.bg       = (20, 20, 20)
@@ -17,72 +28,164 @@ class Minimap:
         self.show_shop_icon = True
         self._font = None  # se inicializa lazy en render()
 
+        # Estado persistente
+        self.surface: pygame.Surface | None = None
+        self.version = 0
+        self._dungeon = None
+        self._origin = (0, 0)
+        self._view_size = (0, 0)
+        self._pending: set[tuple[int, int]] = set()
+        # Lo último que se pintó; si el dungeon cambió por fuera de `move`
+        # (p.ej. al cargar una partida) no coincide y se rearma todo.
+        self._drawn_pos = None
+        self._drawn_explored = -1
+
     def _get_font(self) -> pygame.font.Font:
         if self._font is None:
             # Tamaño proporcional a la celda
             size = max(10, int(self.cell * 0.75))
-            self._font = pygame.font.SysFont(None, size)
+            self._font = RESOURCES.font(None, size)
         return self._font
 
+    # ------------------ notificaciones ------------------ #
+    def attach(self, dungeon) -> None:
+        """Se suscribe a los movimientos de `dungeon` (y se desuscribe del anterior)."""
+        old = self._dungeon
+        if old is not None and self._on_move in getattr(old, "move_listeners", ()):
+            old.move_listeners.remove(self._on_move)
+        self._dungeon = dungeon
+        listeners = getattr(dungeon, "move_listeners", None)
+        if listeners is not None:
+            listeners.append(self._on_move)
+        self.surface = None
+
+    def _on_move(self, prev, new) -> None:
+        self._pending.add(prev)
+        self._pending.add(new)
+
+    # ------------------ render ------------------ #
     def render(self, dungeon) -> pygame.Surface:
-        gw = int(getattr(dungeon, "grid_w", 3))
-        gh = int(getattr(dungeon, "grid_h", 3))
+        if dungeon is not self._dungeon:
+            self.attach(dungeon)
         explored = getattr(dungeon, "explored", set())
         cur = (int(getattr(dungeon, "i", 0)), int(getattr(dungeon, "j", 0)))
 
-        w = gw * self.cell + self.padding * 2
-        h = gh * self.cell + self.padding * 2
+        if self.surface is None or not self._in_sync(cur, explored):
+            self._build(dungeon, cur)
+        else:
+            origin = self._origin_for(dungeon, cur)
+            if origin != self._origin:
+                self._scroll_to(dungeon, origin)
+            if self._pending:
+                for pos in self._pending:
+                    self._draw_cell(dungeon, pos)
+                self.version += 1
+        self._pending.clear()
+        self._drawn_pos = cur
+        self._drawn_explored = len(explored)
+        return self.surface
+
+    def _in_sync(self, cur, explored) -> bool:
+        """Lo pintado + lo pendiente explica el estado actual del dungeon."""
+        if cur != self._drawn_pos and cur not in self._pending:
+            return False
+        new_cells = len(explored) - self._drawn_explored
+        return 0 <= new_cells <= len(self._pending)
+
+    def _origin_for(self, dungeon, cur) -> tuple[int, int]:
+        gw = int(getattr(dungeon, "grid_w", 3))
+        gh = int(getattr(dungeon, "grid_h", 3))
+        vw, vh = self._view_size
+        return (max(0, min(cur[0] - vw // 2, gw - vw)),
+                max(0, min(cur[1] - vh // 2, gh - vh)))
 
-        surf = pygame.Surface((w, h))  # opaco
+    def _build(self, dungeon, cur) -> None:
+        gw = int(getattr(dungeon, "grid_w", 3))
+        gh = int(getattr(dungeon, "grid_h", 3))
+        vw = min(gw, self.view)
+        vh = min(gh, self.view)
+        self._view_size = (vw, vh)
+        self._origin = self._origin_for(dungeon, cur)
+
+        w = vw * self.cell + self.padding * 2
+        h = vh * self.cell + self.padding * 2
+        if self.surface is None or self.surface.get_size() != (w, h):
+            self.surface = pygame.Surface((w, h))  # opaco
+        surf = self.surface
         surf.fill(self.bg)
         pygame.draw.rect(surf, self.border, (0, 0, w, h), 2)
 
-        # Cache de font si se va a usar el icono
-        font = self._get_font() if self.show_shop_icon else None
-        shop_glyph = None
-        if font:
-            shop_glyph = font.render("$", True, (10, 10, 10))  # sombra oscura
-            shop_glyph2 = font.render("$", True, (255, 255, 255))  # brillo
+        ox, oy = self._origin
+        for j in range(oy, oy + vh):
+            for i in range(ox, ox + vw):
+                self._draw_cell(dungeon, (i, j))
+        self.version += 1
+
+    def _scroll_to(self, dungeon, origin) -> None:
+        """Desplaza la ventana: mueve los píxeles y pinta sólo la franja nueva."""
+        (ox, oy), (nx, ny) = self._origin, origin
+        vw, vh = self._view_size
+        dx, dy = nx - ox, ny - oy
+        self._origin = origin
+        if abs(dx) >= vw or abs(dy) >= vh:
+            for j in range(ny, ny + vh):
+                for i in range(nx, nx + vw):
+                    self._draw_cell(dungeon, (i, j))
         else:
-            shop_glyph2 = None
-
-        for j in range(gh):
-            for i in range(gw):
-                x = self.padding + i * self.cell
-                y = self.padding + j * self.cell
-                rect = pygame.Rect(x, y, self.cell - 2, self.cell - 2)
-
-                # Base: color de grilla
-                color = self.grid
-
-                # Info de la sala (si existe)
-                room = dungeon.rooms.get((i, j)) if hasattr(dungeon, "rooms") else None
-                room_type = getattr(room, "type", "normal")
-
-                # Exploración / Tienda
-                if (i, j) in explored:
-                    if room_type == "shop":
-                        color = self.shop_col
-                    else:
-                        color = self.explored
-
-                # Jugador actual sobreescribe el color
-                if (i, j) == cur:
-                    color = self.current
-
-                # Dibujo del bloque
-                pygame.draw.rect(surf, color, rect)
-
-                # Icono de tienda (encima del rect), sólo si existe la sala
-                if self.show_shop_icon and room_type == "shop":
-                    # Muestra el icono si ya fue explorada (comportamiento típico)
-                    if (i, j) in explored and shop_glyph and shop_glyph2:
-                        # Centrar el texto en la celda
-                        gx = rect.x + rect.w // 2
-                        gy = rect.y + rect.h // 2
-                        # Sombra leve
-                        surf.blit(shop_glyph, shop_glyph.get_rect(center=(gx+1, gy+1)))
-                        # Glifo principal
-                        surf.blit(shop_glyph2, shop_glyph2.get_rect(center=(gx, gy)))
-
-        return surf
+            grid = self.surface.subsurface(
+                (self.padding, self.padding, vw * self.cell, vh * self.cell))
+            grid.scroll(-dx * self.cell, -dy * self.cell)
+            cols = range(nx + vw - dx, nx + vw) if dx > 0 else range(nx, nx - dx)
+            rows = range(ny + vh - dy, ny + vh) if dy > 0 else range(ny, ny - dy)
+            for i in cols:
+                for j in range(ny, ny + vh):
+                    self._draw_cell(dungeon, (i, j))
+            for j in rows:
+                for i in range(nx, nx + vw):
+                    self._draw_cell(dungeon, (i, j))
+        self.version += 1
+
+    def _draw_cell(self, dungeon, pos) -> None:
+        i, j = pos
+        ox, oy = self._origin
+        vw, vh = self._view_size
+        if not (ox <= i < ox + vw and oy <= j < oy + vh):
+            return
+        x = self.padding + (i - ox) * self.cell
+        y = self.padding + (j - oy) * self.cell
+        surf = self.surface
+        # Fondo de la celda completa (incluye el hueco entre bloques)
+        surf.fill(self.bg, (x, y, self.cell, self.cell))
+        rect = pygame.Rect(x, y, self.cell - 2, self.cell - 2)
+
+        explored = getattr(dungeon, "explored", set())
+        cur = (int(getattr(dungeon, "i", 0)), int(getattr(dungeon, "j", 0)))
+
+        # Info de la sala (si existe), sin materializarla
+        room_type = dungeon.room_type(pos) or "normal"
+
+        # Base: color de grilla; exploración / tienda
+        color = self.grid
+        if pos in explored:
+            color = self.shop_col if room_type == "shop" else self.explored
+
+        # Jugador actual sobreescribe el color
+        if pos == cur:
+            color = self.current
+
+        # Dibujo del bloque
+        pygame.draw.rect(surf, color, rect)
+
+        # Icono de tienda (encima del rect), sólo si ya fue explorada
+        if self.show_shop_icon and room_type == "shop" and pos in explored:
+            # Glifos del atlas: se rasterizan una vez, no en cada render
+            font = self._get_font()
+            shop_glyph = atlas_for(font, (10, 10, 10)).render("$")  # sombra oscura
+            shop_glyph2 = atlas_for(font, (255, 255, 255)).render("$")  # brillo
+            # Centrar el texto en la celda
+            gx = rect.x + rect.w // 2
+            gy = rect.y + rect.h // 2
+            # Sombra leve
+            surf.blit(shop_glyph, shop_glyph.get_rect(center=(gx+1, gy+1)))
+            # Glifo principal
+            surf.blit(shop_glyph2, shop_glyph2.get_rect(center=(gx, gy)))
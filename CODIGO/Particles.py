@@ -0,0 +1,186 @@
+"""Partículas (chispas de impacto, estallidos de muerte) en columnas de capacidad fija.
+
+Cada partícula es una fila de columnas paralelas: posición, velocidad, vida
+restante, vida total y estilo (índice a un color + tamaño). Las vivas
+quedan empaquetadas en `[0, count)`; al morir se compactan.
+
+- Con NumPy las columnas son `ndarray` y `update` es vectorizado.
+- NumPy es opcional: sin él se usan las mismas columnas en `array` y bucles.
+
+Hay un tope duro (`capacity`) y un presupuesto de partículas nuevas por
+frame (`emit_budget`): lo que no entra se descarta y se cuenta en `dropped`,
+así una lluvia de impactos no puede hundir el frame.
+"""
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from typing import Dict, List, Tuple
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+FADE_LEVELS = 4   # sprites por estilo: de casi transparente a opaco
+DRAG = 4.0        # 1/s: cuánto frena cada partícula
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = 512, emit_budget: int = 64, use_numpy: bool | None = None) -> None:
+        self.capacity = max(1, int(capacity))
+        self.emit_budget = max(0, int(emit_budget))
+        self.numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        self.count = 0
+        self.dropped = 0               # descartadas por tope o presupuesto (acumulado)
+        self._budget_left = self.emit_budget
+        n = self.capacity
+        if self.numpy:
+            self._x, self._y, self._vx, self._vy, self._life, self._max_life = (
+                np.zeros(n, dtype=np.float32) for _ in range(6))
+            self._style = np.zeros(n, dtype=np.uint16)
+            self._rng = np.random.default_rng()
+        else:
+            self._x, self._y, self._vx, self._vy, self._life, self._max_life = (
+                array("f", bytes(4 * n)) for _ in range(6))
+            self._style = array("H", bytes(2 * n))
+            self._rng = random.Random()
+        # Estilo = (color, tamaño) → índice; sprites[índice][nivel de fade]
+        self._styles: Dict[Tuple[tuple, int], int] = {}
+        self._sprites: List[List[pygame.Surface]] = []
+
+    # ------------------------------------------------------------------ #
+    # Estilos / sprites
+    # ------------------------------------------------------------------ #
+    def _style_index(self, color, size: int) -> int:
+        key = (tuple(color), int(size))
+        idx = self._styles.get(key)
+        if idx is None:
+            idx = self._styles[key] = len(self._sprites)
+            levels = []
+            for level in range(FADE_LEVELS):
+                dot = pygame.Surface((size, size), pygame.SRCALPHA)
+                dot.fill((*key[0][:3], 255 * (level + 1) // FADE_LEVELS))
+                levels.append(dot)
+            self._sprites.append(levels)
+        return idx
+
+    # ------------------------------------------------------------------ #
+    # Emisión
+    # ------------------------------------------------------------------ #
+    def emit(self, x: float, y: float, amount: int, color, size: int = 2,
+             speed: Tuple[float, float] = (40.0, 140.0),
+             life: Tuple[float, float] = (0.15, 0.35)) -> int:
+        """Hasta `amount` partículas en (x, y) en direcciones al azar; devuelve cuántas salieron."""
+        n = min(int(amount), self._budget_left, self.capacity - self.count)
+        self.dropped += max(0, int(amount) - max(0, n))
+        if n <= 0:
+            return 0
+        self._budget_left -= n
+        style = self._style_index(color, size)
+        x -= size / 2  # se guarda la esquina del sprite
+        y -= size / 2
+        start, end = self.count, self.count + n
+        if self.numpy:
+            rng = self._rng
+            angle = rng.uniform(0.0, math.tau, n)
+            mag = rng.uniform(speed[0], speed[1], n)
+            self._x[start:end] = x
+            self._y[start:end] = y
+            self._vx[start:end] = np.cos(angle) * mag
+            self._vy[start:end] = np.sin(angle) * mag
+            lives = rng.uniform(life[0], life[1], n)
+            self._life[start:end] = lives
+            self._max_life[start:end] = lives
+            self._style[start:end] = style
+        else:
+            uniform = self._rng.uniform
+            for i in range(start, end):
+                angle = uniform(0.0, math.tau)
+                mag = uniform(speed[0], speed[1])
+                self._x[i] = x
+                self._y[i] = y
+                self._vx[i] = math.cos(angle) * mag
+                self._vy[i] = math.sin(angle) * mag
+                self._life[i] = self._max_life[i] = uniform(life[0], life[1])
+                self._style[i] = style
+        self.count = end
+        return n
+
+    def clear(self) -> None:
+        self.count = 0
+
+    # ------------------------------------------------------------------ #
+    # Simulación
+    # ------------------------------------------------------------------ #
+    def update(self, dt: float) -> None:
+        """Mueve, frena y envejece todo; compacta las muertas. Repone el presupuesto."""
+        self._budget_left = self.emit_budget
+        n = self.count
+        if not n:
+            return
+        damp = max(0.0, 1.0 - DRAG * dt)
+        if self.numpy:
+            x, y, vx, vy = self._x[:n], self._y[:n], self._vx[:n], self._vy[:n]
+            life = self._life[:n]
+            x += vx * dt
+            y += vy * dt
+            vx *= damp
+            vy *= damp
+            life -= dt
+            alive = life > 0.0
+            live = int(np.count_nonzero(alive))
+            if live != n:
+                for col in (self._x, self._y, self._vx, self._vy, self._life, self._max_life, self._style):
+                    col[:live] = col[:n][alive]
+            self.count = live
+            return
+        x, y, vx, vy, life = self._x, self._y, self._vx, self._vy, self._life
+        max_life, style = self._max_life, self._style
+        live = 0
+        for i in range(n):
+            remaining = life[i] - dt
+            if remaining <= 0.0:
+                continue
+            x[live] = x[i] + vx[i] * dt
+            y[live] = y[i] + vy[i] * dt
+            vx[live] = vx[i] * damp
+            vy[live] = vy[i] * damp
+            life[live] = remaining
+            max_life[live] = max_life[i]
+            style[live] = style[i]
+            live += 1
+        self.count = live
+
+    # ------------------------------------------------------------------ #
+    # Dibujo
+    # ------------------------------------------------------------------ #
+    def render_items(self, view: pygame.Rect | None = None) -> list:
+        """(sprite, destino) de cada partícula viva (o de las que caen en `view`)."""
+        n = self.count
+        if not n:
+            return []
+        sprites = self._sprites
+        if self.numpy:
+            x = self._x[:n].astype(np.int32)
+            y = self._y[:n].astype(np.int32)
+            level = (self._life[:n] * FADE_LEVELS / self._max_life[:n]).astype(np.int32)
+            np.clip(level, 0, FADE_LEVELS - 1, out=level)
+            style = self._style[:n]
+            if view is not None:
+                mask = (x >= view.left - 4) & (x < view.right) & (y >= view.top - 4) & (y < view.bottom)
+                x, y, level, style = x[mask], y[mask], level[mask], style[mask]
+            return [(sprites[s][lv], (px, py))
+                    for s, lv, px, py in zip(style.tolist(), level.tolist(), x.tolist(), y.tolist())]
+        items = []
+        top = FADE_LEVELS - 1
+        for i in range(n):
+            px, py = int(self._x[i]), int(self._y[i])
+            if view is not None and not (view.left - 4 <= px < view.right and view.top - 4 <= py < view.bottom):
+                continue
+            level = min(top, int(self._life[i] * FADE_LEVELS / self._max_life[i]))
+            items.append((sprites[self._style[i]][level], (px, py)))
+        return items
@@ -1,11 +1,35 @@
 import math
+import random
+from array import array
 
 import pygame
 
+from AssetAtlas import load_atlas, parse_sprite_name
 from Entity import Entity
+from Render import solid_surface
+from Resources import RESOURCES
 from Config import CFG
 from Weapons import WeaponFactory
 
+# Niveles de alfa de la estela del dash (sprites pre-horneados por tamaño)
+TRAIL_ALPHA_LEVELS = 16
+_TRAIL_RAMPS: dict[tuple[int, int], list[pygame.Surface]] = {}
+
+
+def _trail_ramp(width: int, height: int) -> list[pygame.Surface]:
+    """Rectángulos redondeados blancos de alfa creciente, uno por nivel."""
+    ramp = _TRAIL_RAMPS.get((width, height))
+    if ramp is None:
+        ramp = []
+        for level in range(TRAIL_ALPHA_LEVELS):
+            fade = (level + 0.5) / TRAIL_ALPHA_LEVELS
+            alpha = max(35, min(int(220 * fade), 230))
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, (255, 255, 255, alpha), sprite.get_rect(), border_radius=4)
+            ramp.append(sprite)
+        _TRAIL_RAMPS[(width, height)] = ramp
+    return ramp
+
 
 class Player(Entity):
     def __init__(self, x: float, y: float) -> None:
@@ -16,6 +40,8 @@ class Player(Entity):
         self._owned_weapons: set[str] = set()
         self.weapon_id: str | None = None
         self.weapon = None
+        # Flujo aleatorio para las armas (Game asigna el de la run)
+        self.rng: random.Random | None = None
 
         # --- Atributos de supervivencia y movilidad ---
         self.max_hp = 3
@@ -39,7 +65,11 @@ class Player(Entity):
         self._dash_key_down = False
         self._dash_dir = (0.0, -1.0)
         self._last_move_dir = (0.0, -1.0)
-        self._dash_trail: list[dict[str, float | tuple[float, float]]] = []
+        # Estela: buffer circular de (x, y, timer) en floats; _dash_trail_head
+        # es el segmento más viejo y _dash_trail_count cuántos hay vivos.
+        self._dash_trail = array("d")
+        self._dash_trail_head = 0
+        self._dash_trail_count = 0
         self.dash_trail_duration = 0.22
         self.dash_trail_spacing = 6.0
         self.dash_trail_max_segments = 48
@@ -176,6 +206,9 @@ class Player(Entity):
         # origen: centro del jugador
         cx = self.x + self.w / 2
         cy = self.y + self.h / 2
+        if callable(getattr(out_projectiles, "spawn_volley", None)):
+            self.weapon.fire_into((cx, cy), (mx, my), out_projectiles)
+            return
         created = self.weapon.fire((cx, cy), (mx, my))
         if not created:
             return
@@ -186,8 +219,14 @@ class Player(Entity):
             else:
                 out_projectiles.append(bullet)
 
-    def draw(self, surf):
-        self._draw_dash_trail(surf)
+    def draw(self, surf) -> pygame.Rect:
+        """Dibuja estela + sprite y devuelve el rect que abarca todo lo dibujado."""
+        rects = surf.blits(self.render_items())
+        return rects[-1].unionall(rects[:-1])
+
+    def render_items(self) -> list:
+        """Estela (de la más vieja a la más nueva) y sprite, como (superficie, destino)."""
+        items = self._dash_trail_items()
         if self._animation_enabled and self._animations:
             frames = self._animations.get(self._animation_state)
             if frames:
@@ -197,10 +236,12 @@ class Player(Entity):
                     int(self.x + self.w / 2),
                     int(self.y + self.h / 2),
                 )
-                surf.blit(frame, rect)
-                return
+                items.append((frame, rect.topleft))
+                return items
 
-        pygame.draw.rect(surf, CFG.COLOR_PLAYER, self.rect())
+        rect = self.rect()
+        items.append((solid_surface(rect.size, CFG.COLOR_PLAYER), rect.topleft))
+        return items
 
     def _player_center(self) -> tuple[float, float]:
         return (self.x + self.w / 2, self.y + self.h / 2)
@@ -211,9 +252,16 @@ class Player(Entity):
         dash_active: bool,
         current_center: tuple[float, float],
     ) -> None:
-        for segment in self._dash_trail:
-            segment["timer"] -= dt
-        self._dash_trail = [seg for seg in self._dash_trail if seg["timer"] > 0.0]
+        trail = self._dash_trail
+        capacity = len(trail) // 3
+        idx = self._dash_trail_head
+        for _ in range(self._dash_trail_count):
+            trail[idx * 3 + 2] -= dt
+            idx = (idx + 1) % capacity
+        # Todos duran lo mismo y se crean en orden: vencen desde el más viejo
+        while self._dash_trail_count and trail[self._dash_trail_head * 3 + 2] <= 0.0:
+            self._dash_trail_head = (self._dash_trail_head + 1) % capacity
+            self._dash_trail_count -= 1
 
         if not dash_active:
             self._dash_trail_distance_accum = 0.0
@@ -245,43 +293,49 @@ class Player(Entity):
         self._dash_trail_last_center = current_center
 
     def _spawn_dash_trail_segment(self, center: tuple[float, float]) -> None:
-        segment = {
-            "pos": (float(center[0]), float(center[1])),
-            "timer": self.dash_trail_duration,
-        }
-        self._dash_trail.append(segment)
-        if len(self._dash_trail) > self.dash_trail_max_segments:
-            self._dash_trail = self._dash_trail[-self.dash_trail_max_segments:]
+        capacity = len(self._dash_trail) // 3
+        if self._dash_trail_count == capacity:
+            # Lleno: se pisa el más viejo
+            self._dash_trail_head = (self._dash_trail_head + 1) % capacity
+            self._dash_trail_count -= 1
+        base = (self._dash_trail_head + self._dash_trail_count) % capacity * 3
+        self._dash_trail[base] = center[0]
+        self._dash_trail[base + 1] = center[1]
+        self._dash_trail[base + 2] = self.dash_trail_duration
+        self._dash_trail_count += 1
 
     def _reset_dash_trail_state(self) -> None:
-        self._dash_trail.clear()
+        capacity = max(1, self.dash_trail_max_segments)
+        if len(self._dash_trail) != capacity * 3:
+            self._dash_trail = array("d", bytes(capacity * 3 * 8))
+        self._dash_trail_head = 0
+        self._dash_trail_count = 0
         self._dash_trail_distance_accum = 0.0
         self._dash_trail_last_center = self._player_center()
 
-    def _draw_dash_trail(self, surf) -> None:
-        if not self._dash_trail:
-            return
-        duration = max(0.001, self.dash_trail_duration)
-        for segment in self._dash_trail:
-            remaining = max(0.0, min(duration, segment["timer"]))
-            if remaining <= 0.0:
-                continue
-            fade = remaining / duration
-            alpha = int(220 * fade)
-            alpha = max(35, min(alpha, 230))
-            cx, cy = segment["pos"]
-            width = self.w + 4
-            height = self.h + 4
-            trail_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-            pygame.draw.rect(
-                trail_surf,
-                (255, 255, 255, alpha),
-                trail_surf.get_rect(),
-                border_radius=4,
-            )
-            rect = trail_surf.get_rect()
-            rect.center = (int(cx), int(cy))
-            surf.blit(trail_surf, rect)
+    def _draw_dash_trail(self, surf) -> list[pygame.Rect]:
+        return surf.blits(self._dash_trail_items())
+
+    def _dash_trail_items(self) -> list:
+        if not self._dash_trail_count:
+            return []
+        width = self.w + 4
+        height = self.h + 4
+        ramp = _trail_ramp(width, height)
+        top = TRAIL_ALPHA_LEVELS - 1
+        scale = TRAIL_ALPHA_LEVELS / max(0.001, self.dash_trail_duration)
+        trail = self._dash_trail
+        capacity = len(trail) // 3
+        half_w, half_h = width // 2, height // 2
+        blits = []
+        idx = self._dash_trail_head
+        for _ in range(self._dash_trail_count):
+            base = idx * 3
+            level = min(top, int(trail[base + 2] * scale))
+            blits.append((ramp[level], (int(trail[base]) - half_w, int(trail[base + 1]) - half_h)))
+            idx = (idx + 1) % capacity
+        # Del más viejo al más nuevo, como antes: el más opaco queda arriba
+        return blits
 
     # ------------------------------------------------------------------
     # Armas
@@ -319,13 +373,56 @@ class Player(Entity):
     def equip_weapon(self, weapon_id: str) -> None:
         if weapon_id not in self._owned_weapons:
             return
-        self.weapon = self._weapon_factory.create(weapon_id, cooldown_scale=self.cooldown_scale)
+        self.weapon = self._weapon_factory.create(
+            weapon_id, cooldown_scale=self.cooldown_scale, rng=self.rng
+        )
         self.weapon_id = weapon_id
 
     def _grant_weapon(self, weapon_id: str) -> None:
         if weapon_id in self._weapon_factory:
             self._owned_weapons.add(weapon_id)
 
+    def owned_weapons(self) -> list[str]:
+        return sorted(self._owned_weapons)
+
+    # ------------------------------------------------------------------
+    # Persistencia (guardado de run)
+    # ------------------------------------------------------------------
+    def get_state(self) -> dict:
+        """Posición, loadout, oro y vidas para guardar la run."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "speed": self.speed,
+            "cooldown_scale": self.cooldown_scale,
+            "gold": self.gold,
+            "hp": self.hp,
+            "max_hp": self.max_hp,
+            "lives": self.lives,
+            "max_lives": self.max_lives,
+            "weapons": self.owned_weapons(),
+            "weapon_id": self.weapon_id,
+        }
+
+    def apply_state(self, state: dict) -> None:
+        """Restaura lo guardado por `get_state`."""
+        self.reset_loadout()
+        self.x, self.y = state["x"], state["y"]
+        self.speed = state["speed"]
+        self.cooldown_scale = state["cooldown_scale"]
+        self.gold = state["gold"]
+        self.max_hp = state["max_hp"]
+        self.hp = min(state["hp"], self.max_hp)
+        self._hits_taken_current_life = self.max_hp - self.hp
+        self.max_lives = state["max_lives"]
+        self.lives = state["lives"]
+        for weapon_id in state["weapons"]:
+            self._grant_weapon(weapon_id)
+        if state["weapon_id"]:
+            self.equip_weapon(state["weapon_id"])
+        self.refresh_weapon_modifiers()
+        self._reset_dash_trail_state()
+
     # -------------------- Modificadores persistentes -------------------
     def refresh_weapon_modifiers(self) -> None:
         """Reaplica mejoras acumuladas al arma equipada."""
@@ -399,6 +496,13 @@ class Player(Entity):
         return next(iter(self._animations))
 
     def _build_animations(self) -> dict[str, list[pygame.Surface]]:
+        # Atlas empaquetado (una sola imagen) si está al día; si no, archivos sueltos
+        atlas = load_atlas()
+        if atlas is not None:
+            animations = atlas.animations("player")
+            if animations:
+                return self._ensure_idle_animation(animations)
+
         asset_dir = CFG.asset_path("player")
         if not asset_dir.exists():
             print(
@@ -422,24 +526,13 @@ class Player(Entity):
 
         grouped: dict[str, dict[int, pygame.Surface]] = {}
         for sprite_path in sprite_paths:
-            suffix = sprite_path.stem[7:]
-            if not suffix:
-                continue
-
-            parts = suffix.split("_")
-            frame_index = 0
-            if parts[-1].isdigit():
-                frame_index = int(parts[-1])
-                state_name = "_".join(parts[:-1]) or "idle"
-            else:
-                state_name = "_".join(parts)
-
-            state_name = state_name.lower().strip()
-            if not state_name:
+            parsed = parse_sprite_name(sprite_path.stem)
+            if parsed is None:
                 continue
+            state_name, frame_index = parsed
 
             try:
-                surface = pygame.image.load(str(sprite_path)).convert_alpha()
+                surface = RESOURCES.image(sprite_path)
             except (pygame.error, FileNotFoundError) as exc:
                 print(
                     f"[Player] Falló la carga de '{sprite_path.name}': {exc}. Se ignora el archivo.",
@@ -461,6 +554,11 @@ class Player(Entity):
             )
             return {}
 
+        return self._ensure_idle_animation(animations)
+
+    def _ensure_idle_animation(
+        self, animations: dict[str, list[pygame.Surface]]
+    ) -> dict[str, list[pygame.Surface]]:
         if "idle" not in animations:
             first_state, first_frames = next(iter(animations.items()))
             print(
@@ -1,8 +1,27 @@
-from typing import Iterator, List
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 
 import pygame
 from Config import CFG
 
+_DOTS: Dict[Tuple[int, tuple], pygame.Surface] = {}
+
+
+def _dot(radius: int, color) -> pygame.Surface:
+    """Círculo pre-dibujado (mismo trazo que `draw.circle`), centrado en
+    (radius + 1, radius + 1). Con colorkey y no alfa: se copia sin mezclar."""
+    key = (radius, color)
+    dot = _DOTS.get(key)
+    if dot is None:
+        side = radius * 2 + 2
+        dot = pygame.Surface((side, side))
+        keycolor = (0, 0, 0) if tuple(color)[:3] != (0, 0, 0) else (255, 0, 255)
+        dot.fill(keycolor)
+        dot.set_colorkey(keycolor)
+        pygame.draw.circle(dot, color, (radius + 1, radius + 1), radius)
+        _DOTS[key] = dot
+    return dot
+
+
 class Projectile:
     def __init__(self, x, y, dx, dy, speed=320.0, radius=3, color=(255,230,140)):
         self.x, self.y = x, y
@@ -10,8 +29,10 @@ class Projectile:
         self.speed = speed
         self.radius = radius
         self.alive = True
+        self.hit_wall = False  # murió contra una pared (y no por ttl)
         self.ttl = 3.5
         self.color = color
+        self.sprite = _dot(radius, color)
         # Temporizador para ignorar colisiones con el jugador tras un dash.
         self.ignore_player_timer = 0.0
 
@@ -37,12 +58,14 @@ class Projectile:
         if self._collides(room):
             self.x -= step_x
             self.alive = False
+            self.hit_wall = True
             return
 
         self.y += step_y
         if self._collides(room):
             self.y -= step_y
             self.alive = False
+            self.hit_wall = True
 
     def _collides(self, room) -> bool:
         r = self.rect()
@@ -55,8 +78,13 @@ class Projectile:
                     return True
         return False
 
-    def draw(self, surf):
-        pygame.draw.circle(surf, self.color, (int(self.x), int(self.y)), self.radius)
+    def render_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """(superficie, destino) para la cola de dibujo."""
+        offset = self.radius + 1
+        return self.sprite, (int(self.x) - offset, int(self.y) - offset)
+
+    def draw(self, surf) -> pygame.Rect:
+        return surf.blit(*self.render_item())
 
 
 class ProjectileGroup:
@@ -68,20 +96,60 @@ class ProjectileGroup:
     def add(self, projectile: Projectile) -> None:
         self._items.append(projectile)
 
+    def spawn_volley(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        dxs: Sequence[float],
+        dys: Sequence[float],
+        speed: float = 320.0,
+        radius: int = 3,
+        color=(255, 230, 140),
+    ) -> None:
+        """Agrega una ráfaga completa recibida como columnas paralelas.
+        El grupo sigue guardando objetos `Projectile`: las columnas se
+        desarman acá, en un solo bucle."""
+        append = self._items.append
+        for x, y, dx, dy in zip(xs, ys, dxs, dys):
+            append(Projectile(x, y, dx, dy, speed, radius, color))
+
     def clear(self) -> None:
         self._items.clear()
 
-    def update(self, dt: float, room) -> None:
+    def update(self, dt: float, room, on_wall_hit: Callable[[Projectile], None] | None = None) -> None:
+        """Avanza todos; `on_wall_hit(p)` se llama por cada uno que choca una pared."""
         for projectile in self._items:
             projectile.update(dt, room)
+            if on_wall_hit is not None and projectile.hit_wall:
+                on_wall_hit(projectile)
         self.prune()
 
     def prune(self) -> None:
         self._items = [p for p in self._items if p.alive]
 
-    def draw(self, surf) -> None:
+    def draw(self, surf, view: pygame.Rect | None = None) -> List[pygame.Rect]:
+        """Dibuja todos (o sólo los que tocan `view`) y devuelve los rects tocados."""
+        return surf.blits(self.render_items(view))
+
+    def render_items(self, view: pygame.Rect | None = None) -> list:
+        """(superficie, destino) de cada proyectil (o de los que tocan `view`).
+        En línea y no con `render_item`: son cientos por frame."""
+        items = []
+        append = items.append
+        if view is None:
+            left = top = -(1 << 30)
+            right = bottom = 1 << 30
+        else:
+            # Margen fijo (radios chicos) para que el test sea sólo comparar floats
+            margin = 8
+            left, top = view.left - margin, view.top - margin
+            right, bottom = view.right + margin, view.bottom + margin
         for projectile in self._items:
-            projectile.draw(surf)
+            x, y = projectile.x, projectile.y
+            if left <= x < right and top <= y < bottom:
+                offset = projectile.radius + 1
+                append((projectile.sprite, (int(x) - offset, int(y) - offset)))
+        return items
 
     def __iter__(self) -> Iterator[Projectile]:
         return iter(self._items)
@@ -0,0 +1,239 @@
+"""Utilidades de render: cola por capas, cámara, salida escalada a pantalla y rectángulos sucios entre frames."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import pygame
+
+# Capas de la cola de dibujo, de abajo hacia arriba
+LAYER_BACKGROUND = 0   # chunks de suelo/paredes
+LAYER_DOORS = 10       # rejas de puertas bloqueadas
+LAYER_ENEMIES = 20
+LAYER_PLAYER = 30      # estela del dash + sprite
+LAYER_PROJECTILES = 40
+LAYER_PARTICLES = 45   # chispas y estallidos
+LAYER_FOG = 48         # niebla de guerra
+LAYER_OVERLAY = 50     # mercader, carteles
+LAYER_NAMES: Dict[int, str] = {
+    LAYER_BACKGROUND: "fondo",
+    LAYER_DOORS: "puertas",
+    LAYER_ENEMIES: "enemigos",
+    LAYER_PLAYER: "jugador",
+    LAYER_PROJECTILES: "proyectiles",
+    LAYER_PARTICLES: "partículas",
+    LAYER_FOG: "niebla",
+    LAYER_OVERLAY: "overlay",
+}
+
+_SOLIDS: Dict[Tuple[Tuple[int, int], Tuple[int, ...]], pygame.Surface] = {}
+
+
+def solid_surface(size: Tuple[int, int], color) -> pygame.Surface:
+    """Rectángulo de un color, cacheado: para dibujar con `blits` lo que antes era `draw.rect`."""
+    key = (tuple(size), tuple(color))
+    surf = _SOLIDS.get(key)
+    if surf is None:
+        surf = _SOLIDS[key] = pygame.Surface(size)
+        surf.fill(color)
+    return surf
+
+
+class RenderQueue:
+    """
+    Cola de dibujo por capas. Los objetos entregan tuplas (superficie,
+    destino[, área]) a una capa; `flush` recorre las capas en orden, hace un
+    solo `Surface.blits` por capa y lleva la cuenta de blits y llamadas.
+    Dentro de una capa se respeta el orden de llegada.
+    """
+
+    def __init__(self) -> None:
+        self._layers: Dict[int, list] = {}
+        self.frames = 0
+        # capa → [blits, llamadas a Surface.blits] acumulados
+        self.totals: Dict[int, List[int]] = {}
+
+    def submit(self, layer: int, surface: pygame.Surface, dest, area: pygame.Rect | None = None) -> None:
+        items = self._layers.setdefault(layer, [])
+        items.append((surface, dest) if area is None else (surface, dest, area))
+
+    def extend(self, layer: int, items: Sequence) -> None:
+        if items:
+            self._layers.setdefault(layer, []).extend(items)
+
+    def flush(self, target: pygame.Surface, track_from: int = LAYER_BACKGROUND) -> List[pygame.Rect]:
+        """Dibuja y vacía la cola; devuelve los rects tocados por las capas >= `track_from`."""
+        touched: List[pygame.Rect] = []
+        totals = self.totals
+        for layer in sorted(self._layers):
+            items = self._layers[layer]
+            if not items:
+                continue
+            if layer >= track_from:
+                touched += target.blits(items)
+            else:
+                target.blits(items, doreturn=0)
+            counts = totals.setdefault(layer, [0, 0])
+            counts[0] += len(items)
+            counts[1] += 1
+            items.clear()
+        self.frames += 1
+        return touched
+
+    def report(self) -> List[str]:
+        """Promedios por frame de cada capa, para el reporte de DEBUG_PERF."""
+        frames = max(1, self.frames)
+        return [
+            f"capa {LAYER_NAMES.get(layer, layer)}: {blits / frames:.1f} blits/frame "
+            f"en {calls / frames:.2f} llamadas"
+            for layer, (blits, calls) in sorted(self.totals.items())
+        ]
+
+
+def merge_rects(rects: Iterable[pygame.Rect], limit: int = 32) -> List[pygame.Rect]:
+    """
+    Fusiona los rects que se solapan o tocan. Si aun así quedan más de
+    `limit`, devuelve uno solo con la unión de todos.
+    """
+    pending = [pygame.Rect(r) for r in rects if r.width > 0 and r.height > 0]
+    merged: List[pygame.Rect] = []
+    while pending:
+        cur = pending.pop()
+        grown = True
+        while grown:
+            grown = False
+            # inflate(1, 1): también junta los que sólo se tocan por el borde
+            probe = cur.inflate(1, 1)
+            for group in (pending, merged):
+                idx = probe.collidelist(group)
+                while idx != -1:
+                    cur.union_ip(group.pop(idx))
+                    grown = True
+                    probe = cur.inflate(1, 1)
+                    idx = probe.collidelist(group)
+        merged.append(cur)
+    if len(merged) > limit:
+        return [merged[0].unionall(merged[1:])]
+    return merged
+
+
+class Camera:
+    """
+    Ventana del tamaño de la pantalla sobre el mundo (en px del mundo).
+    Sigue a un punto sin salirse de la sala; en salas del tamaño de la
+    pantalla queda siempre en (0, 0).
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.rect = pygame.Rect(0, 0, width, height)
+
+    def follow(self, center: tuple[float, float], world_size: tuple[int, int]) -> bool:
+        """Centra la vista en `center` dentro de `world_size`; True si se movió."""
+        w, h = self.rect.size
+        x = max(0, min(int(center[0]) - w // 2, world_size[0] - w))
+        y = max(0, min(int(center[1]) - h // 2, world_size[1] - h))
+        if (x, y) == self.rect.topleft:
+            return False
+        self.rect.topleft = (x, y)
+        return True
+
+    def to_world(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """Punto de la vista (p.ej. el mouse ya des-escalado) → mundo."""
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
+
+    def to_view(self, rect: pygame.Rect) -> pygame.Rect:
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def visible(self, rect: pygame.Rect, margin: int = 0) -> bool:
+        """¿`rect` (mundo) cae en la vista? `margin` cubre lo que se dibuja fuera del rect."""
+        return self.rect.inflate(margin * 2, margin * 2).colliderect(rect)
+
+
+class DirtyTracker:
+    """
+    Rects (en coordenadas del mundo) dibujados en el frame anterior y en el
+    actual. Los del anterior se borran restaurando el fondo; la unión de
+    ambos es lo que hay que volver a enviar a pantalla.
+    """
+
+    def __init__(self, limit: int = 32) -> None:
+        self.limit = limit
+        self.full = True  # el próximo frame se redibuja completo
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+        # Estadística del último frame (px² actualizados)
+        self.last_area = 0
+
+    def invalidate(self) -> None:
+        self.full = True
+
+    def add(self, rect: pygame.Rect | None) -> None:
+        if rect:
+            self._current.append(pygame.Rect(rect))
+
+    def extend(self, rects: Iterable[pygame.Rect | None]) -> None:
+        for rect in rects:
+            self.add(rect)
+
+    def stale(self) -> List[pygame.Rect]:
+        """Lo que se dibujó el frame anterior (a borrar antes de dibujar)."""
+        return merge_rects(self._previous, self.limit)
+
+    def flush(self) -> List[pygame.Rect] | None:
+        """Cierra el frame: rects a presentar, o None si toca redibujar todo."""
+        rects = None if self.full else merge_rects(self._previous + self._current, self.limit)
+        self._previous, self._current = self._current, []
+        self.full = False
+        self.last_area = -1 if rects is None else sum(r.width * r.height for r in rects)
+        return rects
+
+
+class ScaledOutput:
+    """
+    Lleva la superficie del mundo a la pantalla sin reservar memoria por frame.
+
+    - escala 1 (p.ej. con `pygame.SCALED`, donde escala la GPU): blit directo,
+      sin escalar.
+    - escala N > 1: `transform.scale` con la pantalla (o una subsuperficie
+      de ella) como destino, sin superficie intermedia. No hay un camino
+      aparte para ×2: `scale2x` cambia los píxeles (EPX) y `scale_by` o
+      replicar con numpy no le ganan a este.
+    - si la pantalla no admite escribir ahí, cae a un destino pre-reservado
+      una sola vez que después se copia.
+    """
+
+    def __init__(self, screen: pygame.Surface, world_size: tuple[int, int], scale: int) -> None:
+        self.screen = screen
+        self.scale = max(1, int(scale))
+        self.size = (world_size[0] * self.scale, world_size[1] * self.scale)
+        self._target: pygame.Surface | None = None
+        if self.scale == 1:
+            self.mode = "blit"
+        else:
+            self.mode = "direct"
+            try:
+                self._dest = screen.subsurface(pygame.Rect((0, 0), self.size))
+            except (ValueError, pygame.error):
+                self.mode = "target"
+                self._target = pygame.Surface(self.size).convert()
+
+    def present(self, world: pygame.Surface) -> None:
+        if self.mode == "blit":
+            self.screen.blit(world, (0, 0))
+        elif self.mode == "direct":
+            pygame.transform.scale(world, self.size, self._dest)
+        else:
+            pygame.transform.scale(world, self.size, self._target)
+            self.screen.blit(self._target, (0, 0))
+
+    def present_rect(self, world: pygame.Surface, world_rect: pygame.Rect) -> pygame.Rect:
+        """Presenta sólo `world_rect`; devuelve el rect tocado en pantalla."""
+        s = self.scale
+        target = pygame.Rect(world_rect.x * s, world_rect.y * s, world_rect.width * s, world_rect.height * s)
+        if self.mode == "blit":
+            self.screen.blit(world, target, world_rect)
+        elif self.mode == "direct":
+            pygame.transform.scale(world.subsurface(world_rect), target.size, self._dest.subsurface(target))
+        else:
+            pygame.transform.scale(world.subsurface(world_rect), target.size, self._target.subsurface(target))
+            self.screen.blit(self._target, target, target)
+        return target
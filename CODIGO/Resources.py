@@ -0,0 +1,171 @@
+"""Registro central de recursos: fuentes, imágenes y superficies derivadas.
+
+Todo se carga la primera vez que se pide y queda en cache:
+
+- fuentes por (nombre, tamaño, negrita, cursiva) con `SysFont`, y la que
+  trae pygame (`default_font`, sin escanear las del sistema);
+- imágenes por ruta (con `convert_alpha` si ya hay ventana);
+- derivadas (escaladas, teñidas, recortadas) por (operación, origen,
+  parámetros), en un LRU con tope: las que no se usan hace rato se descartan.
+
+`evict` suelta una imagen y sus derivadas; `clear` vacía todo; `report` da
+aciertos/fallos/desalojos por tipo. Todo pasa por un lock: se usa también
+desde el hilo de carga inicial.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Tuple
+
+import pygame
+
+from Config import CFG
+
+KINDS = ("fuentes", "imágenes", "derivadas")
+
+
+class Resources:
+    def __init__(self, derived_cap: int = 256) -> None:
+        self.derived_cap = max(1, int(derived_cap))
+        self._fonts: Dict[tuple, pygame.font.Font] = {}
+        self._images: Dict[str, pygame.Surface] = {}
+        self._derived: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = {kind: 0 for kind in KINDS}
+        self.misses = {kind: 0 for kind in KINDS}
+        self.evictions = 0
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------ #
+    # Fuentes / imágenes
+    # ------------------------------------------------------------------ #
+    def font(self, name: str | None, size: int, *, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+        """`SysFont(name, size)` compartida; la primera escanea las fuentes del sistema."""
+        key = (name, int(size), bold, italic)
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits["fuentes"] += 1
+                return font
+            self.misses["fuentes"] += 1
+            font = self._fonts[key] = pygame.font.SysFont(name, int(size), bold, italic)
+            return font
+
+    def default_font(self, size: int) -> pygame.font.Font:
+        """La fuente que trae pygame (`Font(None, size)`): no escanea el sistema."""
+        key = (None, int(size), "default")
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits["fuentes"] += 1
+                return font
+            self.misses["fuentes"] += 1
+            font = self._fonts[key] = pygame.font.Font(None, int(size))
+            return font
+
+    def image(self, path: str | Path) -> pygame.Surface:
+        """Imagen de `path`, cargada una sola vez. Errores de carga como en pygame."""
+        key = self._path_key(path)
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self.hits["imágenes"] += 1
+                return img
+            self.misses["imágenes"] += 1
+            img = pygame.image.load(key)
+            if pygame.display.get_surface() is not None:
+                img = img.convert_alpha()
+            self._images[key] = img
+            return img
+
+    @staticmethod
+    def _path_key(path: str | Path) -> str:
+        return str(Path(path).resolve())
+
+    # ------------------------------------------------------------------ #
+    # Derivadas
+    # ------------------------------------------------------------------ #
+    def derived(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Superficie cacheada bajo `key` (LRU); `build()` sólo corre si no está."""
+        with self._lock:
+            surf = self._derived.get(key)
+            if surf is not None:
+                self.hits["derivadas"] += 1
+                self._derived.move_to_end(key)
+                return surf
+            self.misses["derivadas"] += 1
+            surf = self._derived[key] = build()
+            while len(self._derived) > self.derived_cap:
+                self._derived.popitem(last=False)
+                self.evictions += 1
+            return surf
+
+    def _source(self, source, key: Hashable | None) -> Tuple[pygame.Surface, Hashable]:
+        """(superficie, clave) de una ruta o de una superficie con su clave."""
+        if isinstance(source, pygame.Surface):
+            if key is None:
+                raise ValueError("Con una superficie hace falta `key` para cachear sus derivadas")
+            return source, key
+        path_key = self._path_key(source)
+        with self._lock:
+            # Pedir una derivada no cuenta como acierto de la imagen de origen
+            img = self._images.get(path_key)
+            return (img if img is not None else self.image(source)), path_key
+
+    def scaled(self, source, size: Tuple[int, int], *, smooth: bool = False,
+               key: Hashable | None = None) -> pygame.Surface:
+        surf, src = self._source(source, key)
+        size = (int(size[0]), int(size[1]))
+        if surf.get_size() == size:
+            return surf
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        return self.derived(("scaled", src, size, smooth), lambda: scale(surf, size))
+
+    def tinted(self, source, color, flags: int = pygame.BLEND_RGB_MULT, *,
+               key: Hashable | None = None) -> pygame.Surface:
+        surf, src = self._source(source, key)
+
+        def build() -> pygame.Surface:
+            tinted = surf.copy()
+            tinted.fill(color, special_flags=flags)
+            return tinted
+        return self.derived(("tinted", src, tuple(color), flags), build)
+
+    def trimmed(self, source, *, key: Hashable | None = None) -> pygame.Surface:
+        """Recortada a los píxeles no transparentes."""
+        surf, src = self._source(source, key)
+        return self.derived(("trimmed", src), lambda: surf.subsurface(surf.get_bounding_rect()).copy())
+
+    # ------------------------------------------------------------------ #
+    # Desalojo / estadísticas
+    # ------------------------------------------------------------------ #
+    def evict(self, path: str | Path) -> int:
+        """Suelta la imagen de `path` y todas sus derivadas; devuelve cuántas."""
+        key = self._path_key(path)
+        with self._lock:
+            dropped = int(self._images.pop(key, None) is not None)
+            for derived_key in [k for k in self._derived if isinstance(k, tuple) and k[1:2] == (key,)]:
+                del self._derived[derived_key]
+                dropped += 1
+            self.evictions += dropped
+            return dropped
+
+    def clear(self) -> None:
+        """Vacía todo (p.ej. para medir una carga en frío)."""
+        with self._lock:
+            self._fonts.clear()
+            self._images.clear()
+            self._derived.clear()
+
+    def report(self) -> List[str]:
+        with self._lock:
+            sizes = {"fuentes": len(self._fonts), "imágenes": len(self._images),
+                     "derivadas": len(self._derived)}
+            lines = [f"{kind}: {sizes[kind]} en cache, {self.hits[kind]} aciertos, {self.misses[kind]} fallos"
+                     for kind in KINDS]
+            lines.append(f"desalojos {self.evictions} (tope de derivadas {self.derived_cap})")
+        return lines
+
+
+RESOURCES = Resources(CFG.RESOURCE_DERIVED_CAP)
@@ -0,0 +1,19 @@
+"""Flujos aleatorios independientes derivados de la seed de la run.
+
+Cada subsistema (layout, spawns, IA, armas) usa su propio `random.Random`,
+así una sala o un arma nuevos no desplazan las tiradas del resto y se
+pueden generar varias dungeons en paralelo.
+"""
+from __future__ import annotations
+
+import random
+
+
+def derive_rng(seed: int, *stream) -> random.Random:
+    """RNG estable para `stream` dentro de la run `seed`.
+
+    p.ej. ``derive_rng(seed, "spawns", 3, 4)`` para la sala (3, 4).
+    Sembrar con un str usa SHA-512, así que no depende de PYTHONHASHSEED.
+    """
+    key = ":".join(str(part) for part in (seed, *stream))
+    return random.Random(key)
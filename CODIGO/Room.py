@@ -1,10 +1,12 @@
 import pygame
+import sys
 from typing import Dict, Tuple, Optional, List, Type
 from Config import CFG
 # arriba de Room.py
 import random
-from Enemy import Enemy, FastChaserEnemy, TankEnemy, ShooterEnemy, BasicEnemy
+from Enemy import Enemy, FastChaserEnemy, TankEnemy, ShooterEnemy, BasicEnemy, enemy_from_state
 import Enemy as enemy_mod  # <- para usar enemy_mod.WANDER
+from Text import atlas_for
 
 # Plantillas de encuentros por umbral de dificultad.
 ENCOUNTER_TABLE: list[tuple[int, list[list[Type[Enemy]]]]] = [
@@ -57,21 +59,40 @@ ENCOUNTER_TABLE: list[tuple[int, list[list[Type[Enemy]]]]] = [
     ),
 ]
 
+_LOCK_BARS: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def _lock_bar(size: Tuple[int, int]) -> pygame.Surface:
+    """Reja de una puerta bloqueada (relleno rojo + borde claro), cacheada por tamaño."""
+    bar = _LOCK_BARS.get(size)
+    if bar is None:
+        bar = _LOCK_BARS[size] = pygame.Surface(size)
+        bar.fill((180, 40, 40))
+        pygame.draw.rect(bar, (255, 90, 90), bar.get_rect(), 1)
+    return bar
+
+
+# Chunk de fondo pre-renderizado, en tiles: una pantalla. Las salas normales
+# son un solo chunk; en las arenas la cámara ve como mucho 4 por frame.
+CHUNK_W, CHUNK_H = CFG.MAP_W, CFG.MAP_H
 
 
 
 class Room:
     """
-    Un cuarto sobre una grilla MAP_W x MAP_H (en tiles).
+    Un cuarto sobre una grilla map_w x map_h (en tiles): MAP_W x MAP_H, o
+    más grande en las arenas (la cámara muestra una pantalla por vez).
     - `tiles` = 1 (pared), 0 (suelo)
     - `bounds` = (rx, ry, rw, rh) en tiles: rectángulo de la habitación dentro del mapa
     - `doors` = dict con direcciones "N","S","E","W" -> bool (existe puerta hacia ese vecino)
     - Enemigos se generan 1 sola vez con `ensure_spawn(...)`
     """
 
-    def __init__(self) -> None:
+    def __init__(self, map_w: int | None = None, map_h: int | None = None) -> None:
+        self.map_w = map_w or CFG.MAP_W
+        self.map_h = map_h or CFG.MAP_H
         # mapa lleno de paredes por defecto
-        self.tiles: List[List[int]] = [[CFG.WALL for _ in range(CFG.MAP_W)] for _ in range(CFG.MAP_H)]
+        self.tiles: List[List[int]] = [[CFG.WALL for _ in range(self.map_w)] for _ in range(self.map_h)]
         self.bounds: Optional[Tuple[int, int, int, int]] = None
         self.doors: Dict[str, bool] = {"N": False, "S": False, "E": False, "W": False}
 
@@ -95,6 +116,16 @@ class Room:
         self._populated_once = False
         self.shopkeeper = None
 
+        # Flujos aleatorios propios (Dungeon los deriva de la seed y la posición)
+        self.rng = random      # spawns / encuentros
+        self.ai_rng = random   # IA de los enemigos de esta sala
+
+        # Caches de lo estático (se rearman si cambian los tiles)
+        # suelo + paredes pre-renderizados, por chunk (ver CHUNK_W/CHUNK_H)
+        self._chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._chunks_tileset = None
+        self._solid: Optional[bytearray] = None        # 1 = pared, por tile (fila mayor)
+
 
     # ------------------------------------------------------------------ #
     # Construcción de la habitación
@@ -104,16 +135,17 @@ class Room:
         Talla un rectángulo de suelo centrado en el mapa (en tiles).
         rw/rh son el tamaño de la habitación en tiles.
         """
-        rx = CFG.MAP_W // 2 - rw // 2
-        ry = CFG.MAP_H // 2 - rh // 2
+        rx = self.map_w // 2 - rw // 2
+        ry = self.map_h // 2 - rh // 2
         self.bounds = (rx, ry, rw, rh)
+        self._invalidate_caches()
         
         
 
         # Suelo dentro de la habitación
         for y in range(ry, ry + rh):
             for x in range(rx, rx + rw):
-                if 0 <= x < CFG.MAP_W and 0 <= y < CFG.MAP_H:
+                if 0 <= x < self.map_w and 0 <= y < self.map_h:
                     self.tiles[y][x] = 0
                     
                     
@@ -129,12 +161,13 @@ class Room:
         assert self.bounds is not None
         rx, ry, rw, rh = self.bounds
         self._door_width_tiles = max(1, int(width_tiles))
+        self._invalidate_caches()
 
         def carve_rect(x: int, y: int, w: int, h: int) -> None:
             for yy in range(y, y + h):
-                if 0 <= yy < CFG.MAP_H:
+                if 0 <= yy < self.map_h:
                     for xx in range(x, x + w):
-                        if 0 <= xx < CFG.MAP_W:
+                        if 0 <= xx < self.map_w:
                             self.tiles[yy][xx] = 0
 
         W = self._door_width_tiles
@@ -291,11 +324,18 @@ class Room:
         """
         Dibuja elementos propios de la sala por encima del piso (p.ej. el mercader y tooltip).
         """
-        if self.type == "shop" and self.shopkeeper is not None:
-            self.shopkeeper.draw(surface)
-            if hasattr(player, "rect") and self.shopkeeper.can_interact(player.rect()) and not shop_ui.active:
-                tip = ui_font.render("E - Abrir tienda", True, (255, 255, 255))
-                surface.blit(tip, (self.shopkeeper.rect.x - 12, self.shopkeeper.rect.y - 22))
+        surface.blits(self.overlay_items(ui_font, player, shop_ui))
+
+    def overlay_items(self, ui_font, player, shop_ui) -> list:
+        """Lo que dibuja `draw_overlay`, como (superficie, destino)."""
+        if self.type != "shop" or self.shopkeeper is None:
+            return []
+        keeper = self.shopkeeper
+        items = [(keeper.image, keeper.rect.topleft)]
+        if hasattr(player, "rect") and keeper.can_interact(player.rect()) and not shop_ui.active:
+            tip = atlas_for(ui_font, (255, 255, 255)).render("E - Abrir tienda")
+            items.append((tip, (keeper.rect.x - 12, keeper.rect.y - 22)))
+        return items
 
             
             
@@ -309,6 +349,7 @@ class Room:
             return
         rx, ry, rw, rh = self.bounds
         ts = CFG.TILE_SIZE
+        rng = self.rng
 
         encounter_factories = self._pick_encounter(difficulty)
         if not encounter_factories:
@@ -318,17 +359,18 @@ class Room:
         for factory in encounter_factories:
             # Intentar encontrar una baldosa libre para ubicar al enemigo
             for _ in range(12):
-                tx = random.randint(rx + 1, rx + rw - 2)
-                ty = random.randint(ry + 1, ry + rh - 2)
+                tx = rng.randint(rx + 1, rx + rw - 2)
+                ty = rng.randint(ry + 1, ry + rh - 2)
                 if (tx, ty) in used_tiles:
                     continue
                 used_tiles.add((tx, ty))
                 px = tx * ts + ts // 2 - 6
                 py = ty * ts + ts // 2 - 6
                 enemy = factory(px, py)
+                enemy.rng = self.ai_rng
 
                 # Variar encuentros: algunos enemigos comienzan patrullando
-                if random.random() < 0.35:
+                if rng.random() < 0.35:
                     enemy._pick_wander()
                     enemy.state = enemy_mod.WANDER
 
@@ -337,16 +379,17 @@ class Room:
 
         # Escalado adicional: probabilidad de sumar un perseguidor extra
         extra_chance = min(0.1 * max(0, difficulty - 1), 0.5)
-        if random.random() < extra_chance:
+        if rng.random() < extra_chance:
             for _ in range(12):
-                tx = random.randint(rx + 1, rx + rw - 2)
-                ty = random.randint(ry + 1, ry + rh - 2)
+                tx = rng.randint(rx + 1, rx + rw - 2)
+                ty = rng.randint(ry + 1, ry + rh - 2)
                 if (tx, ty) in used_tiles:
                     continue
                 used_tiles.add((tx, ty))
                 px = tx * ts + ts // 2 - 6
                 py = ty * ts + ts // 2 - 6
                 bonus = FastChaserEnemy(px, py)
+                bonus.rng = self.ai_rng
                 bonus._pick_wander()
                 bonus.state = enemy_mod.WANDER
                 self.enemies.append(bonus)
@@ -363,8 +406,8 @@ class Room:
         tier = max(1, min(10, difficulty))
         for threshold, templates in ENCOUNTER_TABLE:
             if tier <= threshold:
-                return random.choice(templates)
-        return random.choice(ENCOUNTER_TABLE[-1][1]) if ENCOUNTER_TABLE else []
+                return self.rng.choice(templates)
+        return self.rng.choice(ENCOUNTER_TABLE[-1][1]) if ENCOUNTER_TABLE else []
 
 
     # ------------------------------------------------------------------ #
@@ -372,9 +415,19 @@ class Room:
     # ------------------------------------------------------------------ #
     def is_blocked(self, tx: int, ty: int) -> bool:
         """¿El tile (tx,ty) es sólido (pared)?"""
-        if not (0 <= tx < CFG.MAP_W and 0 <= ty < CFG.MAP_H):
+        if not (0 <= tx < self.map_w and 0 <= ty < self.map_h):
             return True
-        return self.tiles[ty][tx] == CFG.WALL
+        solid = self._solid
+        if solid is None:
+            solid = self._build_solid_mask()
+        return solid[ty * self.map_w + tx] == 1
+
+    def _build_solid_mask(self) -> bytearray:
+        wall = CFG.WALL
+        self._solid = bytearray(
+            1 if tile == wall else 0 for row in self.tiles for tile in row
+        )
+        return self._solid
     
     def has_line_of_sight(self, x0_px: float, y0_px: float, x1_px: float, y1_px: float) -> bool:
         """
@@ -389,7 +442,7 @@ class Room:
         x1 = int(x1_px // ts); y1 = int(y1_px // ts)
 
         # Si el destino está fuera del mapa, no hay LoS
-        if not (0 <= x1 < CFG.MAP_W and 0 <= y1 < CFG.MAP_H):
+        if not (0 <= x1 < self.map_w and 0 <= y1 < self.map_h):
             return False
 
         # Vector dirección en píxeles
@@ -423,7 +476,7 @@ class Room:
         tx, ty = x0, y0
 
         # Seguridad para evitar loops infinitos
-        for _ in range(CFG.MAP_W + CFG.MAP_H + 4):
+        for _ in range(self.map_w + self.map_h + 4):
             # Si llegamos al tile destino, LoS limpio
             if tx == x1 and ty == y1:
                 return True
@@ -437,7 +490,7 @@ class Room:
                 t_max_y += t_delta_y
 
             # Límites
-            if not (0 <= tx < CFG.MAP_W and 0 <= ty < CFG.MAP_H):
+            if not (0 <= tx < self.map_w and 0 <= ty < self.map_h):
                 return False
 
             # Si el tile atravesado es sólido, se bloquea LoS
@@ -522,6 +575,47 @@ class Room:
         return None
 
     
+    # ------------------------------------------------------------------ #
+    # Persistencia
+    # ------------------------------------------------------------------ #
+    def get_state(self) -> dict:
+        """Estado dinámico de la sala (lo que no sale del layout)."""
+        return {
+            "cleared": self.cleared,
+            "spawn_done": self._spawn_done,
+            "locked": self.locked,
+            "populated_once": self._populated_once,
+            "enemies": [enemy.get_state() for enemy in self.enemies],
+        }
+
+    def apply_state(self, state: dict) -> None:
+        self.cleared = state["cleared"]
+        self._spawn_done = state["spawn_done"]
+        self.locked = state["locked"]
+        self._populated_once = state["populated_once"]
+        self.enemies = [enemy_from_state(e) for e in state["enemies"]]
+        for enemy in self.enemies:
+            enemy.rng = self.ai_rng
+
+    def is_pristine(self) -> bool:
+        """True si la sala no cambió desde que se materializó (se puede regenerar de la seed)."""
+        return not (self._spawn_done or self.cleared or self.locked
+                    or self._populated_once or self.enemies)
+
+    def memory_usage(self) -> int:
+        """Bytes aproximados de la sala materializada: tiles, caches, enemigos y RNGs."""
+        size = sys.getsizeof(self.tiles) + sum(sys.getsizeof(row) for row in self.tiles)
+        if self._solid is not None:
+            size += sys.getsizeof(self._solid)
+        for chunk in self._chunks.values():
+            size += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+        size += sum(sys.getsizeof(enemy.__dict__) for enemy in self.enemies)
+        if self.rng is not random:
+            size += sys.getsizeof(self.rng)
+        if self.ai_rng is not random:
+            size += sys.getsizeof(self.ai_rng)
+        return size
+
     def refresh_lock_state(self) -> None:
         """Si no hay enemigos, se marca cleared y se desbloquea."""
         if not self.cleared and len(self.enemies) == 0:
@@ -543,43 +637,121 @@ class Room:
         cy = (ry + rh // 2) * ts
         return cx, cy
 
+    def size_px(self) -> Tuple[int, int]:
+        """Tamaño del mapa completo en píxeles."""
+        ts = CFG.TILE_SIZE
+        return self.map_w * ts, self.map_h * ts
+
+    # ------------------------------------------------------------------ #
+    # Caches / preparación anticipada
+    # ------------------------------------------------------------------ #
+    def _invalidate_caches(self) -> None:
+        self._chunks.clear()
+        self._chunks_tileset = None
+        self._solid = None
+
+    def warm_caches(self) -> None:
+        """Arma la máscara de paredes que usan colisiones y línea de visión."""
+        if self._solid is None:
+            self._build_solid_mask()
+
+    def bake(self, tileset) -> None:
+        """Pre-renderiza suelo y paredes (lo que no cambia) de todos los chunks."""
+        for key, _ in self._chunks_in(pygame.Rect((0, 0), self.size_px())):
+            self._chunk(key, tileset)
+
+    def _chunk(self, key: Tuple[int, int], tileset) -> pygame.Surface:
+        """Superficie del chunk `key` (la hornea si hace falta)."""
+        if self._chunks_tileset is not tileset:
+            self._chunks.clear()
+            self._chunks_tileset = tileset
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            ts = CFG.TILE_SIZE
+            area = pygame.Rect(key[0] * CHUNK_W, key[1] * CHUNK_H, CHUNK_W, CHUNK_H)
+            area = area.clip(pygame.Rect(0, 0, self.map_w, self.map_h))
+            chunk = pygame.Surface((area.width * ts, area.height * ts))
+            chunk.fill(CFG.COLOR_BG)
+            self._draw_static(chunk, tileset, area)
+            self._chunks[key] = chunk
+        return chunk
+
+    def _chunks_in(self, view: pygame.Rect):
+        """(clave, rect en px) de cada chunk que toca `view` (px del mundo)."""
+        ts = CFG.TILE_SIZE
+        cw, ch = CHUNK_W * ts, CHUNK_H * ts
+        view = view.clip(pygame.Rect((0, 0), self.size_px()))
+        if not view:
+            return
+        for cy in range(view.top // ch, (view.bottom - 1) // ch + 1):
+            for cx in range(view.left // cw, (view.right - 1) // cw + 1):
+                yield (cx, cy), pygame.Rect(cx * cw, cy * ch, cw, ch)
+
     # ------------------------------------------------------------------ #
     # Dibujo
     # ------------------------------------------------------------------ #
-    def draw(self, surf: pygame.Surface, tileset) -> None:
+    def draw(self, surf: pygame.Surface, tileset, view: pygame.Rect | None = None) -> None:
+        """
+        Dibuja el room en `surf` (en coordenadas del mundo): la parte
+        estática sale de los chunks pre-renderizados que tocan `view` (todo
+        el mapa si es None) y encima van las rejas si está bloqueada.
+        """
+        if view is None:
+            view = pygame.Rect((0, 0), self.size_px())
+        self.draw_background(surf, tileset, view)
+        self.draw_locks(surf)
+
+    def draw_background(self, surf: pygame.Surface, tileset, area: pygame.Rect) -> None:
+        """Restaura el fondo horneado en `area` (px del mundo)."""
+        surf.blits(self.background_items(tileset, area))
+
+    def background_items(self, tileset, area: pygame.Rect) -> list:
+        """(chunk, destino, área) para `Surface.blits` / la cola de dibujo."""
+        items = []
+        for key, rect in self._chunks_in(area):
+            clip = rect.clip(area)
+            items.append((self._chunk(key, tileset), clip.topleft, clip.move(-rect.x, -rect.y)))
+        return items
+
+    def draw_locks(self, surf: pygame.Surface) -> None:
+        surf.blits(self.lock_items())
+
+    def lock_items(self) -> list:
+        """Puertas bloqueadas: “rejas” rojas en las aberturas, como (superficie, destino)."""
+        if not self.locked:
+            return []
+        return [(_lock_bar(r.size), r.topleft) for r in self._door_opening_rects().values()]
+
+    def _draw_static(self, surf: pygame.Surface, tileset, area: pygame.Rect) -> None:
         """
-        Dibuja el room en `surf`. Si tu `Tileset` tiene un método específico,
-        úsalo; si no, renderizo con rectángulos de colores.
+        Suelo y paredes de `area` (en tiles), con su esquina en (0, 0) de
+        `surf`. Si tu `Tileset` tiene un método específico, úsalo; si no,
+        renderizo con rectángulos de colores.
         """
         ts = CFG.TILE_SIZE
+        ox, oy = area.x, area.y
 
         # Rellenar el suelo con un color plano para evitar repetir sprites.
         floor = CFG.COLOR_FLOOR
-        for ty in range(CFG.MAP_H):
+        for ty in range(area.top, area.bottom):
             row = self.tiles[ty]
-            for tx in range(CFG.MAP_W):
+            for tx in range(area.left, area.right):
                 if row[tx] == CFG.FLOOR:
-                    pygame.draw.rect(surf, floor, pygame.Rect(tx * ts, ty * ts, ts, ts))
+                    pygame.draw.rect(surf, floor, pygame.Rect((tx - ox) * ts, (ty - oy) * ts, ts, ts))
 
         # Si tu tileset expone un método de dibujado por mapa, úsalo para las paredes.
         drew_with_tileset = False
         if hasattr(tileset, "draw_map"):
-            drew_with_tileset = tileset.draw_map(surf, self.tiles)
+            drew_with_tileset = tileset.draw_map(surf, self.tiles, area)
 
         if not drew_with_tileset:
             # Fallback: colorear las paredes a mano, evitando el exterior.
             wall = CFG.COLOR_WALL
-            for ty in range(CFG.MAP_H):
+            for ty in range(area.top, area.bottom):
                 row = self.tiles[ty]
-                for tx in range(CFG.MAP_W):
+                for tx in range(area.left, area.right):
                     if row[tx] != CFG.FLOOR and self._wall_adjacent_to_floor(tx, ty):
-                        pygame.draw.rect(surf, wall, pygame.Rect(tx * ts, ty * ts, ts, ts))
-        # Puertas bloqueadas: dibuja “rejas” rojas en las aberturas
-        if self.locked:
-            bars = self._door_opening_rects()
-            for d, r in bars.items():
-                pygame.draw.rect(surf, (180, 40, 40), r)         # relleno rojo
-                pygame.draw.rect(surf, (255, 90, 90), r, 1)      # borde claro
+                        pygame.draw.rect(surf, wall, pygame.Rect((tx - ox) * ts, (ty - oy) * ts, ts, ts))
 
     def _wall_adjacent_to_floor(self, tx: int, ty: int) -> bool:
         if self.tiles[ty][tx] == CFG.FLOOR:
@@ -0,0 +1,350 @@
+"""Guardado/carga de una run en un formato binario compacto y versionado.
+
+Estructura del archivo (little endian):
+
+    cabecera   MAGIC, versión, cantidad de secciones
+    tabla      por sección: etiqueta (4 bytes), offset, largo, CRC32
+    LAYT       seed, grilla, inicio, salas (pos, tamaño, puertas, tipo, profundidad),
+               camino principal
+    RUN_       posición actual y salas exploradas (bitset en orden de sala)
+    PLYR       posición, oro, vidas, vida, velocidad, armas
+    RIDX       índice de salas con estado (residentes o compactadas):
+               (sala, offset, largo, CRC32) dentro de ROOM
+    ROOM       estado dinámico de cada sala (flags + enemigos)
+
+`SaveReader` lee la cabecera y las secciones chicas al abrir (verificando
+su CRC); el estado de cada sala se lee con `seek` recién cuando esa sala se
+materializa, y se verifica con el CRC de su entrada en RIDX. Cualquier
+archivo dañado termina en `SaveFormatError`, nunca en otra excepción.
+Los flujos aleatorios no se guardan: se vuelven a derivar de la seed.
+"""
+from __future__ import annotations
+
+import math
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Tuple
+
+from DungeonLayout import DOOR_BITS, ROOM_TYPES, DungeonLayout, RoomSpec
+from Dungeon import Dungeon
+from Enemy import ENEMY_TYPES
+
+MAGIC = b"VJSV"
+VERSION = 3  # v3: CRC32 por sección y por sala, oro/vida con signo
+
+_ENEMY_CODES = {cls.__name__: code for code, cls in enumerate(ENEMY_TYPES)}
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<4sIII")         # etiqueta, offset, largo, crc32
+_LAYOUT = struct.Struct("<IHHHHI")          # seed, grid_w, grid_h, start_x, start_y, n_rooms
+_ROOM_SPEC = struct.Struct("<HHBBBBH")      # x, y, rw, rh, puertas, tipo, profundidad
+_POS = struct.Struct("<HH")
+_COUNT = struct.Struct("<I")
+_PLAYER = struct.Struct("<ffffihhhh")       # x, y, speed, cooldown_scale, gold, hp, max_hp, lives, max_lives
+_ROOM_INDEX = struct.Struct("<IIII")        # índice de sala, offset, largo, crc32
+_ROOM_STATE = struct.Struct("<BH")          # flags, cantidad de enemigos
+_ENEMY = struct.Struct("<BffhBfffff")       # tipo, x, y, hp, estado, wander(dx, dy, t), los, fire
+
+_FLAG_CLEARED = 1
+_FLAG_SPAWN_DONE = 2
+_FLAG_LOCKED = 4
+_FLAG_POPULATED = 8
+
+_MAX_SECTIONS = 64
+# Lo que puede lanzar decodificar bytes basura (UnicodeDecodeError es un ValueError)
+_DECODE_ERRORS = (struct.error, IndexError, KeyError, ValueError, OverflowError)
+
+
+class SaveFormatError(ValueError):
+    """El archivo no es un guardado válido, está dañado o es de una versión desconocida."""
+
+
+def _corrupt(what: str, exc: BaseException) -> SaveFormatError:
+    if isinstance(exc, SaveFormatError):
+        return exc
+    return SaveFormatError(f"Guardado dañado ({what}): {exc!r}")
+
+
+# ---------------------------------------------------------------------- #
+# Escritura
+# ---------------------------------------------------------------------- #
+def save_run(path: str | Path, dungeon: Dungeon, player) -> None:
+    """Escribe la run actual (dungeon + jugador) en `path`.
+    Un valor que no entra en el formato lanza `struct.error` antes de tocar el disco."""
+    layout = dungeon.layout
+    order = list(layout.rooms)
+    index_of = {pos: idx for idx, pos in enumerate(order)}
+
+    # LAYT
+    layt = bytearray(_LAYOUT.pack(
+        dungeon.seed, layout.grid_w, layout.grid_h, *layout.start, len(order)
+    ))
+    for pos in order:
+        spec = layout.rooms[pos]
+        doors = sum(1 << bit for bit, d in enumerate(DOOR_BITS) if spec.doors.get(d))
+        layt += _ROOM_SPEC.pack(
+            pos[0], pos[1], spec.size[0], spec.size[1], doors,
+            ROOM_TYPES.index(spec.type), layout.depth_map.get(pos, 0),
+        )
+    layt += _COUNT.pack(len(layout.main_path))
+    for pos in layout.main_path:
+        layt += _POS.pack(*pos)
+
+    # RUN_
+    explored = bytearray((len(order) + 7) // 8)
+    for pos in dungeon.explored:
+        idx = index_of.get(pos)
+        if idx is not None:
+            explored[idx >> 3] |= 1 << (idx & 7)
+    run = _POS.pack(dungeon.i, dungeon.j) + bytes(explored)
+
+    # PLYR
+    state = player.get_state()
+    plyr = bytearray(_PLAYER.pack(
+        state["x"], state["y"], state["speed"], state["cooldown_scale"], state["gold"],
+        state["hp"], state["max_hp"], state["lives"], state["max_lives"],
+    ))
+    plyr += bytes([len(state["weapons"])])
+    for weapon_id in state["weapons"]:
+        plyr += _pack_str(weapon_id)
+    plyr += _pack_str(state["weapon_id"] or "")
+
+    # RIDX + ROOM
+    room_states = list(dungeon.room_states())
+    ridx = bytearray(_COUNT.pack(len(room_states)))
+    blobs = bytearray()
+    for pos, room_state in room_states:
+        blob = _pack_room(room_state)
+        ridx += _ROOM_INDEX.pack(index_of[pos], len(blobs), len(blob), zlib.crc32(blob))
+        blobs += blob
+
+    sections = [
+        (b"LAYT", bytes(layt)),
+        (b"RUN_", run),
+        (b"PLYR", bytes(plyr)),
+        (b"RIDX", bytes(ridx)),
+        (b"ROOM", bytes(blobs)),
+    ]
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    for tag, data in sections:
+        table += _SECTION.pack(tag, offset, len(data), zlib.crc32(data))
+        offset += len(data)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(table)
+        for _, data in sections:
+            fh.write(data)
+    tmp.replace(path)
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return bytes([len(raw)]) + raw
+
+
+def _pack_room(state: dict) -> bytes:
+    flags = (
+        (_FLAG_CLEARED if state["cleared"] else 0)
+        | (_FLAG_SPAWN_DONE if state["spawn_done"] else 0)
+        | (_FLAG_LOCKED if state["locked"] else 0)
+        | (_FLAG_POPULATED if state["populated_once"] else 0)
+    )
+    out = bytearray(_ROOM_STATE.pack(flags, len(state["enemies"])))
+    for name, x, y, hp, fsm, wdx, wdy, wtime, los, fire in state["enemies"]:
+        out += _ENEMY.pack(_ENEMY_CODES[name], x, y, hp, fsm, wdx, wdy, wtime, los, fire)
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------- #
+# Lectura
+# ---------------------------------------------------------------------- #
+class SaveReader:
+    """Lector perezoso: layout y jugador al abrir; salas bajo demanda."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            magic, version, count = _HEADER.unpack(_read_exact(fh, _HEADER.size))
+            if magic != MAGIC:
+                raise SaveFormatError(f"{self.path} no es un guardado de la run")
+            if version != VERSION:
+                raise SaveFormatError(f"Versión de guardado {version} no soportada")
+            if count > _MAX_SECTIONS:
+                raise SaveFormatError(f"Guardado dañado ({count} secciones)")
+            self._sections: Dict[bytes, Tuple[int, int, int]] = {}
+            for _ in range(count):
+                tag, offset, length, crc = _SECTION.unpack(_read_exact(fh, _SECTION.size))
+                self._sections[tag] = (offset, length, crc)
+
+            for tag, parse in ((b"LAYT", self._parse_layout), (b"RUN_", self._parse_run),
+                               (b"PLYR", self._parse_player), (b"RIDX", self._parse_room_index)):
+                data = self._read_section(fh, tag)
+                try:
+                    parse(data)
+                except _DECODE_ERRORS as exc:
+                    raise _corrupt(f"sección {tag.decode()}", exc) from exc
+
+    def _read_section(self, fh: BinaryIO, tag: bytes) -> bytes:
+        if tag not in self._sections:
+            raise SaveFormatError(f"Falta la sección {tag!r}")
+        offset, length, crc = self._sections[tag]
+        fh.seek(offset)
+        data = _read_exact(fh, length)
+        if zlib.crc32(data) != crc:
+            raise SaveFormatError(f"Guardado dañado (checksum de la sección {tag.decode()})")
+        return data
+
+    # -------------------- secciones fijas -------------------- #
+    def _parse_layout(self, data: bytes) -> None:
+        self.seed, grid_w, grid_h, sx, sy, n_rooms = _LAYOUT.unpack_from(data, 0)
+        offset = _LAYOUT.size
+        self.order: list[Tuple[int, int]] = []
+        rooms: Dict[Tuple[int, int], RoomSpec] = {}
+        depth_map: Dict[Tuple[int, int], int] = {}
+        for x, y, rw, rh, doors, type_code, depth in _ROOM_SPEC.iter_unpack(
+            data[offset:offset + n_rooms * _ROOM_SPEC.size]
+        ):
+            pos = (x, y)
+            self.order.append(pos)
+            rooms[pos] = RoomSpec(
+                size=(rw, rh),
+                doors={d: bool(doors & (1 << bit)) for bit, d in enumerate(DOOR_BITS)},
+                type=ROOM_TYPES[type_code],
+            )
+            depth_map[pos] = depth
+        offset += n_rooms * _ROOM_SPEC.size
+        (path_len,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        main_path = [
+            pos for pos in _POS.iter_unpack(data[offset:offset + path_len * _POS.size])
+        ]
+        if len(rooms) != n_rooms or len(main_path) != path_len:
+            raise SaveFormatError("Guardado dañado (salas o camino incompletos)")
+        if (sx, sy) not in rooms or any(pos not in rooms for pos in main_path):
+            raise SaveFormatError("Guardado dañado (inicio o camino fuera del layout)")
+        self._layout_parts = (grid_w, grid_h, (sx, sy), rooms, main_path, depth_map)
+
+    def _parse_run(self, data: bytes) -> None:
+        self.position = _POS.unpack_from(data, 0)
+        if self.position not in self._layout_parts[3]:
+            raise SaveFormatError("Guardado dañado (sala actual fuera del layout)")
+        bits = data[_POS.size:]
+        self.explored = {
+            pos for idx, pos in enumerate(self.order) if bits[idx >> 3] & (1 << (idx & 7))
+        }
+
+    def _parse_player(self, data: bytes) -> None:
+        x, y, speed, cooldown_scale, gold, hp, max_hp, lives, max_lives = _PLAYER.unpack_from(data, 0)
+        if not all(math.isfinite(v) for v in (x, y, speed, cooldown_scale)):
+            raise SaveFormatError("Guardado dañado (valores del jugador)")
+        offset = _PLAYER.size
+        count = data[offset]
+        offset += 1
+        weapons = []
+        for _ in range(count):
+            value, offset = _unpack_str(data, offset)
+            weapons.append(value)
+        weapon_id, offset = _unpack_str(data, offset)
+        self.player_state = {
+            "x": x, "y": y, "speed": speed, "cooldown_scale": cooldown_scale,
+            "gold": gold, "hp": hp, "max_hp": max_hp,
+            "lives": lives, "max_lives": max_lives,
+            "weapons": weapons, "weapon_id": weapon_id or None,
+        }
+
+    def _parse_room_index(self, data: bytes) -> None:
+        (count,) = _COUNT.unpack_from(data, 0)
+        self._room_index: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        room_section = self._sections.get(b"ROOM", (0, 0, 0))[1]
+        for idx, offset, length, crc in _ROOM_INDEX.iter_unpack(
+            data[_COUNT.size:_COUNT.size + count * _ROOM_INDEX.size]
+        ):
+            if offset + length > room_section:
+                raise SaveFormatError("Guardado dañado (sala fuera de la sección ROOM)")
+            self._room_index[self.order[idx]] = (offset, length, crc)
+
+    # -------------------- salas bajo demanda -------------------- #
+    def has_room_state(self, pos: Tuple[int, int]) -> bool:
+        return pos in self._room_index
+
+    def room_state(self, pos: Tuple[int, int]) -> dict | None:
+        """Lee del disco sólo el bloque de la sala pedida (SaveFormatError si está dañado)."""
+        entry = self._room_index.get(pos)
+        if entry is None:
+            return None
+        if b"ROOM" not in self._sections:
+            raise SaveFormatError("Falta la sección b'ROOM'")
+        base = self._sections[b"ROOM"][0]
+        offset, length, crc = entry
+        with open(self.path, "rb") as fh:
+            fh.seek(base + offset)
+            data = _read_exact(fh, length)
+        if zlib.crc32(data) != crc:
+            raise SaveFormatError(f"Guardado dañado (checksum de la sala {pos})")
+        try:
+            return self._decode_room(data)
+        except _DECODE_ERRORS as exc:
+            raise _corrupt(f"sala {pos}", exc) from exc
+
+    @staticmethod
+    def _decode_room(data: bytes) -> dict:
+        flags, n_enemies = _ROOM_STATE.unpack_from(data, 0)
+        enemies = []
+        for code, x, y, hp, fsm, wdx, wdy, wtime, los, fire in _ENEMY.iter_unpack(
+            data[_ROOM_STATE.size:_ROOM_STATE.size + n_enemies * _ENEMY.size]
+        ):
+            if not all(math.isfinite(v) for v in (x, y, wdx, wdy, wtime, los, fire)):
+                raise SaveFormatError("valores de enemigo no finitos")
+            enemies.append((ENEMY_TYPES[code].__name__, x, y, hp, fsm, wdx, wdy, wtime, los, fire))
+        if len(enemies) != n_enemies:
+            raise SaveFormatError("enemigos incompletos")
+        return {
+            "cleared": bool(flags & _FLAG_CLEARED),
+            "spawn_done": bool(flags & _FLAG_SPAWN_DONE),
+            "locked": bool(flags & _FLAG_LOCKED),
+            "populated_once": bool(flags & _FLAG_POPULATED),
+            "enemies": enemies,
+        }
+
+    def _load_room(self, pos: Tuple[int, int], room) -> None:
+        # Se llama en pleno juego al entrar a la sala: si su bloque está
+        # dañado (o cambió en disco) la sala queda como recién generada.
+        try:
+            state = self.room_state(pos)
+        except (OSError, SaveFormatError) as exc:
+            print(f"[SaveGame] Se ignora el estado guardado de la sala {pos}: {exc}")
+            return
+        if state is not None:
+            room.apply_state(state)
+
+    # -------------------- reconstrucción -------------------- #
+    def build_dungeon(self) -> Dungeon:
+        """Dungeon con el layout guardado; cada sala recupera su estado al materializarse."""
+        grid_w, grid_h, start, rooms, main_path, depth_map = self._layout_parts
+        try:
+            layout = DungeonLayout.from_parts(grid_w, grid_h, start, rooms, main_path, depth_map)
+            dungeon = Dungeon(seed=self.seed, layout=layout)
+        except _DECODE_ERRORS as exc:
+            raise _corrupt("layout", exc) from exc
+        dungeon.room_loader = self._load_room
+        dungeon.i, dungeon.j = self.position
+        dungeon.explored = set(self.explored)
+        return dungeon
+
+
+def _unpack_str(data: bytes, offset: int) -> tuple[str, int]:
+    length = data[offset]
+    start = offset + 1
+    return data[start:start + length].decode("utf-8"), start + length
+
+
+def _read_exact(fh: BinaryIO, size: int) -> bytes:
+    data = fh.read(size)
+    if len(data) != size:
+        raise SaveFormatError("Guardado truncado")
+    return data
@@ -1,8 +1,11 @@
 # CODIGO/Shop.py
 import pygame
+from Resources import RESOURCES
+from Text import atlas_for
 
 class Shop:
     WIDTH, HEIGHT = 320, 240
+    ROW_TOP, ROW_STEP = 36, 24  # primera fila y separación entre filas
 
     def __init__(self, font=None):
         self.items = [
@@ -20,17 +23,35 @@ class Shop:
         self.active = False
         self.selected = 0
         self.hover_index = None
-        self.font = font or pygame.font.SysFont(None, 18)
+        self.font = font or RESOURCES.font(None, 18)
 
         # ventana
         self.rect = pygame.Rect(0, 0, self.WIDTH, self.HEIGHT)
         self._item_hitboxes: list[pygame.Rect] = []
 
+        # Panel pre-renderizado (coordenadas locales) y estado con que se
+        # pintó cada fila: (seleccionada, hover, alcanza el oro)
+        self._panel: pygame.Surface | None = None
+        self._row_state: list[tuple[bool, bool, bool] | None] = []
+
     def open(self, cx, cy):
         self.active = True
+        # La ventana crece si la lista no entra en el alto base
+        height = max(self.HEIGHT, self.ROW_TOP + self.ROW_STEP * len(self.items))
+        if height != self.rect.height or len(self._row_state) != len(self.items):
+            self.invalidate()
+        self.rect.size = (self.WIDTH, height)
         # centrar sobre el mundo
         self.rect.center = (cx, cy)
         self.hover_index = None
+        # Hitboxes en coordenadas del mundo: sólo cambian al abrir
+        self._item_hitboxes = [
+            self._row_rect(idx).move(self.rect.topleft) for idx in range(len(self.items))
+        ]
+
+    def invalidate(self):
+        """Fuerza a rearmar el panel (p.ej. si cambió la lista de items)."""
+        self._panel = None
 
     def close(self):
         self.active = False
@@ -139,36 +160,52 @@ class Shop:
                 if callable(setter):
                     setter(new_scale)
 
-    def draw(self, surface):
-        if not self.active:
-            return
-        # marco
-        pygame.draw.rect(surface, (20, 20, 24), self.rect)
-        pygame.draw.rect(surface, (240, 220, 120), self.rect, 2)
+    # --- Dibujo ---
+    def _row_rect(self, idx):
+        """Rect de la fila `idx` relativo a la esquina del panel."""
+        return pygame.Rect(12, self.ROW_TOP - 4 + idx * self.ROW_STEP, self.rect.width - 24, 22)
 
+    def _build_panel(self):
+        panel = pygame.Surface(self.rect.size)
+        # marco
+        panel.fill((20, 20, 24))
+        pygame.draw.rect(panel, (240, 220, 120), panel.get_rect(), 2)
         # título
-        title = self.font.render("TIENDA", True, (255, 240, 180))
-        surface.blit(title, (self.rect.x + 12, self.rect.y + 8))
-
-        # lista
-        y = self.rect.y + 36
-        self._item_hitboxes = []
+        atlas_for(self.font, (255, 240, 180)).draw(panel, "TIENDA", (12, 8))
+        self._panel = panel
+        self._row_state = [None] * len(self.items)
+
+    def _draw_row(self, idx, state):
+        is_selected, is_hover, affordable = state
+        item_rect = self._row_rect(idx)
+        if is_selected:
+            fill = (65, 60, 100)
+        elif is_hover:
+            fill = (50, 45, 75)
+        else:
+            fill = (20, 20, 24)
+        self._panel.fill(fill, item_rect)
+
+        it = self.items[idx]
+        line = f"{it['name']}  -  {it['price']} oro"
+        color = (255, 240, 180) if is_selected else (235, 235, 235)
+        if is_hover and not is_selected:
+            color = (255, 255, 255)
+        if not affordable:
+            color = (200, 140, 130) if is_selected else (130, 130, 140)
+        atlas_for(self.font, color).draw(self._panel, line, (item_rect.x + 6, item_rect.y + 4))
+
+    def draw(self, surface, gold=None):
+        """Dibuja el panel cacheado; sólo repinta las filas cuyo estado
+        (selección, hover, si alcanza el oro) cambió. Sin `gold` todo alcanza."""
+        if not self.active:
+            return
+        if self._panel is None:
+            self._build_panel()
         for idx, it in enumerate(self.items):
-            item_rect = pygame.Rect(self.rect.x + 12, y - 4, self.rect.width - 24, 22)
-            self._item_hitboxes.append(item_rect)
-
-            is_selected = idx == self.selected
-            is_hover = idx == self.hover_index
-
-            if is_selected:
-                pygame.draw.rect(surface, (65, 60, 100), item_rect)
-            elif is_hover:
-                pygame.draw.rect(surface, (50, 45, 75), item_rect)
-
-            line = f"{it['name']}  -  {it['price']} oro"
-            color = (255, 240, 180) if is_selected else (235, 235, 235)
-            if is_hover and not is_selected:
-                color = (255, 255, 255)
-            txt = self.font.render(line, True, color)
-            surface.blit(txt, (self.rect.x + 18, y))
-            y += 24
+            state = (idx == self.selected, idx == self.hover_index,
+                     gold is None or gold >= it["price"])
+            if self._row_state[idx] != state:
+                self._draw_row(idx, state)
+                self._row_state[idx] = state
+        surface.blit(self._panel, self.rect)
@@ -0,0 +1,75 @@
+"""Arranque por fases: cargar recursos en un hilo mientras corre la intro.
+
+`StartupLoader` recibe una lista ordenada de fases (nombre, función) y las
+corre una tras otra —en un hilo con `start()` o en el llamador con `run()`—
+midiendo cada una. El hilo principal puede esperar una fase puntual
+(`wait_for`) o todas (`join`); si una fase falla, la excepción se vuelve a
+lanzar en quien espera.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Phase = Tuple[str, Callable[[], None]]
+
+
+class StartupLoader:
+    def __init__(self, phases: Sequence[Phase]) -> None:
+        self.phases: List[Phase] = list(phases)
+        self.times: Dict[str, float] = {}   # ms por fase, en el orden en que terminaron
+        self.background = False
+        self._done = {name: threading.Event() for name, _ in self.phases}
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Corre las fases en un hilo aparte."""
+        self.background = True
+        self._thread = threading.Thread(target=self._run_safe, name="startup-loader", daemon=True)
+        self._thread.start()
+
+    def run(self) -> None:
+        """Corre las fases acá mismo (sin hilo)."""
+        self._run_phases()
+
+    def _run_safe(self) -> None:
+        try:
+            self._run_phases()
+        except BaseException as exc:  # se relanza en wait_for/join
+            self._error = exc
+            for event in self._done.values():
+                event.set()
+
+    def _run_phases(self) -> None:
+        for name, load in self.phases:
+            t0 = time.perf_counter()
+            load()
+            self.times[name] = (time.perf_counter() - t0) * 1000.0
+            self._done[name].set()
+
+    @property
+    def done(self) -> bool:
+        return all(event.is_set() for event in self._done.values())
+
+    def wait_for(self, name: str) -> None:
+        """Bloquea hasta que termine la fase `name`."""
+        self._done[name].wait()
+        self._raise_error()
+
+    def join(self) -> None:
+        """Bloquea hasta que terminen todas las fases."""
+        if self._thread is not None:
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Falló la carga inicial") from self._error
+
+    def report(self) -> List[str]:
+        where = "en segundo plano" if self.background else "en el hilo principal"
+        lines = [f"fase {name}: {ms:.1f} ms" for name, ms in self.times.items()]
+        lines.append(f"carga total {sum(self.times.values()):.1f} ms ({where})")
+        return lines
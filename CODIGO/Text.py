@@ -0,0 +1,137 @@
+"""Texto con atlas de glifos.
+
+Cada (fuente, color) rasteriza sus glifos una sola vez en una hoja. Un
+string se arma con un único `Surface.blits` desde la hoja y queda cacheado
+(LRU) hasta que deja de usarse. `Label` sigue un valor que cambia (HUD) y
+sólo se rearma cuando el valor es distinto.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import pygame
+
+# ASCII imprimible + lo que usa el juego en castellano
+DEFAULT_CHARSET = "".join(chr(c) for c in range(32, 127)) + "áéíóúÁÉÍÓÚñÑüÜ¡¿·–—"
+
+Glyph = Tuple[pygame.Surface, pygame.Rect, int]  # hoja, área, avance
+Layout = List  # [blits relativos a (0, 0), ancho, superficie armada o None]
+
+
+class GlyphAtlas:
+    """Glifos de una fuente en un color, pre-rasterizados en una sola superficie."""
+
+    SHEET_WIDTH = 512
+
+    def __init__(self, font: pygame.font.Font, color, charset: str = DEFAULT_CHARSET,
+                 layout_cache: int = 256) -> None:
+        self.font = font
+        self.color = tuple(color)
+        self.height = font.get_height()  # se corrige con los glifos que bajan (g, j, ...)
+        self.layout_cache = layout_cache
+        self._glyphs: Dict[str, Glyph] = {}
+        self._layouts: "OrderedDict[str, Layout]" = OrderedDict()
+        self.sheet = self._build_sheet(dict.fromkeys(charset))
+
+    def _build_sheet(self, chars) -> pygame.Surface:
+        rendered = [(ch, self.font.render(ch, True, self.color)) for ch in chars]
+        self.height = max([self.height] + [surf.get_height() for _, surf in rendered])
+        # Empaquetado por filas de alto fijo
+        x = y = 0
+        row_h = self.height
+        places = []
+        for ch, surf in rendered:
+            w = surf.get_width()
+            if x + w > self.SHEET_WIDTH and x > 0:
+                x, y = 0, y + row_h
+            places.append((ch, surf, x, y))
+            x += w
+        sheet = pygame.Surface((self.SHEET_WIDTH, y + row_h), pygame.SRCALPHA)
+        for ch, surf, gx, gy in places:
+            # MAX sobre la hoja transparente copia el glifo tal cual (alfa incluido)
+            sheet.blit(surf, (gx, gy), special_flags=pygame.BLEND_RGBA_MAX)
+            self._glyphs[ch] = (sheet, pygame.Rect(gx, gy, surf.get_width(), surf.get_height()),
+                                self._advance(ch, surf))
+        return sheet
+
+    def _advance(self, ch: str, surf: pygame.Surface) -> int:
+        metrics = self.font.metrics(ch)
+        if metrics and metrics[0] is not None:
+            return metrics[0][4]
+        return surf.get_width()
+
+    def _glyph(self, ch: str) -> Glyph:
+        glyph = self._glyphs.get(ch)
+        if glyph is None:
+            # Fuera del charset: superficie suelta, igual se dibuja en el mismo blits
+            surf = self.font.render(ch, True, self.color)
+            glyph = (surf, surf.get_rect(), self._advance(ch, surf))
+            self._glyphs[ch] = glyph
+        return glyph
+
+    def layout(self, text: str) -> Layout:
+        """Blits relativos a (0, 0) y ancho total; cacheado por string (LRU)."""
+        cached = self._layouts.get(text)
+        if cached is not None:
+            self._layouts.move_to_end(text)
+            return cached
+        blits = []
+        pen = width = 0
+        for ch in text:
+            source, area, advance = self._glyph(ch)
+            if ch != " ":
+                blits.append((source, (pen, 0), area))
+                width = max(width, pen + area.width)
+            pen += advance
+        cached = [blits, max(pen, width), None]
+        self._layouts[text] = cached
+        if len(self._layouts) > self.layout_cache:
+            self._layouts.popitem(last=False)
+        return cached
+
+    def size(self, text: str) -> Tuple[int, int]:
+        return self.layout(text)[1], self.height
+
+    def render(self, text: str) -> pygame.Surface:
+        """Equivalente a `font.render(text, True, color)`, armado desde el atlas
+        con un solo `blits` y cacheado junto al layout. No modificar el resultado."""
+        cached = self.layout(text)
+        if cached[2] is None:
+            blits, width = cached[0], cached[1]
+            surf = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+            # MAX: donde dos glifos se pisan queda la unión, no una mezcla oscura
+            surf.blits([(src, dest, area, pygame.BLEND_RGBA_MAX) for src, dest, area in blits], False)
+            cached[2] = surf
+        return cached[2]
+
+    def draw(self, surface: pygame.Surface, text: str, pos) -> pygame.Rect:
+        """Dibuja `text` en `pos`; devuelve el rect ocupado."""
+        return surface.blit(self.render(text), pos)
+
+
+_ATLASES: Dict[tuple, GlyphAtlas] = {}
+
+
+def atlas_for(font: pygame.font.Font, color) -> GlyphAtlas:
+    """Atlas compartido para (fuente, color); se crea la primera vez que se pide."""
+    key = (font, tuple(color))
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = GlyphAtlas(font, color)
+    return atlas
+
+
+class Label:
+    """Texto cuyo render sólo se rehace cuando cambia el valor."""
+
+    def __init__(self, atlas: GlyphAtlas) -> None:
+        self.atlas = atlas
+        self.text: str | None = None
+        self.surface: pygame.Surface | None = None
+
+    def set(self, text: str) -> pygame.Surface:
+        if text != self.text or self.surface is None:
+            self.text = text
+            self.surface = self.atlas.render(text)
+        return self.surface
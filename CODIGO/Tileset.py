@@ -1,6 +1,8 @@
 import pygame
 from typing import Optional, Sequence
+from AssetAtlas import load_atlas
 from Config import CFG
+from Resources import RESOURCES
 
 class Tileset:
     def __init__(self) -> None:
@@ -8,7 +10,13 @@ class Tileset:
         self.rects = {}
         if CFG.TILESET_PATH:
             try:
-                img = pygame.image.load(str(CFG.TILESET_PATH)).convert_alpha()
+                # Subsuperficie del atlas empaquetado si está al día; si no, el archivo
+                atlas = load_atlas()
+                img = None
+                if atlas is not None and CFG.TILESET_PATH.parent == CFG.ASSETS_DIR:
+                    img = atlas.sprite(CFG.TILESET_PATH.name)
+                if img is None:
+                    img = RESOURCES.image(CFG.TILESET_PATH)
                 tile_defs: dict[int, tuple[int, int]] = {
                     CFG.FLOOR: (0, 0),
                     CFG.WALL: (1, 0),
@@ -67,38 +75,55 @@ class Tileset:
         pygame.draw.rect(surf, color, rect)
 
     # -----------------------------------------------------------
-    # Dibujo de mapas completos
+    # Dibujo de mapas completos (o de una región)
     # -----------------------------------------------------------
-    def draw_map(self, surf: pygame.Surface, tiles: Sequence[Sequence[int]]) -> bool:
-        """Dibuja el mapa completo usando los sprites disponibles.
+    @staticmethod
+    def _area(tiles: Sequence[Sequence[int]], area: Optional[pygame.Rect]) -> pygame.Rect:
+        """Región en tiles a dibujar; None = todo el mapa."""
+        if area is None:
+            return pygame.Rect(0, 0, len(tiles[0]) if tiles else 0, len(tiles))
+        return area
+
+    def draw_map(
+        self,
+        surf: pygame.Surface,
+        tiles: Sequence[Sequence[int]],
+        area: Optional[pygame.Rect] = None,
+    ) -> bool:
+        """Dibuja el mapa usando los sprites disponibles.
 
+        Con `area` (en tiles) sólo dibuja esa región, con su esquina en (0, 0)
+        de `surf`; las variantes de pared miran igual a los vecinos de fuera.
         Devuelve True si se usaron sprites; False si cayó en el fallback.
         """
+        area = self._area(tiles, area)
         if not self.surface:
-            self._draw_map_fallback(surf, tiles)
+            self._draw_map_fallback(surf, tiles, area)
             return False
 
         used_sprite = False
         ts = CFG.TILE_SIZE
+        ox, oy = area.x, area.y
 
         if CFG.FLOOR in self.rects:
             used_sprite = True
-            for ty, row in enumerate(tiles):
-                for tx, tile_id in enumerate(row):
-                    if tile_id == CFG.FLOOR:
-                        px = tx * ts
-                        py = ty * ts
+            for ty in range(area.top, area.bottom):
+                row = tiles[ty]
+                for tx in range(area.left, area.right):
+                    if row[tx] == CFG.FLOOR:
+                        px = (tx - ox) * ts
+                        py = (ty - oy) * ts
                         self.draw_tile(surf, CFG.FLOOR, px, py)
         else:
-            self._draw_floor_fallback(surf, tiles)
+            self._draw_floor_fallback(surf, tiles, area)
 
-        for ty, row in enumerate(tiles):
-            for tx, tile_id in enumerate(row):
+        for ty in range(area.top, area.bottom):
+            for tx in range(area.left, area.right):
                 if not self._should_draw_wall(tiles, tx, ty):
                     continue
 
-                px = tx * ts
-                py = ty * ts
+                px = (tx - ox) * ts
+                py = (ty - oy) * ts
                 variant = self._wall_variant(tiles, tx, ty)
                 sprite_id = variant
 
@@ -112,17 +137,20 @@ class Tileset:
 
         return used_sprite
 
-    def _draw_map_fallback(self, surf: pygame.Surface, tiles: Sequence[Sequence[int]]) -> None:
-        self._draw_floor_fallback(surf, tiles)
+    def _draw_map_fallback(self, surf: pygame.Surface, tiles: Sequence[Sequence[int]],
+                           area: Optional[pygame.Rect] = None) -> None:
+        area = self._area(tiles, area)
+        self._draw_floor_fallback(surf, tiles, area)
         ts = CFG.TILE_SIZE
-        for ty, row in enumerate(tiles):
-            for tx, tile_id in enumerate(row):
+        for ty in range(area.top, area.bottom):
+            row = tiles[ty]
+            for tx in range(area.left, area.right):
                 if not self._should_draw_wall(tiles, tx, ty):
                     continue
-                px = tx * ts
-                py = ty * ts
+                px = (tx - area.x) * ts
+                py = (ty - area.y) * ts
                 rect = pygame.Rect(px, py, ts, ts)
-                trim_x, trim_y = self._trim_for_tile(tile_id)
+                trim_x, trim_y = self._trim_for_tile(row[tx])
                 if trim_x:
                     rect.x += 1
                     rect.width = max(0, rect.width - 2)
@@ -131,13 +159,16 @@ class Tileset:
                     rect.height = max(0, rect.height - 2)
                 pygame.draw.rect(surf, CFG.COLOR_WALL, rect)
 
-    def _draw_floor_fallback(self, surf: pygame.Surface, tiles: Sequence[Sequence[int]]) -> None:
+    def _draw_floor_fallback(self, surf: pygame.Surface, tiles: Sequence[Sequence[int]],
+                             area: Optional[pygame.Rect] = None) -> None:
+        area = self._area(tiles, area)
         ts = CFG.TILE_SIZE
-        for ty, row in enumerate(tiles):
-            for tx, tile_id in enumerate(row):
-                if tile_id == CFG.FLOOR:
-                    px = tx * ts
-                    py = ty * ts
+        for ty in range(area.top, area.bottom):
+            row = tiles[ty]
+            for tx in range(area.left, area.right):
+                if row[tx] == CFG.FLOOR:
+                    px = (tx - area.x) * ts
+                    py = (ty - area.y) * ts
                     pygame.draw.rect(surf, CFG.COLOR_FLOOR, (px, py, ts, ts))
 
     def _wall_variant(self, tiles: Sequence[Sequence[int]], tx: int, ty: int) -> int:
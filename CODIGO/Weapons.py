@@ -4,9 +4,14 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Iterable, List, Sequence
 
-from Projectile import Projectile
+from Projectile import Projectile, ProjectileGroup
+
+
+# Resolución de la tabla de dispersión de cada arma.
+SPREAD_STEPS = 257
 
 
 @dataclass(frozen=True)
@@ -19,14 +24,48 @@ class WeaponSpec:
     offsets: Sequence[float] = field(default_factory=lambda: (0.0,))
     forward_spawn: float = 8.0
 
+    @cached_property
+    def barrels(self) -> tuple[tuple[float, float], ...]:
+        """Geometría de salida por cañón: (avance, desplazamiento lateral)."""
+        forward = float(self.forward_spawn)
+        return tuple((forward, float(offset)) for offset in self.offsets)
+
+    @cached_property
+    def spread_table(self) -> tuple[tuple[float, float], ...]:
+        """(cos, sin) de los ángulos de dispersión posibles, equiespaciados en ±spread."""
+        spread = math.radians(self.spread_deg)
+        if spread <= 0.0:
+            return ((1.0, 0.0),)
+        step = 2.0 * spread / (SPREAD_STEPS - 1)
+        return tuple(
+            (math.cos(-spread + i * step), math.sin(-spread + i * step))
+            for i in range(SPREAD_STEPS)
+        )
+
 
 class Weapon:
     """Instancia runtime de un arma concreta."""
 
-    def __init__(self, spec: WeaponSpec, cooldown_scale: float = 1.0) -> None:
+    # Cantidad de ángulos de dispersión que se sortean de una vez.
+    SPREAD_BATCH = 64
+
+    def __init__(
+        self,
+        spec: WeaponSpec,
+        cooldown_scale: float = 1.0,
+        rng: random.Random | None = None,
+    ) -> None:
         self.spec = spec
         self._cooldown = 0.0
         self._cooldown_scale = max(0.05, cooldown_scale)
+        # Flujo aleatorio propio del arma (no toca el RNG global).
+        self._rng = rng or random.Random()
+
+        self._barrels = spec.barrels
+        self._spread_table = spec.spread_table
+        # Lote de (cos, sin) de dispersión ya sorteados, listo para consumir
+        self._spread_batch: List[tuple[float, float]] = []
+        self._spread_left = 0
 
     # ------------------------- Temporización -------------------------
     def tick(self, dt: float) -> None:
@@ -37,8 +76,18 @@ class Weapon:
 
     # ------------------------ Generación balas -----------------------
     def fire(self, origin: tuple[float, float], target: tuple[float, float]) -> List[Projectile]:
+        volley = ProjectileGroup()
+        self.fire_into(origin, target, volley)
+        return list(volley)
+
+    def fire_into(self, origin: tuple[float, float], target: tuple[float, float], store) -> int:
+        """Dispara en `store`: las ráfagas de varios cañones van como columnas
+        (`spawn_volley`); las de un cañón, directo con `store.add`.
+
+        Devuelve la cantidad de proyectiles emitidos.
+        """
         if not self.can_fire():
-            return []
+            return 0
 
         ox, oy = origin
         tx, ty = target
@@ -46,36 +95,52 @@ class Weapon:
         dir_y = ty - oy
         mag = math.hypot(dir_x, dir_y)
         if mag <= 0.0001:
-            return []
+            return 0
         dir_x /= mag
         dir_y /= mag
 
-        angle = math.atan2(dir_y, dir_x)
-        bullets: List[Projectile] = []
-        for offset in self.spec.offsets:
-            # desplazamiento perpendicular para soportar múltiples cañones
-            perp_x, perp_y = -dir_y, dir_x
-            spawn_x = ox + dir_x * self.spec.forward_spawn + perp_x * offset
-            spawn_y = oy + dir_y * self.spec.forward_spawn + perp_y * offset
-
-            spread_rad = math.radians(random.uniform(-self.spec.spread_deg, self.spec.spread_deg))
-            shot_angle = angle + spread_rad
-            vx = math.cos(shot_angle)
-            vy = math.sin(shot_angle)
-
-            bullets.append(
-                Projectile(
-                    spawn_x,
-                    spawn_y,
-                    vx,
-                    vy,
-                    speed=self.spec.bullet_speed,
-                    radius=self.spec.projectile_radius,
-                )
-            )
-
+        count = len(self._barrels)
+        if self._spread_left < count:
+            self._refill_spread(count)
+        k = len(self._spread_batch) - self._spread_left
+        self._spread_left -= count
+        batch = self._spread_batch
+
+        if count == 1:
+            # Un cañón: armar columnas de un elemento cuesta más que la bala
+            fwd, off = self._barrels[0]
+            c, s = batch[k]
+            store.add(Projectile(
+                ox + dir_x * fwd - dir_y * off, oy + dir_y * fwd + dir_x * off,
+                dir_x * c - dir_y * s, dir_y * c + dir_x * s,
+                self.spec.bullet_speed, self.spec.projectile_radius,
+            ))
+            self._cooldown = self.spec.cooldown * self._cooldown_scale
+            return 1
+
+        xs: List[float] = []
+        ys: List[float] = []
+        vxs: List[float] = []
+        vys: List[float] = []
+        for fwd, off in self._barrels:
+            # desplazamiento perpendicular (-dir_y, dir_x) para múltiples cañones
+            xs.append(ox + dir_x * fwd - dir_y * off)
+            ys.append(oy + dir_y * fwd + dir_x * off)
+            # rotación de la dirección base por el ángulo de dispersión
+            c, s = batch[k]
+            vxs.append(dir_x * c - dir_y * s)
+            vys.append(dir_y * c + dir_x * s)
+            k += 1
+
+        store.spawn_volley(xs, ys, vxs, vys, self.spec.bullet_speed, self.spec.projectile_radius)
         self._cooldown = self.spec.cooldown * self._cooldown_scale
-        return bullets
+        return count
+
+    def _refill_spread(self, minimum: int) -> None:
+        """Sortea de una vez un lote de dispersiones desde la tabla precalculada."""
+        size = max(self.SPREAD_BATCH, minimum)
+        self._spread_batch = self._rng.choices(self._spread_table, k=size)
+        self._spread_left = size
 
     # ----------------------- Ajustes dinámicos -----------------------
     def set_cooldown_scale(self, cooldown_scale: float) -> None:
@@ -135,9 +200,15 @@ class WeaponFactory:
     def __contains__(self, weapon_id: str) -> bool:
         return weapon_id in self._registry
 
-    def create(self, weapon_id: str, *, cooldown_scale: float = 1.0) -> Weapon:
+    def create(
+        self,
+        weapon_id: str,
+        *,
+        cooldown_scale: float = 1.0,
+        rng: random.Random | None = None,
+    ) -> Weapon:
         spec = self._registry[weapon_id]
-        return Weapon(spec, cooldown_scale=cooldown_scale)
+        return Weapon(spec, cooldown_scale=cooldown_scale, rng=rng)
 
     def ids(self) -> Iterable[str]:
         return self._registry.keys()
@@ -0,0 +1,95 @@
+"""Costo por frame del mundo en salas cada vez más grandes: todo el mapa vs cámara con chunks.
+
+Arma salas de 1×, 3× y 6× la pantalla con la misma densidad de enemigos y
+proyectiles (crecen con el área). "antes" dibuja el fondo completo y todas
+las entidades en cada frame; "ahora" blitea sólo los chunks que ve la
+cámara y descarta lo que cae fuera de la vista, como `Game._render_world`.
+
+Uso: python benchmarks/bench_camera.py [frames]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from Enemy import BasicEnemy  # noqa: E402
+from Projectile import Projectile, ProjectileGroup  # noqa: E402
+from Render import Camera  # noqa: E402
+from Room import Room  # noqa: E402
+from Tileset import Tileset  # noqa: E402
+
+ENEMIES_PER_SCREEN = 6
+PROJECTILES_PER_SCREEN = 40
+
+
+def make_room(scale: int, rng: random.Random) -> tuple[Room, ProjectileGroup]:
+    margin_w, margin_h = CFG.MAP_W - CFG.ROOM_W_MAX, CFG.MAP_H - CFG.ROOM_H_MAX
+    room = Room(CFG.ROOM_W_MAX * scale + margin_w, CFG.ROOM_H_MAX * scale + margin_h)
+    room.build_centered(CFG.ROOM_W_MAX * scale, CFG.ROOM_H_MAX * scale)
+    room.doors.update({"N": True, "S": True, "E": True, "W": True})
+    room.carve_corridors()
+    rx, ry, rw, rh = room.bounds
+    ts = CFG.TILE_SIZE
+    screens = scale * scale
+
+    def spot() -> tuple[int, int]:
+        return rng.randint(rx + 1, rx + rw - 2) * ts, rng.randint(ry + 1, ry + rh - 2) * ts
+
+    room.enemies = [BasicEnemy(*spot()) for _ in range(ENEMIES_PER_SCREEN * screens)]
+    bullets = ProjectileGroup()
+    for _ in range(PROJECTILES_PER_SCREEN * screens):
+        bullets.add(Projectile(*spot(), 1.0, 0.0))
+    return room, bullets
+
+
+def measure(room: Room, bullets: ProjectileGroup, tileset, culled: bool, frames: int) -> list[float]:
+    world = pygame.Surface(room.size_px())
+    camera = Camera(CFG.SCREEN_W, CFG.SCREEN_H)
+    width, height = room.size_px()
+    room.bake(tileset)
+    samples = []
+    for f in range(frames):
+        # La cámara recorre la sala en diagonal
+        t = f / max(1, frames - 1)
+        camera.follow((width * t, height * t), (width, height))
+        view = camera.rect
+        t0 = time.perf_counter()
+        if culled:
+            room.draw(world, tileset, view)
+            for enemy in room.enemies:
+                if camera.visible(enemy.rect(), CFG.TILE_SIZE):
+                    enemy.draw(world)
+            bullets.draw(world, view)
+        else:
+            room.draw(world, tileset)
+            for enemy in room.enemies:
+                enemy.draw(world)
+            bullets.draw(world)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tileset = Tileset()
+    for scale in (1, 3, 6):
+        room, bullets = make_room(scale, random.Random(scale))
+        for culled in (False, True):
+            samples = measure(room, bullets, tileset, culled, frames)
+            print(f"{room.map_w:>3}×{room.map_h:<3} tiles  {'ahora' if culled else 'antes'}  "
+                  f"mediana {statistics.median(samples):.3f} ms/frame  "
+                  f"({len(room.enemies)} enemigos, {len(bullets)} proyectiles)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
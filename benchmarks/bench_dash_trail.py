@@ -0,0 +1,67 @@
+"""Compara el dibujo de la estela del dash: superficie nueva por segmento vs rampa pre-horneada.
+
+Llena la estela con `dash_trail_max_segments` segmentos de edades repartidas
+y mide `Player._draw_dash_trail` contra la versión anterior (un `Surface`
+SRCALPHA + `draw.rect` redondeado por segmento y por frame).
+
+Uso: python benchmarks/bench_dash_trail.py [frames]
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Player import Player  # noqa: E402
+
+
+def legacy_draw(player: Player, surf: pygame.Surface, segments) -> list[pygame.Rect]:
+    touched = []
+    duration = max(0.001, player.dash_trail_duration)
+    for (cx, cy), timer in segments:
+        fade = max(0.0, min(duration, timer)) / duration
+        alpha = max(35, min(int(220 * fade), 230))
+        trail_surf = pygame.Surface((player.w + 4, player.h + 4), pygame.SRCALPHA)
+        pygame.draw.rect(trail_surf, (255, 255, 255, alpha), trail_surf.get_rect(), border_radius=4)
+        rect = trail_surf.get_rect()
+        rect.center = (int(cx), int(cy))
+        surf.blit(trail_surf, rect)
+        touched.append(rect)
+    return touched
+
+
+def run(name: str, draw, frames: int) -> None:
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        draw()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    print(f"{name:<6} mediana {statistics.median(samples) * 1000:.1f} µs/frame")
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    world = pygame.Surface((960, 640))
+    player = Player(480, 320)
+    count = player.dash_trail_max_segments
+    segments = []
+    for k in range(count):
+        pos = (200.0 + k * player.dash_trail_spacing, 320.0)
+        timer = player.dash_trail_duration * (k + 1) / count
+        player._spawn_dash_trail_segment(pos)
+        player._dash_trail[((player._dash_trail_head + k) % count) * 3 + 2] = timer
+        segments.append((pos, timer))
+    print(f"{count} segmentos")
+    run("antes", lambda: legacy_draw(player, world, segments), frames)
+    run("rampa", lambda: player._draw_dash_trail(world), frames)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
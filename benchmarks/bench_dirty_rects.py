@@ -0,0 +1,79 @@
+"""Compara el costo de `Game._render` con y sin DIRTY_RECTS en una sala tranquila.
+
+El jugador se mueve en círculo en la sala inicial (sin enemigos) disparando
+(con `Weapon.fire_into`: `try_shoot` necesita el botón del mouse apretado).
+Con el driver "dummy" la presentación en sí es gratis: lo que se mide es el
+trabajo de CPU (re-escalado, blits del HUD) que el modo sucio evita.
+
+Además verifica que el modo sucio presente exactamente lo mismo: ambas
+corridas son deterministas y se compara la pantalla frame a frame (fuera
+del tiempo medido).
+
+Uso: python benchmarks/bench_dirty_rects.py [frames]
+"""
+import math
+import os
+import statistics
+import sys
+import time
+import zlib
+from dataclasses import replace
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from Game import Game  # noqa: E402
+
+
+def measure(dirty: bool, frames: int) -> tuple[list[float], list[int], list[int], int]:
+    game = Game(replace(CFG, DIRTY_RECTS=dirty, PREGEN_NEXT_DUNGEON=False))
+    game._frame_counter = 0
+    game.start_new_run(seed=42)
+    room = game.dungeon.current_room
+    cx, cy = room.center_px()
+    weapon = game.player.weapon
+    samples, areas, screens = [], [], []
+    shots = 0
+    for f in range(frames):
+        angle = f / 30.0
+        game.player.x = cx + math.cos(angle) * 60
+        game.player.y = cy + math.sin(angle) * 40
+        weapon.tick(1 / 120)
+        if f % 20 == 0:
+            px, py = game.player.rect().center
+            shots += weapon.fire_into((px, py), (cx + 200, cy), game.projectiles)
+        game.projectiles.update(1 / 120, room)
+        t0 = time.perf_counter()
+        game._render()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        if game.dirty is not None:
+            areas.append(game.dirty.last_area)
+        screens.append(zlib.crc32(pygame.image.tobytes(game.screen, "RGB")))
+    if game.prefetcher is not None:
+        game.prefetcher.close()
+    return samples[10:], areas[10:], screens, shots
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    world_area = CFG.SCREEN_W * CFG.SCREEN_H
+    screens = {}
+    for dirty in (False, True):
+        samples, areas, screens[dirty], shots = measure(dirty, frames)
+        extra = ""
+        if areas:
+            partial = [a for a in areas if a >= 0]
+            extra = (f"  área media {statistics.mean(partial) / world_area * 100:.2f}% del mundo"
+                     f"  frames completos {len(areas) - len(partial)}")
+        print(f"dirty={'on ' if dirty else 'off'}  mediana {statistics.median(samples):.3f} ms"
+              f"  p95 {sorted(samples)[int(len(samples) * 0.95)]:.3f} ms  {shots} disparos{extra}")
+    mismatched = sum(a != b for a, b in zip(screens[False], screens[True]))
+    print(f"frames con píxeles distintos entre modos: {mismatched}/{frames}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Dibujo de enemigos con estado (persiguiendo / recién golpeados): teñir por frame vs variantes horneadas.
+
+N enemigos mezclados, la mitad persiguiendo y un tercio con el destello de
+golpe activo. "rects" es lo de antes (`draw.rect` de un color, sin
+feedback), "teñir" arma la variante en cada frame (`copy` + `fill` con
+blend) y "horneado" sólo elige la superficie de `EnemySprites` y hace un
+`blits`.
+
+Uso: python benchmarks/bench_enemy_sprites.py [frames]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+import EnemySprites  # noqa: E402
+from Enemy import CHASE, ENEMY_TYPES, BasicEnemy, FastChaserEnemy, ShooterEnemy, TankEnemy  # noqa: E402
+
+
+def make_enemies(count: int, rng: random.Random):
+    kinds = (BasicEnemy, FastChaserEnemy, ShooterEnemy, TankEnemy)
+    enemies = []
+    for k in range(count):
+        enemy = kinds[k % len(kinds)](rng.uniform(40, 900), rng.uniform(40, 600))
+        if k % 2 == 0:
+            enemy.state = CHASE
+        if k % 3 == 0:
+            enemy.hit_timer = enemy.HIT_FLASH
+        enemies.append(enemy)
+    return enemies
+
+
+def draw_rects(world, enemies) -> None:
+    for enemy in enemies:
+        pygame.draw.rect(world, enemy.color, enemy.rect())
+
+
+def draw_tinted(world, enemies) -> None:
+    for enemy in enemies:
+        rect = enemy.rect()
+        body = pygame.Surface(rect.size)
+        body.fill(enemy.color)
+        if enemy.hit_timer > 0.0:
+            body.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
+        elif enemy.state == CHASE:
+            body.fill(EnemySprites.CHASE_TINT, special_flags=pygame.BLEND_RGB_ADD)
+        world.blit(body, rect)
+
+
+def draw_baked(world, enemies) -> None:
+    world.blits([enemy.render_item() for enemy in enemies], doreturn=0)
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    t0 = time.perf_counter()
+    surfaces = EnemySprites.bake_all(ENEMY_TYPES)
+    print(f"horneado al cargar: {surfaces} superficies en {(time.perf_counter() - t0) * 1000:.2f} ms")
+    world = pygame.Surface((960, 640))
+    for count in (10, 100):
+        enemies = make_enemies(count, random.Random(count))
+        print(f"{count} enemigos")
+        for name, draw in (("rects", draw_rects), ("teñir", draw_tinted), ("horneado", draw_baked)):
+            samples = []
+            for _ in range(frames):
+                t = time.perf_counter()
+                draw(world, enemies)
+                samples.append((time.perf_counter() - t) * 1e6)
+            print(f"  {name:<9} mediana {statistics.median(samples):.1f} µs/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
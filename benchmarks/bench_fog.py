@@ -0,0 +1,106 @@
+"""Niebla de guerra: visibilidad por frame con `has_line_of_sight` vs shadowcasting cacheado.
+
+El jugador camina por una sala con columnas sueltas. "por frame" es la
+versión ingenua: cada frame una línea de visión (DDA) a cada tile dentro del
+radio y un `fill` con alfa por tile oscuro. "cacheada" es `FogOfWar`:
+shadowcasting + overlay escalado sólo al cambiar de tile, y cada frame un
+puñado de blits. Se mide cálculo + dibujo por frame.
+
+Uso: python benchmarks/bench_fog.py [frames] [radio]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from FogOfWar import FogOfWar  # noqa: E402
+from Room import Room  # noqa: E402
+
+SPEED = 180.0   # px/s, como el jugador
+DT = 1 / 120
+
+
+def make_room(rng) -> Room:
+    room = Room()
+    room.build_centered(CFG.MAP_W - 2, CFG.MAP_H - 2)
+    for _ in range(40):
+        x, y = rng.randrange(2, CFG.MAP_W - 2), rng.randrange(2, CFG.MAP_H - 2)
+        room.tiles[y][x] = CFG.WALL
+    room._solid = None
+    return room
+
+
+def walk(frames, rng):
+    """Recorrido del jugador (centro en px) en diagonal rebotando en el piso."""
+    x, y = CFG.MAP_W * CFG.TILE_SIZE / 2, CFG.MAP_H * CFG.TILE_SIZE / 2
+    vx, vy = SPEED, SPEED * 0.6
+    lo, hi_x, hi_y = 2 * CFG.TILE_SIZE, (CFG.MAP_W - 2) * CFG.TILE_SIZE, (CFG.MAP_H - 2) * CFG.TILE_SIZE
+    points = []
+    for _ in range(frames):
+        x, y = x + vx * DT, y + vy * DT
+        if not lo < x < hi_x:
+            vx = -vx
+        if not lo < y < hi_y:
+            vy = -vy
+        points.append((x, y))
+    return points
+
+
+def run_naive(world, room, points, radius, alpha) -> list[float]:
+    ts = CFG.TILE_SIZE
+    dark = pygame.Surface((ts, ts), pygame.SRCALPHA)
+    dark.fill((0, 0, 0, alpha))
+    samples = []
+    for cx, cy in points:
+        t0 = time.perf_counter()
+        tx, ty = int(cx) // ts, int(cy) // ts
+        items = []
+        for y in range(CFG.MAP_H):
+            for x in range(CFG.MAP_W):
+                near = (x - tx) ** 2 + (y - ty) ** 2 <= radius * radius
+                if not (near and room.has_line_of_sight(cx, cy, x * ts + ts / 2, y * ts + ts / 2)):
+                    items.append((dark, (x * ts, y * ts)))
+        world.blits(items, doreturn=0)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def run_cached(world, room, points, radius, alpha) -> tuple[list[float], int]:
+    fog = FogOfWar(radius, alpha)
+    view = world.get_rect()
+    samples = []
+    for center in points:
+        t0 = time.perf_counter()
+        fog.update(room, center, (0, 0))
+        world.blits(fog.render_items(view), doreturn=0)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples, fog.recomputes
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    radius = int(sys.argv[2]) if len(sys.argv) > 2 else CFG.FOG_RADIUS
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    world = pygame.Surface((CFG.MAP_W * CFG.TILE_SIZE, CFG.MAP_H * CFG.TILE_SIZE))
+    rng = random.Random(1)
+    room = make_room(rng)
+    points = walk(frames, rng)
+    print(f"{frames} frames, radio {radius} tiles, sala {CFG.MAP_W}×{CFG.MAP_H}")
+    naive = run_naive(world, room, points, radius, CFG.FOG_ALPHA)
+    print(f"por frame  mediana {statistics.median(naive):.3f} ms/frame  peor {max(naive):.3f} ms")
+    cached, recomputes = run_cached(world, room, points, radius, CFG.FOG_ALPHA)
+    print(f"cacheada   mediana {statistics.median(cached):.3f} ms/frame  peor {max(cached):.3f} ms  "
+          f"({recomputes} recálculos en {frames} frames)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
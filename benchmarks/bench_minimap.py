@@ -0,0 +1,66 @@
+"""Compara el minimapa rearmado completo por frame con la superficie persistente.
+
+Muestra toda la grilla (view = lado de la grilla) en 10×10 y 100×100. El
+jugador camina al azar y cruza una puerta cada 30 frames; "antes" arma una
+superficie nueva y pinta todas las celdas cada frame, "ahora" sólo repinta
+las celdas que avisa `Dungeon.move`.
+
+Uso: python benchmarks/bench_minimap.py [frames]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from Dungeon import Dungeon  # noqa: E402
+from Minimap import Minimap  # noqa: E402
+
+CELL = 4
+MOVE_EVERY = 30
+
+
+def make_dungeon(size: int) -> Dungeon:
+    params = dict(CFG.large_world_params(), grid_w=size, grid_h=size,
+                  main_len=max(8, size * size // 6))
+    return Dungeon(**params, seed=7)
+
+
+def measure(size: int, incremental: bool, frames: int) -> list[float]:
+    dungeon = make_dungeon(size)
+    rng = random.Random(size)
+    minimap = Minimap(cell=CELL, padding=4, view=size)
+    samples = []
+    for f in range(frames):
+        if f % MOVE_EVERY == MOVE_EVERY - 1:
+            dungeon.move(rng.choice([d for d in "NSEW" if dungeon.can_move(d)]))
+        t0 = time.perf_counter()
+        if incremental:
+            minimap.render(dungeon)
+        else:
+            Minimap(cell=CELL, padding=4, view=size).render(dungeon)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    for size in (10, 100):
+        for incremental in (False, True):
+            samples = measure(size, incremental, frames)
+            print(f"{size:>3}×{size:<3} {'ahora' if incremental else 'antes'}  "
+                  f"mediana {statistics.median(samples):.3f} ms  "
+                  f"peor {max(samples[1:]):.3f} ms  primer frame {samples[0]:.3f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
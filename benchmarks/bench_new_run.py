@@ -0,0 +1,45 @@
+"""Mide el tiempo de `Game.start_new_run(seed=None)` (tecla N) con y sin pre-generación.
+
+Uso: python benchmarks/bench_new_run.py [repeticiones]
+"""
+import os
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+from Config import CFG  # noqa: E402
+from Game import Game  # noqa: E402
+
+
+def measure(pregen: bool, runs: int) -> list[float]:
+    game = Game(replace(CFG, PREGEN_NEXT_DUNGEON=pregen))
+    samples = []
+    for _ in range(runs):
+        time.sleep(0.002)  # deja al hilo de pre-generación preparar la siguiente
+        t0 = time.perf_counter()
+        game.start_new_run(seed=None)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    if game.prefetcher is not None:
+        game.prefetcher.close()
+    return samples
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for pregen in (False, True):
+        samples = measure(pregen, runs)
+        print(
+            f"pregen={'on ' if pregen else 'off'}  "
+            f"mediana {statistics.median(samples):.3f} ms  "
+            f"p95 {sorted(samples)[int(len(samples) * 0.95)]:.3f} ms  "
+            f"máx {max(samples):.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
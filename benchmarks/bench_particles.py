@@ -0,0 +1,107 @@
+"""Partículas bajo una lluvia de impactos: objetos sueltos sin tope vs columnas con tope y presupuesto.
+
+Simula una ráfaga grande (`arcane_salvo` contra un tank): `hits` impactos
+por frame, 6 chispas cada uno. "objetos" es la versión ingenua (una
+instancia por partícula, `draw.circle` por partícula, sin tope);
+"columnas" es `ParticleSystem` sin NumPy y "numpy" con NumPy (si está
+instalado), ambos con el tope y el presupuesto de `Config`. Se mide
+update + dibujo por frame.
+
+Uso: python benchmarks/bench_particles.py [frames] [impactos_por_frame]
+"""
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+import Particles  # noqa: E402
+from Config import CFG  # noqa: E402
+from Particles import ParticleSystem  # noqa: E402
+
+DT = 1 / 120
+SPARKS = 6
+COLOR = (255, 230, 140)
+
+
+class NaiveParticle:
+    def __init__(self, x, y, rng):
+        angle = rng.uniform(0.0, math.tau)
+        mag = rng.uniform(40.0, 140.0)
+        self.x, self.y = x, y
+        self.vx, self.vy = math.cos(angle) * mag, math.sin(angle) * mag
+        self.life = rng.uniform(0.15, 0.35)
+
+
+def run_naive(world, frames, hits, rng) -> tuple[list[float], int]:
+    particles = []
+    samples = []
+    peak = 0
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        for _ in range(hits):
+            x, y = rng.uniform(300, 660), rng.uniform(200, 440)
+            particles.extend(NaiveParticle(x, y, rng) for _ in range(SPARKS))
+        damp = 1.0 - Particles.DRAG * DT
+        alive = []
+        for p in particles:
+            p.life -= DT
+            if p.life > 0.0:
+                p.x += p.vx * DT
+                p.y += p.vy * DT
+                p.vx *= damp
+                p.vy *= damp
+                alive.append(p)
+        particles = alive
+        for p in particles:
+            pygame.draw.circle(world, COLOR, (int(p.x), int(p.y)), 1)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        peak = max(peak, len(particles))
+    return samples, peak
+
+
+def run_system(world, frames, hits, rng, use_numpy) -> tuple[list[float], int]:
+    system = ParticleSystem(CFG.PARTICLE_CAP, CFG.PARTICLE_EMIT_BUDGET, use_numpy=use_numpy)
+    view = world.get_rect()
+    samples = []
+    peak = 0
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        system.update(DT)
+        for _ in range(hits):
+            system.emit(rng.uniform(300, 660), rng.uniform(200, 440), SPARKS, COLOR)
+        world.blits(system.render_items(view), doreturn=0)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+        peak = max(peak, system.count)
+    return samples, peak
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    hits = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    world = pygame.Surface((960, 640))
+    print(f"{hits} impactos/frame × {SPARKS} chispas, tope {CFG.PARTICLE_CAP}, "
+          f"presupuesto {CFG.PARTICLE_EMIT_BUDGET}/frame")
+    runs = [("objetos", lambda rng: run_naive(world, frames, hits, rng)),
+            ("columnas", lambda rng: run_system(world, frames, hits, rng, False))]
+    if Particles.np is not None:
+        runs.append(("numpy", lambda rng: run_system(world, frames, hits, rng, True)))
+    else:
+        print("(NumPy no está instalado: se omite esa variante)")
+    for name, run in runs:
+        samples, peak = run(random.Random(1))
+        print(f"{name:<9} mediana {statistics.median(samples):.3f} ms/frame  "
+              f"peor {max(samples):.3f} ms  pico {peak} partículas")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
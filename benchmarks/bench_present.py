@@ -0,0 +1,63 @@
+"""Compara la presentación anterior (`transform.scale` sin destino + blit) con `ScaledOutput`.
+
+Reporta por frame: tiempo, bytes de píxeles reservados y fallos de página
+menores (cada superficie nueva de ~10 MB se pide al SO y se toca entera).
+
+Uso: python benchmarks/bench_present.py [frames]
+"""
+import os
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from Render import ScaledOutput  # noqa: E402
+
+
+def legacy_present(screen: pygame.Surface, world: pygame.Surface, size: tuple[int, int]) -> int:
+    scaled = pygame.transform.scale(world, size)
+    screen.blit(scaled, (0, 0))
+    return scaled.get_width() * scaled.get_height() * scaled.get_bytesize()
+
+
+def run(name: str, present, frames: int) -> None:
+    samples = []
+    allocated = 0
+    faults0 = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        allocated += present()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults0
+    print(f"{name:<8} mediana {statistics.median(samples):.3f} ms  "
+          f"reservado {allocated / frames / 1e6:.2f} MB/frame  "
+          f"fallos de página {faults / frames:.0f}/frame")
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    pygame.init()
+    scale = CFG.SCREEN_SCALE
+    size = (CFG.SCREEN_W * scale, CFG.SCREEN_H * scale)
+    screen = pygame.display.set_mode(size)
+    world = pygame.Surface((CFG.SCREEN_W, CFG.SCREEN_H))
+    world.fill(CFG.COLOR_FLOOR)
+    output = ScaledOutput(screen, (CFG.SCREEN_W, CFG.SCREEN_H), scale)
+
+    def new_present() -> int:
+        output.present(world)
+        return 0
+
+    run("antes", lambda: legacy_present(screen, world, size), frames)
+    run(f"ahora ({output.mode})", new_present, frames)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Compara el dibujo del mundo objeto por objeto con la cola por capas (`RenderQueue`).
+
+Sala normal con N enemigos y 10·N proyectiles. "antes" hace lo que hacía
+`Game._render_world`: fondo, rejas, y un `draw.rect`/`draw.circle` por
+enemigo y proyectil. "ahora" entrega todo a la cola y hace un `blits` por
+capa. Al final imprime los contadores por capa de la cola.
+
+Uso: python benchmarks/bench_render_queue.py [frames]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Config import CFG  # noqa: E402
+from Enemy import BasicEnemy, FastChaserEnemy, TankEnemy  # noqa: E402
+from Player import Player  # noqa: E402
+from Projectile import Projectile, ProjectileGroup  # noqa: E402
+from Render import (  # noqa: E402
+    LAYER_BACKGROUND, LAYER_DOORS, LAYER_ENEMIES, LAYER_PLAYER, LAYER_PROJECTILES, RenderQueue,
+)
+from Room import Room  # noqa: E402
+from Tileset import Tileset  # noqa: E402
+
+
+def make_scene(enemies: int, rng: random.Random):
+    room = Room()
+    room.build_centered(CFG.ROOM_W_MAX, CFG.ROOM_H_MAX)
+    room.doors.update({"N": True, "S": True, "E": True, "W": True})
+    room.carve_corridors()
+    room.locked = True
+    rx, ry, rw, rh = room.bounds
+    ts = CFG.TILE_SIZE
+
+    def spot():
+        return rng.uniform(rx + 1, rx + rw - 1) * ts, rng.uniform(ry + 1, ry + rh - 1) * ts
+
+    kinds = (BasicEnemy, FastChaserEnemy, TankEnemy)
+    room.enemies = [kinds[k % 3](*spot()) for k in range(enemies)]
+    bullets = ProjectileGroup()
+    for _ in range(enemies * 10):
+        bullets.add(Projectile(*spot(), 1.0, 0.0))
+    return room, bullets
+
+
+def legacy_draw(world, room, tileset, player, bullets) -> None:
+    world.fill(CFG.COLOR_BG)
+    room.draw_background(world, tileset, world.get_rect())
+    for r in room._door_opening_rects().values():
+        pygame.draw.rect(world, (180, 40, 40), r)
+        pygame.draw.rect(world, (255, 90, 90), r, 1)
+    for enemy in room.enemies:
+        pygame.draw.rect(world, enemy.color, enemy.rect())
+    player.draw(world)
+    for p in bullets:
+        pygame.draw.circle(world, p.color, (int(p.x), int(p.y)), p.radius)
+
+
+def queued_draw(world, queue, room, tileset, player, bullets) -> None:
+    world.fill(CFG.COLOR_BG)
+    view = world.get_rect()
+    queue.extend(LAYER_BACKGROUND, room.background_items(tileset, view))
+    queue.extend(LAYER_DOORS, room.lock_items())
+    queue.extend(LAYER_ENEMIES, [enemy.render_item() for enemy in room.enemies])
+    queue.extend(LAYER_PLAYER, player.render_items())
+    queue.extend(LAYER_PROJECTILES, bullets.render_items(view))
+    queue.flush(world, track_from=LAYER_ENEMIES)
+
+
+def run(name: str, draw, frames: int) -> None:
+    samples = []
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        draw()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    print(f"  {name:<6} mediana {statistics.median(samples):.3f} ms/frame")
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    world = pygame.Surface((CFG.SCREEN_W, CFG.SCREEN_H))
+    tileset = Tileset()
+    player = Player(CFG.SCREEN_W // 2, CFG.SCREEN_H // 2)
+    for enemies in (6, 30, 120):
+        room, bullets = make_scene(enemies, random.Random(enemies))
+        room.bake(tileset)
+        queue = RenderQueue()
+        print(f"{enemies} enemigos, {len(bullets)} proyectiles")
+        run("antes", lambda: legacy_draw(world, room, tileset, player, bullets), frames)
+        run("cola", lambda: queued_draw(world, queue, room, tileset, player, bullets), frames)
+        for line in queue.report():
+            print(f"    {line}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Arranque en frío hasta el primer frame: sprites sueltos vs atlas empaquetado.
+
+Arma un directorio de assets temporal con el tileset del repo y un set
+sintético de sprites del jugador (`player_<estado>_<n>.png`), genera su
+atlas y lanza procesos nuevos que hacen lo mismo que `Main.py` (sin la
+cinemática) hasta terminar el primer frame. Se mide el tiempo de pared de
+cada proceso y, dentro de él, el de `Game(...)` + primer frame y el de la
+carga de sprites sola (Tileset + animaciones del jugador).
+
+Uso: python benchmarks/bench_startup.py [corridas] [frames_por_estado]
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "CODIGO"))
+
+STATES = ("idle", "run", "dash", "hit", "death", "shoot")
+
+CHILD = r"""
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {code!r})
+from dataclasses import replace
+from pathlib import Path
+import Config
+assets = Path({assets!r})
+Config.CFG = replace(Config.CFG, ASSETS_DIR=assets, TILESET_PATH=assets / "tileset.png",
+                     USE_ASSET_ATLAS={atlas!r}, PREGEN_NEXT_DUNGEON=False)
+from Game import Game
+game = Game(Config.CFG)
+game._frame_counter = 0
+game._frame(1 / 120, [])
+first_frame = (time.perf_counter() - t0) * 1000.0
+# Sólo la carga de sprites, repetida ya con el proceso caliente
+import AssetAtlas
+from Resources import RESOURCES
+from Tileset import Tileset
+AssetAtlas._loaded.clear()
+RESOURCES.clear()
+t1 = time.perf_counter()
+Tileset()
+game.player._build_animations()
+print(f"{{first_frame:.3f}} {{(time.perf_counter() - t1) * 1000.0:.3f}}")
+"""
+
+
+def make_assets(target: Path, frames_per_state: int) -> None:
+    import pygame
+    shutil.copy(ROOT / "assets" / "tileset.png", target / "tileset.png")
+    player_dir = target / "player"
+    player_dir.mkdir()
+    for s, state in enumerate(STATES):
+        for n in range(frames_per_state):
+            sprite = pygame.Surface((32, 32), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (40 * s % 255, 30 * n % 255, 200, 255), (16, 16), 10 + n % 5)
+            pygame.image.save(sprite, str(player_dir / f"player_{state}_{n}.png"))
+
+
+def run(assets: Path, atlas: bool) -> tuple[float, float, float]:
+    code = CHILD.format(code=str(ROOT / "CODIGO"), assets=str(assets), atlas=atlas)
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    wall = (time.perf_counter() - t0) * 1000.0
+    first_frame, sprites = map(float, out.stdout.strip().splitlines()[-1].split())
+    return wall, first_frame, sprites
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    frames_per_state = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    from AssetAtlas import build_atlas
+    with tempfile.TemporaryDirectory() as tmp:
+        assets = Path(tmp)
+        make_assets(assets, frames_per_state)
+        manifest = build_atlas(assets)
+        print(f"{len(manifest['sprites'])} sprites")
+        for atlas in (False, True):
+            results = [run(assets, atlas) for _ in range(runs)]
+            walls, inner, sprites = zip(*results)
+            print(f"{'atlas  ' if atlas else 'sueltos'}  proceso {statistics.median(walls):.1f} ms  "
+                  f"import+Game+primer frame {statistics.median(inner):.1f} ms  "
+                  f"carga de sprites {statistics.median(sprites):.2f} ms  (medianas)")
+
+
+if __name__ == "__main__":
+    main()
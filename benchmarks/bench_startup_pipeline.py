@@ -0,0 +1,68 @@
+"""Arranque: todo antes de la intro vs carga en un hilo durante la intro.
+
+Lanza procesos nuevos que hacen lo mismo que `Main.py` hasta poder mostrar
+la intro (ventana + fuente de la intro) y luego hasta tener todo cargado
+(sprites + primera dungeon). "secuencial" es `Game(cfg)`, que carga todo
+antes de volver; "en segundo plano" es `Game(cfg, background_load=True)`.
+Los sprites son el set sintético de `bench_startup.py`, sin atlas.
+
+Uso: python benchmarks/bench_startup_pipeline.py [corridas] [frames_por_estado]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "CODIGO"))
+
+from bench_startup import make_assets  # noqa: E402
+
+CHILD = r"""
+import time
+t0 = time.perf_counter()
+import sys
+sys.path.insert(0, {code!r})
+from dataclasses import replace
+from pathlib import Path
+import Config
+assets = Path({assets!r})
+Config.CFG = replace(Config.CFG, ASSETS_DIR=assets, TILESET_PATH=assets / "tileset.png",
+                     USE_ASSET_ATLAS=False, PREGEN_NEXT_DUNGEON=False)
+from Game import Game
+game = Game(Config.CFG, background_load={background!r}, started_at=t0)
+# Con la ventana y la fuente de la intro listas, la intro ya puede dibujar
+intro = (time.perf_counter() - t0) * 1000.0
+game.startup.join()
+ready = (time.perf_counter() - t0) * 1000.0
+print(f"{{game.startup_metrics['ventana']:.3f}} {{intro:.3f}} {{ready:.3f}}")
+"""
+
+
+def run(assets: Path, background: bool) -> tuple[float, float, float]:
+    code = CHILD.format(code=str(ROOT / "CODIGO"), assets=str(assets), background=background)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    window, intro, ready = map(float, out.stdout.strip().splitlines()[-1].split())
+    return window, intro, ready
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    frames_per_state = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    with tempfile.TemporaryDirectory() as tmp:
+        assets = Path(tmp)
+        make_assets(assets, frames_per_state)
+        for background in (False, True):
+            windows, intros, readies = zip(*(run(assets, background) for _ in range(runs)))
+            name = "en segundo plano" if background else "secuencial"
+            print(f"{name:<17} ventana {statistics.median(windows):.1f} ms  "
+                  f"intro visible {statistics.median(intros):.1f} ms  "
+                  f"todo cargado {statistics.median(readies):.1f} ms  (medianas)")
+
+
+if __name__ == "__main__":
+    main()
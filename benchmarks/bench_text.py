@@ -0,0 +1,75 @@
+"""Compara el texto del HUD y de la tienda con `font.render` por frame vs el atlas de glifos.
+
+Cada "frame" dibuja las 5 líneas del HUD (una cambia cada 30 frames, como
+las monedas) y las 10 líneas de la tienda abierta.
+
+Uso: python benchmarks/bench_text.py [frames]
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+import pygame  # noqa: E402
+from Shop import Shop  # noqa: E402
+from Text import Label, atlas_for  # noqa: E402
+
+HUD = [
+    ("Vidas: 3/3", (255, 120, 120)),
+    ("Golpes restantes vida: 3", (255, 180, 120)),
+    ("Monedas: {}", (255, 240, 180)),
+    ("Seed: 31266546", (230, 230, 230)),
+    ("R: rejugar seed  |  N: nueva seed", (200, 200, 200)),
+]
+
+
+def lines(shop: Shop) -> list[tuple[str, tuple[int, int, int]]]:
+    out = [("TIENDA", (255, 240, 180))]
+    out += [(f"{it['name']}  -  {it['price']} oro", (235, 235, 235)) for it in shop.items]
+    return out
+
+
+def run(name: str, frame, frames: int) -> None:
+    samples = []
+    for f in range(frames):
+        t0 = time.perf_counter()
+        frame(f)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    print(f"{name:<6} mediana {statistics.median(samples) * 1000:.1f} µs/frame")
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    font = pygame.font.SysFont(None, 18)
+    target = pygame.Surface((960, 640))
+    shop_lines = lines(Shop(font=font))
+
+    def before(f: int) -> None:
+        for idx, (text, color) in enumerate(HUD):
+            target.blit(font.render(text.format(f // 30), True, color), (5, 20 * idx))
+        for idx, (text, color) in enumerate(shop_lines):
+            target.blit(font.render(text, True, color), (330, 200 + 24 * idx))
+
+    labels = [Label(atlas_for(font, color)) for _, color in HUD]
+    shop_items = [(atlas_for(font, color), text, (330, 200 + 24 * idx))
+                  for idx, (text, color) in enumerate(shop_lines)]
+
+    def after(f: int) -> None:
+        target.blits([(label.set(text.format(f // 30)), (5, 20 * idx))
+                      for idx, (label, (text, _)) in enumerate(zip(labels, HUD))], False)
+        for atlas, text, pos in shop_items:
+            atlas.draw(target, text, pos)
+
+    run("antes", before, frames)
+    run("atlas", after, frames)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Mide el frame de transición entre salas con y sin preparación anticipada del vecino.
+
+Conduce el juego sin ventana: en cada sala camina hacia una puerta abierta
+durante unos frames y la cruza. Usa los tiempos que registra `Game._frame`.
+
+Uso: python benchmarks/bench_transitions.py [transiciones]
+"""
+import os
+import random
+import statistics
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "CODIGO"))
+
+from Config import CFG  # noqa: E402
+from Game import Game  # noqa: E402
+
+APPROACH_FRAMES = 12
+DT = 1 / 120
+
+
+def measure(prefetch: bool, transitions: int, seed: int = 1234) -> list[float]:
+    game = Game(replace(CFG, PREFETCH_NEIGHBORS=prefetch, PREGEN_NEXT_DUNGEON=False))
+    game._frame_counter = 0
+    game.start_new_run(seed=seed)
+    rng = random.Random(seed)
+    while len(game.transition_times) < transitions:
+        room = game.dungeon.current_room
+        room.enemies = []
+        room.cleared, room.locked = True, False
+        doors = [d for d in sorted(room._door_trigger_rects()) if game.dungeon.can_move(d)]
+        target = room._door_trigger_rects()[rng.choice(doors)]
+        sx, sy = room.center_px()
+        before = len(game.transition_times)
+        for step in range(1, APPROACH_FRAMES + 1):
+            t = step / APPROACH_FRAMES
+            game.player.x = sx + (target.centerx - sx) * t - game.player.w / 2
+            game.player.y = sy + (target.centery - sy) * t - game.player.h / 2
+            game.door_cooldown = 0.0
+            game._frame(DT, [])
+            if len(game.transition_times) > before:
+                break
+    if game.prefetcher is not None:
+        game.prefetcher.close()
+    return game.transition_times[:transitions]
+
+
+def main() -> None:
+    transitions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for prefetch in (False, True):
+        samples = measure(prefetch, transitions)
+        print(
+            f"prefetch={'on ' if prefetch else 'off'}  "
+            f"mediana {statistics.median(samples):.3f} ms  "
+            f"p95 {sorted(samples)[int(len(samples) * 0.95)]:.3f} ms  "
+            f"peor {max(samples):.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()